@@ -1,4 +1,4 @@
-import { useState, useEffect } from "react";
+import { useState, useEffect, Suspense } from "react";
 import { GridBackground } from "./components/GridBackground";
 import { HomePage } from "./pages/HomePage";
 import { BlogPage } from "./pages/BlogPage";
@@ -71,7 +71,10 @@ export default function App() {
     <div className="relative min-h-screen w-full" style={{ minHeight: '100vh' }}>
       <GridBackground />
       <div style={{ position: 'relative', zIndex: 1 }}>
-        {renderPage()}
+        {/* Blog and project pages are loaded on demand (see BlogIndex.ts / ProjectIndex.ts) */}
+        <Suspense fallback={<div className="min-h-screen" />}>
+          {renderPage()}
+        </Suspense>
       </div>
     </div>
   );
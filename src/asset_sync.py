@@ -0,0 +1,304 @@
+#!/usr/bin/env python3
+"""
+Asset Sync - Publish blog and project images to public/
+Used by: build_all.py, npm run copy-images (python asset_sync.py, run from src/)
+
+Mirrors the images of assets/blogs/ and assets/projects/ into public/blogs/ and
+public/projects/, where they are served from in production. Only images that a
+post or project references are published: the generators record the asset
+files each document points at (hero image, image/video blocks and links in the
+inline HTML) in their build manifests, and every other image is reported as
+dead and left out.
+
+A target whose size and mtime match its source is skipped without being read;
+one that only differs in mtime is hashed and skipped if the content is the
+same. Changed files are copied in a thread pool (hardlinked with --link, which
+is only safe for git-ignored targets: a hardlink shares its inode with the
+source, so editing either file edits both). The sync deletes only files it
+owns that are no longer published: a file mirroring an asset of the source
+tree, or one it published on an earlier run (listed in SYNC_MANIFEST). Files
+committed straight into public/ without a source are left alone. Directories of public/variants/ that no post or project
+uses any more are deleted too (see image_variants.py). The run ends with a
+report of the bytes copied versus skipped.
+"""
+
+import argparse
+import json
+import os
+import re
+import shutil
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from build_manifest import CACHE_DIR, file_digest
+from image_variants import local_file, prune_variants
+
+
+# (source tree, public target) pairs
+ASSET_TREES = [
+    (Path('assets/blogs'), Path('../public/blogs')),
+    (Path('assets/projects'), Path('../public/projects')),
+]
+ASSET_EXTENSIONS = ['.png', '.jpg', '.jpeg', '.gif', '.svg', '.webp']
+
+SYNC_WORKERS = min(32, (os.cpu_count() or 1) + 4)
+
+# Manifests whose entries record the assets each post/project references
+REFERENCE_MANIFESTS = [CACHE_DIR / 'blog-manifest.json', CACHE_DIR / 'projects-manifest.json']
+
+# The targets the last sync published
+SYNC_MANIFEST = CACHE_DIR / 'asset-sync.json'
+
+# URLs in the inline HTML of a block that can point at an asset
+_URL_ATTRIBUTE = re.compile(r'''(?:src|href|poster)=["']([^"']+)["']''')
+
+
+def add_references(blocks, meta, references):
+    """Add the asset files that blocks and meta point at to the set references"""
+    urls = [meta.get('heroImage')] if meta else []
+    for block in blocks:
+        kind = block.get('type')
+        if kind in ('image', 'gif', 'video'):
+            urls.append(block.get('content'))
+            if kind == 'video':
+                urls.append(block.get('alt'))  # the poster image
+        elif kind != 'code':
+            urls.extend(_URL_ATTRIBUTE.findall(block.get('content') or ''))
+
+    for url in urls:
+        source = local_file(url)
+        if source and any(root == source or root in source.parents for root, _ in ASSET_TREES):
+            references.add(str(source))
+
+
+def iter_references(blocks, references):
+    """Yield blocks, adding the assets they point at to references (for streaming mode)"""
+    for block in blocks:
+        add_references([block], None, references)
+        yield block
+
+
+def recorded_paths(field):
+    """Return the paths that the entries of every reference manifest record under field
+
+    Returns None if a generator has not recorded them yet, in which case
+    nothing can be pruned safely.
+    """
+    paths = set()
+    for manifest_file in REFERENCE_MANIFESTS:
+        try:
+            manifest = json.loads(manifest_file.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return None
+        for entry in manifest['entries'].values():
+            if field not in entry:
+                return None
+            paths.update(Path(path) for path in entry[field])
+    return paths
+
+
+def reachable_assets():
+    """Return the asset files referenced by any built post or project, or None (see recorded_paths)"""
+    return recorded_paths('references')
+
+
+def load_published():
+    """Return the targets the last sync published (empty without a sync manifest)"""
+    try:
+        data = json.loads(SYNC_MANIFEST.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return set()
+    return {Path(path) for path in data.get('published', [])}
+
+
+def save_published(published):
+    """Record the targets this sync published"""
+    SYNC_MANIFEST.parent.mkdir(parents=True, exist_ok=True)
+    SYNC_MANIFEST.write_text(json.dumps({'published': sorted(map(str, published))}, indent=1), encoding='utf-8')
+
+
+def asset_files(source_root):
+    """Return the publishable files under a source tree, sorted"""
+    if not source_root.exists():
+        return []
+    return sorted(
+        path for path in source_root.rglob('*')
+        if path.is_file() and path.suffix.lower() in ASSET_EXTENSIONS
+    )
+
+
+def is_current(source, target):
+    """True if target already holds the content of source
+
+    Equal size and mtime is trusted; equal size with another mtime is hashed,
+    and on a match the target takes the source's mtime so the next run is cheap.
+    """
+    try:
+        source_stat = source.stat()
+        target_stat = target.stat()
+    except OSError:
+        return False
+
+    if source_stat.st_size != target_stat.st_size:
+        return False
+    if source_stat.st_mtime_ns == target_stat.st_mtime_ns or os.path.samestat(source_stat, target_stat):
+        return True
+    if file_digest(source) != file_digest(target):
+        return False
+    os.utime(target, ns=(target_stat.st_atime_ns, source_stat.st_mtime_ns))
+    return True
+
+
+def publish_file(source, target, link=False):
+    """Hardlink (or copy) source to target atomically, returning 'linked' or 'copied'"""
+    target.parent.mkdir(parents=True, exist_ok=True)
+    tmp_file = target.with_name(f'.{target.name}.{os.getpid()}.{threading.get_ident()}.tmp')
+    method = 'copied'
+    try:
+        if link:
+            try:
+                os.link(source, tmp_file)
+                method = 'linked'
+            except OSError:
+                pass
+        if method == 'copied':
+            shutil.copy2(source, tmp_file)
+        os.replace(tmp_file, target)
+    finally:
+        if tmp_file.exists():
+            tmp_file.unlink()
+    return method
+
+
+def remove_orphans(target_root, expected, owned):
+    """Delete the files in owned that are not in expected, returning their paths and total size
+
+    Directories under target_root left empty are removed too.
+    """
+    removed = []
+    size = 0
+    for path in sorted(owned - expected):
+        try:
+            size += path.stat().st_size
+            path.unlink()
+        except FileNotFoundError:
+            continue
+        removed.append(path)
+        for parent in path.parents:
+            if parent == target_root or any(parent.iterdir()):
+                break
+            parent.rmdir()
+    return removed, size
+
+
+def sync_tree(source_root, target_root, files=None, link=False, published=()):
+    """Sync one asset tree, returning its stats
+
+    files limits the sync to these source files (default: every asset file).
+    published holds the targets an earlier sync published; with the mirrors
+    of every asset file they are the files the sync may delete.
+    """
+    sources = asset_files(source_root)
+    if files is None:
+        files = sources
+    pairs = [(source, target_root / source.relative_to(source_root)) for source in files]
+    owned = {target_root / source.relative_to(source_root) for source in sources}
+    owned.update(path for path in published if target_root in path.parents)
+
+    with ThreadPoolExecutor(max_workers=SYNC_WORKERS) as pool:
+        current = list(pool.map(lambda pair: is_current(*pair), pairs))
+        changed = [pair for pair, ok in zip(pairs, current) if not ok]
+        methods = list(pool.map(lambda pair: publish_file(*pair, link), changed))
+
+    for (source, target), method in zip(changed, methods):
+        print(f"✓ {method.capitalize()}: {source.relative_to(source_root)} → {target}")
+
+    removed, removed_bytes = remove_orphans(target_root, {target for _, target in pairs}, owned)
+    for path in removed:
+        print(f"✓ Removed orphan: {path}")
+
+    return {
+        'copied': len(changed),
+        'copied_bytes': sum(source.stat().st_size for source, _ in changed),
+        'linked': methods.count('linked'),
+        'skipped': len(pairs) - len(changed),
+        'skipped_bytes': sum(source.stat().st_size for (source, _), ok in zip(pairs, current) if ok),
+        'removed': len(removed),
+        'removed_bytes': removed_bytes,
+    }
+
+
+def report_sync(stats):
+    """Print the totals of sync_tree stats"""
+    total = {key: sum(s[key] for s in stats) for key in stats[0]} if stats else {}
+    if not total:
+        return
+    print(f"\nAssets: {total['copied']} published ({total['copied_bytes']:,} bytes, "
+          f"{total['linked']} hardlinked), {total['skipped']} unchanged ({total['skipped_bytes']:,} bytes skipped), "
+          f"{total['removed']} orphans removed ({total['removed_bytes']:,} bytes)")
+
+
+def report_dead(dead):
+    """Print the assets that no post or project references, with their total size"""
+    if not dead:
+        return
+    sizes = [path.stat().st_size for path in dead]
+    print("\nDead assets (not referenced by any post or project, not published):")
+    for path, size in zip(dead, sizes):
+        print(f"  {str(path):<80} {size:>12,} bytes")
+    print(f"  {len(dead)} files, {sum(sizes):,} bytes")
+
+
+def sync_assets(link=False, prune=True):
+    """Sync every asset tree to public/, leaving out unreferenced assets if prune"""
+    reachable = reachable_assets() if prune else None
+    if prune and reachable is None:
+        print("⚠ No references recorded yet - publishing every asset (run buildblog.py and build_projects.py first)")
+
+    published = load_published()
+    targets = set()
+    stats = []
+    dead = []
+    for source_root, target_root in ASSET_TREES:
+        if not source_root.exists():
+            print(f"⚠ Source directory not found: {source_root}")
+            continue
+        files = asset_files(source_root)
+        if reachable is not None:
+            dead.extend(path for path in files if path not in reachable)
+            files = [path for path in files if path in reachable]
+        stats.append(sync_tree(source_root, target_root, files, link, published))
+        targets.update(target_root / path.relative_to(source_root) for path in files)
+    save_published(targets)
+
+    # Responsive variants of images that no post or project shows any more
+    used_variants = recorded_paths('variants') if prune else None
+    if used_variants is not None:
+        for path in prune_variants(used_variants):
+            print(f"✓ Removed unused variants: {path}")
+
+    report_sync(stats)
+    report_dead(dead)
+    return stats
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Publish blog and project images to public/')
+    parser.add_argument('--link', action='store_true',
+                        help='hardlink files instead of copying them (only for git-ignored targets)')
+    parser.add_argument('--all', action='store_true',
+                        help='publish every asset, including ones no post or project references')
+    args = parser.parse_args(argv)
+
+    if not Path('assets').exists():
+        print("Error: run asset_sync.py from the src/ directory")
+        return 1
+
+    sync_assets(link=args.link, prune=not args.all)
+    print("\n✅ Assets synced!")
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,467 @@
+#!/usr/bin/env python3
+"""
+Benchmark - Timings of the markdown-to-TSX pipeline on synthetic corpora
+Usage: python benchmark.py [--sizes 10,100,1000] [--links 0.3] [--code 0.2] [--images 0.1]
+                           [--repeat 3] [--output FILE] [--compare BASELINE] [--threshold 0.1]
+
+For each corpus size, writes a synthetic site (blog posts and projects in the
+---META---/---TOC--- markdown dialect, home.md and global.md) to a temporary
+directory laid out like src/, then times:
+- the parse functions: parse_styled_text (blog, projects and home), parse_blog_markdown,
+  parse_project_markdown, parse_markdown and parse_global_markdown
+- the generate_* functions on the parsed models
+- each main() end to end, cold (empty .buildcache) and warm (nothing changed)
+--links, --code and --images set the density of the corpus: the fraction of
+paragraphs with links and styled spans, and the fraction of sections with a
+code block or an image. The corpus is seeded, so runs are comparable.
+
+Results are written as JSON (default: benchmarks/<timestamp>.json). With
+--compare BASELINE, the results are checked against an earlier file and every
+timing that got slower by more than --threshold is flagged; the exit status is
+1 if any did. --compare BASELINE --current FILE compares two saved files
+without running anything.
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import random
+import shutil
+import statistics
+import struct
+import sys
+import tempfile
+import time
+import zlib
+from datetime import datetime, timezone
+from pathlib import Path
+
+import build
+import buildblog
+import build_projects
+from build_manifest import CACHE_DIR
+from listing_shards import display_order, is_active
+
+
+BENCH_DIR = Path('benchmarks')
+BENCH_VERSION = 1
+
+DEFAULT_SIZES = [10, 100, 1000]
+MIN_SIZE = 10
+MAX_SIZE = 10000
+DEFAULT_THRESHOLD = 0.10
+
+# Timeline entries in the synthetic home.md, however large the corpus
+HOME_ITEMS = 50
+
+WORDS = (
+    'model training latency throughput cache kernel tensor gradient pipeline render component '
+    'state memory compiler parser token index shard query vector batch layer attention network '
+    'simulation sensor driving validation cluster worker thread process stream buffer schedule '
+    'frontend backend service request response deploy build bundle module graph node edge '
+    'research design system performance benchmark profile trace metric budget regression'
+).split()
+CATEGORIES = ['MACHINE LEARNING', 'FRONTEND', 'BACKEND', 'AUTONOMOUS SYSTEMS', 'RESEARCH']
+TAGS = ['PyTorch', 'CUDA', 'React', 'TypeScript', 'Python', 'Node.js', 'LLM', 'Simulation', 'Distributed',
+        'Performance', 'Compilers', 'Robotics', 'Vision', 'Testing', 'Databases', 'Networking']
+LANGUAGES = ['python', 'javascript', 'typescript', 'bash', 'cpp']
+
+IMAGE_URL = '/blogs/bench/figure.png'
+PROJECT_IMAGE_URL = '/projects/bench/figure.png'
+
+
+def tiny_png(width=64, height=48):
+    """Return the bytes of a valid grey PNG image"""
+    def chunk(kind, data):
+        return struct.pack('>I', len(data)) + kind + data + struct.pack('>I', zlib.crc32(kind + data))
+    rows = b''.join(b'\x00' + b'\x80' * width for _ in range(height))
+    return (b'\x89PNG\r\n\x1a\n'
+            + chunk(b'IHDR', struct.pack('>IIBBBBB', width, height, 8, 0, 0, 0, 0))
+            + chunk(b'IDAT', zlib.compress(rows))
+            + chunk(b'IEND', b''))
+
+
+def words(rng, count):
+    return ' '.join(rng.choice(WORDS) for _ in range(count))
+
+
+def paragraph(rng, density):
+    """A paragraph of 3-6 sentences, with links and styled spans at the link density"""
+    sentences = []
+    for _ in range(rng.randint(3, 6)):
+        sentence = words(rng, rng.randint(8, 20))
+        if rng.random() < density['links']:
+            kind = rng.randrange(4)
+            if kind == 0:
+                sentence += f' see [the {rng.choice(WORDS)} notes](https://example.com/{rng.choice(WORDS)})'
+            elif kind == 1:
+                sentence += f' with [orange]({words(rng, 2)})'
+            elif kind == 2:
+                sentence += f' on [dev](https://github.com/example/{rng.choice(WORDS)})'
+            else:
+                sentence += f' using <strong>{rng.choice(WORDS)}</strong> and `{rng.choice(WORDS)}()`'
+        sentences.append(sentence.capitalize() + '.')
+    return ' '.join(sentences)
+
+
+def code_block(rng):
+    language = rng.choice(LANGUAGES)
+    lines = [f'def {rng.choice(WORDS)}_{i}({rng.choice(WORDS)}):\n    return {rng.choice(WORDS)} * {i}'
+             for i in range(rng.randint(2, 6))]
+    return f'```{language}\n' + '\n\n'.join(lines) + '\n```'
+
+
+def sections(rng, density, image_url):
+    """Return [(title, id, [markdown parts])] of the sections of a synthetic document"""
+    result = []
+    for number in range(rng.randint(3, 7)):
+        title = words(rng, rng.randint(2, 4)).title()
+        section_id = f'section-{number}'
+        parts = [paragraph(rng, density) for _ in range(rng.randint(2, 4))]
+        if rng.random() < density['code']:
+            parts.insert(1, code_block(rng))
+        if rng.random() < density['images']:
+            parts.append(f'![{words(rng, 3)}]({image_url})')
+        if rng.random() < 0.2:
+            parts.append(f'> {paragraph(rng, density)}\n> - {words(rng, 2).title()}')
+        result.append((title, section_id, parts))
+    return result
+
+
+def synthetic_post(number, rng, density):
+    """Markdown of a synthetic blog post"""
+    body = sections(rng, density, IMAGE_URL)
+    tags = ', '.join(rng.sample(TAGS, 3))
+    lines = [
+        '---META---',
+        f'title: {words(rng, 5).title()} {number}',
+        f'category: {rng.choice(CATEGORIES)}',
+        f'date: Oct {number % 28 + 1}, 2025',
+        f'readTime: {rng.randint(3, 15)} min read',
+        'author: Bench Author',
+        'authorAvatar: /Niraj_Photo.png',
+        f'heroImage: {IMAGE_URL}',
+        f'tags: {tags}',
+        f'slug: bench-post-{number}',
+        f'excerpt: {words(rng, 16)}',
+        f'featuredOnHome: {"true" if number < 2 else "false"}',
+        f'displayOrder: {rng.randint(1, 999)}',
+        '---',
+        '',
+        '---TOC---',
+        *(f'- {title} | {section_id} | 2' for title, section_id, _ in body),
+        '---',
+        '',
+    ]
+    for title, section_id, parts in body:
+        lines += [f'## {title} {{#{section_id}}}', '', *('\n'.join([part, '']) for part in parts)]
+    return '\n'.join(lines)
+
+
+def synthetic_project(number, rng, density):
+    """Markdown of a synthetic project"""
+    body = sections(rng, density, PROJECT_IMAGE_URL)
+    lines = [
+        f'# Bench Project {number}',
+        '',
+        '---META---',
+        f'title: {words(rng, 4).title()} {number}',
+        f'category: {rng.choice(CATEGORIES)}',
+        f'date: Summer {2020 + number % 5}',
+        'company: Bench Lab',
+        f'heroImage: {PROJECT_IMAGE_URL}',
+        f'tags: {json.dumps(rng.sample(TAGS, 4))}',
+        f'technologies: {json.dumps(rng.sample(TAGS, 3))}',
+        f'github: https://github.com/example/bench-{number}',
+        f'slug: bench-project-{number}',
+        f'description: {words(rng, 16)}',
+        f'featuredOnHome: {"true" if number < 2 else "false"}',
+        f'displayOrder: {rng.randint(1, 999)}',
+        '---META---',
+        '',
+        '---TOC---',
+        *(f'- [{title}](#{section_id})' for title, section_id, _ in body),
+        '---TOC---',
+        '',
+    ]
+    for title, _, parts in body:
+        lines += [f'## {title}', '', *('\n'.join([part, '']) for part in parts)]
+    return '\n'.join(lines)
+
+
+def synthetic_home(rng, density):
+    """Markdown of a synthetic home.md with a hero and a timeline"""
+    lines = [
+        '---HERO---',
+        'name: Bench Author',
+        f'role: {words(rng, 4).title()}',
+        f'bio: {paragraph(rng, density)}',
+        'photo: profilePhoto',
+        'companies:',
+        '- Example Lab | https://example.com/logo.png',
+        '',
+        '---',
+        '',
+        '## Recent Events',
+        '//comment: TIMELINE',
+        '//title: Professional Journey',
+        '',
+    ]
+    for number in range(HOME_ITEMS):
+        lines += [f'### {words(rng, 4).title()}', f'period: {2000 + number}',
+                  f' -- {paragraph(rng, density)}', '']
+    return '\n'.join(lines)
+
+
+def synthetic_global():
+    """Markdown of a synthetic global.md with a header and a footer"""
+    return '\n'.join([
+        '---HEADER---',
+        'name: Bench Author',
+        'logo: BA',
+        'navigation:',
+        '- Home | #/ | false',
+        '- Blog | #/blog | false',
+        '',
+        '---FOOTER---',
+        '',
+        '## Contact',
+        '//comment: GET IN TOUCH',
+        '- Contact | bench@example.com | email',
+        '',
+        '## Copyright',
+        '//comment: COPYRIGHT',
+        '- (c) Bench. | | text',
+    ])
+
+
+def write_corpus(root, size, density, seed=0):
+    """Write a synthetic site of size posts and size projects under root/src/, returning that directory"""
+    rng = random.Random(f'{seed}-{size}')
+    src = root / 'src'
+    for directory in ('assets/blogs/bench', 'assets/projects/bench', 'pages', 'components'):
+        (src / directory).mkdir(parents=True, exist_ok=True)
+    (root / 'public').mkdir(exist_ok=True)
+
+    png = tiny_png()
+    (src / 'assets/blogs/bench/figure.png').write_bytes(png)
+    (src / 'assets/projects/bench/figure.png').write_bytes(png)
+    for number in range(size):
+        (src / f'assets/blogs/bench-post-{number:05d}.md').write_text(
+            synthetic_post(number, rng, density), encoding='utf-8')
+        (src / f'assets/projects/bench-project-{number:05d}.md').write_text(
+            synthetic_project(number, rng, density), encoding='utf-8')
+    (src / 'home.md').write_text(synthetic_home(rng, density), encoding='utf-8')
+    (src / 'global.md').write_text(synthetic_global(), encoding='utf-8')
+    return src
+
+
+def measure(fn, repeat, setup=None):
+    """Call fn repeat times (after an untimed setup() each), returning {median, min, runs} in seconds"""
+    timings = []
+    for _ in range(repeat):
+        if setup:
+            setup()
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return {'median': statistics.median(timings), 'min': min(timings), 'runs': repeat}
+
+
+def quiet(fn, *args):
+    """Return a callable running fn(*args) with its output discarded"""
+    def call():
+        with contextlib.redirect_stdout(io.StringIO()):
+            return fn(*args)
+    return call
+
+
+def bench_functions(src, repeat):
+    """Time the parse and generate functions over every document of a corpus"""
+    posts = [f.read_text(encoding='utf-8') for f in buildblog.find_blog_files(src / 'assets/blogs')]
+    projects = [f.read_text(encoding='utf-8') for f in build_projects.find_project_files(src / 'assets/projects')]
+    home = (src / 'home.md').read_text(encoding='utf-8')
+    global_md = (src / 'global.md').read_text(encoding='utf-8')
+    paragraphs = [line for text in posts for line in text.split('\n')
+                  if line and not line.startswith(('#', '>', '`', '!', '-', '[', ' '))]
+
+    blog_models = [buildblog.parse_blog_markdown(text) for text in posts]
+    project_models = [build_projects.parse_project_markdown(text) for text in projects]
+    home_sections = build.parse_markdown(home)
+    global_sections = build.parse_global_markdown(global_md)
+    hero = next(section['data'] for section in home_sections if section['type'] == 'hero')
+    timeline = next(section['items'] for section in home_sections if section['type'] == 'section')
+    blog_index = [{'slug': model['meta']['slug'], 'component': 'BenchPage', 'meta': model['meta']}
+                  for model in blog_models]
+    project_index = [{'slug': model['meta']['slug'], 'component': 'BenchPage', 'meta': model['meta']}
+                     for model in project_models]
+    blog_order = [entry for entry in display_order(blog_index) if is_active(entry)]
+    project_order = [entry for entry in display_order(project_index) if is_active(entry)]
+
+    def each(fn, items):
+        return lambda: [fn(item) for item in items]
+
+    cases = {
+        'buildblog.parse_styled_text': (each(buildblog.parse_styled_text, paragraphs), len(paragraphs)),
+        'build_projects.parse_styled_text': (each(build_projects.parse_styled_text, paragraphs), len(paragraphs)),
+        'build.parse_styled_text': (each(build.parse_styled_text, paragraphs), len(paragraphs)),
+        'parse_blog_markdown': (each(buildblog.parse_blog_markdown, posts), len(posts)),
+        'parse_project_markdown': (each(build_projects.parse_project_markdown, projects), len(projects)),
+        'parse_markdown': (lambda: build.parse_markdown(home), 1),
+        'parse_global_markdown': (lambda: build.parse_global_markdown(global_md), 1),
+        'generate_blog_post_component': (
+            lambda: [buildblog.generate_blog_post_component(model, model['meta']['slug']) for model in blog_models],
+            len(blog_models)),
+        'generate_project_page_component': (
+            lambda: [build_projects.generate_project_page_component(model, model['meta']['slug'])
+                     for model in project_models],
+            len(project_models)),
+        'render_blog_index': (lambda: buildblog.render_blog_index(blog_index), 1),
+        'generate_project_index': (lambda: build_projects.generate_project_index(project_index), 1),
+        'buildblog.generate_blogs_component': (lambda: buildblog.generate_blogs_component(blog_order), 1),
+        'build_projects.generate_projects_component': (
+            lambda: build_projects.generate_projects_component(project_order), 1),
+        'generate_hero_component': (lambda: build.generate_hero_component(hero), 1),
+        'generate_timeline_component': (lambda: build.generate_timeline_component(timeline), 1),
+        'generate_header_component': (
+            lambda: build.generate_header_component(global_sections['header']['data']), 1),
+        'generate_footer_component': (lambda: build.generate_footer_component(global_sections['footer']), 1),
+    }
+
+    results = {}
+    for name, (fn, items) in cases.items():
+        result = measure(quiet(fn), repeat)
+        result['items'] = items
+        result['per_item'] = result['median'] / max(items, 1)
+        results[name] = result
+    return results
+
+
+def bench_mains(src, repeat):
+    """Time each main() end to end in the corpus directory, cold (no build cache) and warm"""
+    mains = {
+        'buildblog.main': buildblog.main,
+        'build_projects.main': build_projects.main,
+        'build.main': build.main,
+    }
+    results = {}
+    cwd = os.getcwd()
+    os.chdir(src)
+    try:
+        for name, main in mains.items():
+            results[f'{name} (cold)'] = measure(quiet(main, ['--force']), repeat,
+                                                lambda: shutil.rmtree(CACHE_DIR, ignore_errors=True))
+            results[f'{name} (warm)'] = measure(quiet(main, []), repeat)
+    finally:
+        os.chdir(cwd)
+    return results
+
+
+def run_benchmarks(sizes, density, repeat, seed=0):
+    """Run the benchmarks for every corpus size, returning the results document"""
+    results = {}
+    for size in sizes:
+        with tempfile.TemporaryDirectory(prefix='portfolio-bench-') as tmp:
+            print(f"Corpus of {size} posts and {size} projects...")
+            started = time.perf_counter()
+            src = write_corpus(Path(tmp), size, density, seed)
+            print(f"  written in {time.perf_counter() - started:.2f}s")
+            for name, result in {**bench_functions(src, repeat), **bench_mains(src.resolve(), repeat)}.items():
+                results[f'{size}/{name}'] = result
+                print(f"  {name:<45} {result['median'] * 1000:>10.2f} ms")
+
+    return {
+        'version': BENCH_VERSION,
+        'created': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'settings': {'sizes': sizes, 'density': density, 'repeat': repeat, 'seed': seed},
+        'results': results,
+    }
+
+
+def compare(baseline, current, threshold=DEFAULT_THRESHOLD):
+    """Print how current compares to baseline, returning the names that regressed past threshold"""
+    regressions = []
+    print(f"\n{'benchmark':<60} {'baseline':>12} {'current':>12} {'change':>8}")
+    for name in sorted(current['results']):
+        if name not in baseline['results']:
+            continue
+        before = baseline['results'][name]['median']
+        after = current['results'][name]['median']
+        change = (after - before) / before if before else 0.0
+        flag = ''
+        if change > threshold:
+            regressions.append(name)
+            flag = '  ✗ REGRESSION'
+        elif change < -threshold:
+            flag = '  ✓ faster'
+        print(f"{name:<60} {before * 1000:>10.2f}ms {after * 1000:>10.2f}ms {change:>+7.1%}{flag}")
+
+    if regressions:
+        print(f"\n✗ {len(regressions)} benchmarks slower than the baseline by more than {threshold:.0%}")
+    else:
+        print(f"\n✅ No regressions beyond {threshold:.0%}")
+    return regressions
+
+
+def parse_sizes(value):
+    sizes = [int(size) for size in value.split(',') if size.strip()]
+    for size in sizes:
+        if not MIN_SIZE <= size <= MAX_SIZE:
+            raise argparse.ArgumentTypeError(f'corpus sizes must be between {MIN_SIZE} and {MAX_SIZE}')
+    return sizes
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark the markdown-to-TSX pipeline on synthetic corpora')
+    parser.add_argument('--sizes', type=parse_sizes, default=DEFAULT_SIZES,
+                        help=f'comma-separated corpus sizes, {MIN_SIZE}-{MAX_SIZE} (default: 10,100,1000)')
+    parser.add_argument('--links', type=float, default=0.3,
+                        help='fraction of paragraphs with links and styled spans (default: 0.3)')
+    parser.add_argument('--code', type=float, default=0.2,
+                        help='fraction of sections with a code block (default: 0.2)')
+    parser.add_argument('--images', type=float, default=0.1,
+                        help='fraction of sections with an image (default: 0.1)')
+    parser.add_argument('--repeat', type=int, default=3,
+                        help='runs per benchmark; the median is reported (default: 3)')
+    parser.add_argument('--seed', type=int, default=0,
+                        help='seed of the synthetic corpus (default: 0)')
+    parser.add_argument('--output', type=Path,
+                        help='results file (default: benchmarks/<timestamp>.json)')
+    parser.add_argument('--compare', type=Path, metavar='BASELINE',
+                        help='flag benchmarks slower than this earlier results file')
+    parser.add_argument('--current', type=Path, metavar='FILE',
+                        help='with --compare, compare this saved results file instead of running')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help='slowdown that counts as a regression (default: 0.1 = 10%%)')
+    args = parser.parse_args(argv)
+
+    if not Path('assets').exists():
+        print("Error: run benchmark.py from the src/ directory")
+        return 1
+
+    if args.current:
+        if not args.compare:
+            parser.error('--current needs --compare')
+        current = json.loads(args.current.read_text(encoding='utf-8'))
+    else:
+        density = {'links': args.links, 'code': args.code, 'images': args.images}
+        current = run_benchmarks(args.sizes, density, max(1, args.repeat), args.seed)
+        output = args.output or BENCH_DIR / f"{current['created'].replace(':', '-')}.json"
+        output.parent.mkdir(parents=True, exist_ok=True)
+        output.write_text(json.dumps(current, indent=2), encoding='utf-8')
+        print(f"\n✓ Results written to {output}")
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text(encoding='utf-8'))
+        if compare(baseline, current, args.threshold):
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,35 +1,46 @@
 #!/usr/bin/env python3
 """
 Portfolio Generator - Converts home.md to React components
-Usage: python build.py
+Usage: python build.py [--force] [--profile] [--trace-memory] [--trace FILE]
 """
 
-import re
 import json
+import argparse
+import sys
 from pathlib import Path
 
+import inline_markup
+from inline_markup import render_inline, HOME_DIALECT
+from build_manifest import (
+    generator_version, content_digest, load_manifest, read_source, lookup, record, save_manifest,
+)
+from parse_cache import parser_version, load_model, evict_models
+import output_writer
+from output_writer import start_outputs, stage_output, commit_outputs, report_outputs
+from build_profile import add_profile_arguments, profiling, profiled
+from build_trace import add_trace_argument, tracing, traced_worker
+
+
+# Version of the parser and templates; any edit to them invalidates the build manifest
+GENERATOR_VERSION = generator_version(__file__, inline_markup.__file__, output_writer.__file__)
+
+# Functions timed as build stages by --profile and --trace-memory (see build_profile.py)
+PROFILE_STAGES = {
+    'load_model': 'parse',
+    'parse_styled_text': 'styled-text',
+    'generate_hero_component': 'render',
+    'generate_timeline_component': 'render',
+    'generate_header_component': 'render',
+    'generate_footer_component': 'render',
+    'stage_output': 'write',
+    'commit_outputs': 'write',
+}
+
 
 def parse_styled_text(text):
     """Parse text for orange styling, links, and comment-style lines"""
-    if not text:
-        return text
-    
-    # Replace [orange](text) with orange styled span (using inline styles for reliability)
-    text = re.sub(r'\[orange\]\((.*?)\)', r"<span style='color: #ff6b3d;'>\1</span>", text)
-    
-    # Replace [comment](text) with comment-style text
-    text = re.sub(r'\[comment\]\((.*?)\)', r"<span class='font-mono text-muted-foreground text-sm'>// \1</span>", text)
-    
-    # Replace [link](url) with regular links (using inline styles)
-    text = re.sub(r'\[link\]\((.*?)\)', r"<a href='\1' target='_blank' rel='noopener noreferrer' style='text-decoration: underline;'>\1</a>", text)
-    
-    # Replace [orange-link](url) with orange styled links (using inline styles)
-    text = re.sub(r'\[orange-link\]\((.*?)\)', r"<a href='\1' target='_blank' rel='noopener noreferrer' style='color: #ff6b3d; text-decoration: underline;'>\1</a>", text)
-    
-    # Replace [text](url) with links (standard markdown link syntax, using inline styles)
-    text = re.sub(r'\[([^\]]+)\]\(([^)]+)\)', r"<a href='\2' target='_blank' rel='noopener noreferrer' style='color: #ff6b3d; text-decoration: underline;'>\1</a>", text)
-    
-    return text
+    return render_inline(text, HOME_DIALECT)
+
 
 def parse_global_markdown(content):
     """Parse global.md content for header and footer sections"""
@@ -853,24 +864,29 @@ export function Footer() {{
 '''
 
 
-def main():
-    # Read markdown file
-    md_file = Path('home.md')
-    if not md_file.exists():
-        print("Error: home.md not found!")
-        print("Creating example home.md...")
-        create_example_md()
-        return
+# Versions of the parsers alone; template edits keep cached parse results valid
+HOME_PARSER_VERSION = parser_version(parse_markdown)
+GLOBAL_PARSER_VERSION = parser_version(parse_global_markdown)
+
+
+def build_home(md_file, outputs):
+    """Parse home.md and stage Hero.tsx and Timeline.tsx
     
-    content = md_file.read_text()
-    sections = parse_markdown(content)
+    Returns the digest, stat, parse cache key and output files for the build manifest.
+    """
+    content, stat = read_source(md_file)
+    sections, model_key, model_cached = load_model('home', content, HOME_PARSER_VERSION, parse_markdown)
+    output_files = []
     
     # Generate components based on sections
     for section in sections:
         if section['type'] == 'hero':
             hero_code = generate_hero_component(section['data'])
-            Path('components/Hero.tsx').write_text(hero_code)
-            print("✓ Generated Hero.tsx")
+            output_files.append('components/Hero.tsx')
+            if stage_output(outputs, 'components/Hero.tsx', hero_code):
+                print("✓ Generated Hero.tsx")
+            else:
+                print("✓ Hero.tsx unchanged")
             
         elif section['type'] == 'section':
             name = section['name'].lower()
@@ -879,8 +895,11 @@ def main():
                 header_comment = section.get('header_comment') or '// EXPERIENCE'
                 header_title = section.get('header_title') or 'Career Journey'
                 timeline_code = generate_timeline_component(section['items'], header_comment, header_title)
-                Path('components/Timeline.tsx').write_text(timeline_code)
-                print("✓ Generated Timeline.tsx")
+                output_files.append('components/Timeline.tsx')
+                if stage_output(outputs, 'components/Timeline.tsx', timeline_code):
+                    print("✓ Generated Timeline.tsx")
+                else:
+                    print("✓ Timeline.tsx unchanged")
                 
             elif 'blog' in name or 'article' in name or 'writing' in name:
                 # Skip generating Blogs.tsx - it's managed by buildblog.py
@@ -894,27 +913,106 @@ def main():
                 print("⚠ Skipping Projects.tsx (managed by build_projects.py)")
                 pass
     
-    # Read and parse global.md for header and footer
-    global_file = Path('global.md')
-    if global_file.exists():
-        global_content = global_file.read_text()
-        global_sections = parse_global_markdown(global_content)
-        
-        # Generate Header component
-        if 'header' in global_sections:
-            header_data = global_sections['header']['data']
-            header_code = generate_header_component(header_data)
-            Path('components/Header.tsx').write_text(header_code)
+    return {
+        'digest': content_digest(content),
+        'stat': stat,
+        'model': model_key,
+        'model_cached': model_cached,
+        'output_files': output_files
+    }
+
+
+def build_global(global_file, outputs):
+    """Parse global.md and stage Header.tsx and Footer.tsx
+    
+    Returns the digest, stat, parse cache key and output files for the build manifest.
+    """
+    global_content, stat = read_source(global_file)
+    global_sections, model_key, model_cached = load_model(
+        'home', global_content, GLOBAL_PARSER_VERSION, parse_global_markdown)
+    output_files = []
+    
+    # Generate Header component
+    if 'header' in global_sections:
+        header_data = global_sections['header']['data']
+        header_code = generate_header_component(header_data)
+        output_files.append('components/Header.tsx')
+        if stage_output(outputs, 'components/Header.tsx', header_code):
             print("✓ Generated Header.tsx")
-        
-        # Generate Footer component
-        if 'footer' in global_sections:
-            footer_data = global_sections['footer']
-            footer_code = generate_footer_component(footer_data)
-            Path('components/Footer.tsx').write_text(footer_code)
+        else:
+            print("✓ Header.tsx unchanged")
+    
+    # Generate Footer component
+    if 'footer' in global_sections:
+        footer_data = global_sections['footer']
+        footer_code = generate_footer_component(footer_data)
+        output_files.append('components/Footer.tsx')
+        if stage_output(outputs, 'components/Footer.tsx', footer_code):
             print("✓ Generated Footer.tsx")
+        else:
+            print("✓ Footer.tsx unchanged")
+    
+    return {
+        'digest': content_digest(global_content),
+        'stat': stat,
+        'model': model_key,
+        'model_cached': model_cached,
+        'output_files': output_files
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Generate home page and layout components')
+    parser.add_argument('--force', action='store_true',
+                        help='ignore the build manifest and regenerate every component')
+    add_profile_arguments(parser)
+    add_trace_argument(parser)
+    args = parser.parse_args(argv)
+
+    with profiling('home', args, globals(), PROFILE_STAGES), tracing(args, globals(), PROFILE_STAGES):
+        return build_components(args)
+
+
+def build_components(args):
+    """Generate the home page and layout components from home.md and global.md
+
+    Returns 1 if home.md is missing (an example is written in its place).
+    """
+
+    # Read markdown file
+    md_file = Path('home.md')
+    if not md_file.exists():
+        print("Error: home.md not found!")
+        print("Creating example home.md...")
+        create_example_md()
+        return 1
+    
+    manifest = load_manifest('home', GENERATOR_VERSION, force=args.force)
+    global_file = Path('global.md')
+    outputs = start_outputs()
+    
+    if lookup(manifest, md_file):
+        print("✓ home.md unchanged - Hero.tsx and Timeline.tsx are up to date")
     else:
+        result = profiled(traced_worker(build_home))(md_file, outputs)
+        record(manifest, md_file, result['digest'], result['stat'], result['output_files'],
+               model=result['model'])
+    
+    # Read and parse global.md for header and footer
+    if not global_file.exists():
         print("⚠ global.md not found - Header and Footer not regenerated")
+    elif lookup(manifest, global_file):
+        print("✓ global.md unchanged - Header.tsx and Footer.tsx are up to date")
+    else:
+        result = profiled(traced_worker(build_global))(global_file, outputs)
+        record(manifest, global_file, result['digest'], result['stat'], result['output_files'],
+               model=result['model'])
+    
+    # Commit all changed outputs together, then record their stats
+    changed = commit_outputs(outputs)
+    report_outputs(changed, outputs)
+    save_manifest(manifest, [f for f in (md_file, global_file) if f.exists()])
+    evict_models('home', manifest)
     
     print("\n✅ Portfolio components generated successfully!")
 
@@ -990,4 +1088,4 @@ Smart task management application with AI-powered prioritization and natural lan
 
 
 if __name__ == '__main__':
-    main()
+    sys.exit(main())
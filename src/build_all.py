@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""
+Build All - Run every generator stage from one process
+Used by: python build_all.py (run from src/, replaces the commands in BUILD_ORDER.md)
+
+The blog, project and home/global generators and the asset sync are
+imported once and run as stages of a small dependency graph. Each stage
+declares the paths it reads and writes; a stage waits only for the stages whose
+outputs it reads, and everything else runs concurrently in a thread pool.
+Stage logs are buffered and printed as one block per stage so they do not
+interleave, followed by the wall time of every stage. The exit status is
+non-zero if any stage failed.
+With --profile or --trace-memory the stages run one at a time and each
+generator appends its profile report to its log (see build_profile.py).
+With --trace FILE all stages are traced into one timeline (see build_trace.py).
+"""
+
+import argparse
+import io
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from pathlib import Path
+
+import build
+import buildblog
+import build_projects
+import build_watch
+import asset_sync
+from parallel_build import add_jobs_argument
+from build_profile import add_profile_arguments, profile_flags
+from build_trace import add_trace_argument, tracing, trace_span
+from build_metrics import add_metrics_arguments
+
+
+def build_stages(args):
+    """Return the build stages with the paths each one reads and writes"""
+    jobs = ['--jobs', str(args.jobs)]
+    force = ['--force'] if args.force else []
+    profile = profile_flags(args)
+    budgets = ['--budgets', str(args.budgets)]
+    mode = [flag for flag, enabled in (('--data-modules', args.data_modules), ('--compact', args.compact),
+                                       ('--highlight', args.highlight),
+                                       ('--responsive-images', args.responsive_images)) if enabled]
+    return [
+        {
+            'name': 'blog',
+            'run': lambda: buildblog.main(force + jobs + mode + profile + budgets),
+            'inputs': ['assets/blogs'],
+            'outputs': ['pages/BlogIndex.ts', 'components/Blogs.tsx', '.buildcache/blog-manifest.json'],
+        },
+        {
+            'name': 'projects',
+            'run': lambda: build_projects.main(force + jobs + mode + profile + budgets),
+            'inputs': ['assets/projects'],
+            'outputs': ['pages/ProjectIndex.ts', 'components/Projects.tsx', '.buildcache/projects-manifest.json'],
+        },
+        {
+            'name': 'home',
+            'run': lambda: build.main(force + profile),
+            'inputs': ['home.md', 'global.md'],
+            'outputs': ['components/Hero.tsx', 'components/Timeline.tsx',
+                        'components/Header.tsx', 'components/Footer.tsx'],
+        },
+        {
+            'name': 'assets',
+            'run': lambda: asset_sync.main([]),
+            'inputs': [str(source) for source, _ in asset_sync.ASSET_TREES]
+                      + [str(manifest) for manifest in asset_sync.REFERENCE_MANIFESTS],
+            'outputs': [str(target) for _, target in asset_sync.ASSET_TREES],
+        },
+    ]
+
+
+def _reads(stage, path):
+    """True if path is one of the stage's inputs or lies inside one"""
+    path = Path(path)
+    return any(path == Path(source) or Path(source) in path.parents for source in stage['inputs'])
+
+
+def stage_dependencies(stages):
+    """Map each stage name to the set of stages whose outputs it reads"""
+    return {
+        stage['name']: {
+            other['name'] for other in stages
+            if other is not stage and any(_reads(stage, output) for output in other['outputs'])
+        }
+        for stage in stages
+    }
+
+
+class _StageOutput(io.TextIOBase):
+    """sys.stdout replacement that buffers print() output per stage thread"""
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.buffers = {}
+
+    def write(self, text):
+        buffer = self.buffers.get(threading.get_ident())
+        if buffer is None:
+            return self.stream.write(text)
+        return buffer.write(text)
+
+    def flush(self):
+        self.stream.flush()
+
+
+def _run_stage(stage, output):
+    """Run one stage, returning (ok, seconds, log)
+
+    A stage fails when its main() raises, exits with a non-zero code or
+    returns anything but None or 0.
+    """
+    buffer = io.StringIO()
+    output.buffers[threading.get_ident()] = buffer
+    started = time.perf_counter()
+    try:
+        with trace_span(stage['name'], 'stage'):
+            ok = not stage['run']()
+    except SystemExit as e:
+        ok = not e.code
+    except Exception as e:
+        print(f"✗ {stage['name']} failed: {e}")
+        ok = False
+    finally:
+        seconds = time.perf_counter() - started
+        del output.buffers[threading.get_ident()]
+
+    return ok, seconds, buffer.getvalue()
+
+
+def run_stages(stages, workers=None):
+    """Run stages as soon as their dependencies finished, returning {name: (status, seconds)}"""
+    by_name = {stage['name']: stage for stage in stages}
+    pending = stage_dependencies(stages)
+    results = {}
+
+    output = _StageOutput(sys.stdout)
+    sys.stdout = output
+    try:
+        with ThreadPoolExecutor(max_workers=workers or len(stages)) as pool:
+            running = {}
+            while pending or running:
+                for name in [name for name, deps in pending.items() if not deps]:
+                    del pending[name]
+                    running[pool.submit(_run_stage, by_name[name], output)] = name
+
+                if not running:
+                    # Whatever is left waits on a failed stage
+                    for name in pending:
+                        results[name] = ('skipped', 0.0)
+                    break
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    ok, seconds, log = future.result()
+                    results[name] = ('ok' if ok else 'failed', seconds)
+
+                    output.stream.write(f"\n── {name} ──\n{log}")
+                    output.stream.flush()
+
+                    if ok:
+                        for deps in pending.values():
+                            deps.discard(name)
+    finally:
+        sys.stdout = output.stream
+
+    return results
+
+
+def report_stages(results, stages, total):
+    """Print the wall time and status of every stage"""
+    print("\nStage times:")
+    for stage in stages:
+        status, seconds = results[stage['name']]
+        mark = {'ok': '✓', 'failed': '✗', 'skipped': '-'}[status]
+        print(f"  {mark} {stage['name']:<10} {seconds * 1000:8.0f} ms  {status}")
+    print(f"  Total {total * 1000:.0f} ms")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Run all portfolio build stages in one process')
+    parser.add_argument('--force', action='store_true',
+                        help='ignore the build manifests and rebuild everything')
+    add_jobs_argument(parser)
+    parser.add_argument('--data-modules', action='store_true',
+                        help='emit per-document data modules rendered by shared page components')
+    parser.add_argument('--compact', action='store_true',
+                        help='emit minified page data with repeated strings hoisted')
+    parser.add_argument('--highlight', action='store_true',
+                        help='syntax-highlight code blocks at build time (needs Pygments)')
+    parser.add_argument('--responsive-images', action='store_true',
+                        help='write resized WebP variants of images and add srcset (needs Pillow)')
+    parser.add_argument('--watch', action='store_true',
+                        help='keep running and regenerate affected outputs on every change')
+    add_profile_arguments(parser)
+    add_trace_argument(parser)
+    add_metrics_arguments(parser)
+    args = parser.parse_args(argv)
+
+    stages = build_stages(args)
+    started = time.perf_counter()
+    # Profiles are per process, so profiled stages run one at a time
+    with tracing(args, globals(), {}):
+        results = run_stages(stages, 1 if profile_flags(args) else None)
+    report_stages(results, stages, time.perf_counter() - started)
+
+    failed = [name for name, (status, _) in results.items() if status != 'ok']
+    if failed:
+        print(f"\n✗ Build failed: {', '.join(failed)}")
+        return 1
+
+    print("\n✅ All stages complete!")
+
+    if args.watch:
+        print()
+        build_watch.watch(data_modules=args.data_modules, compact=args.compact, highlight=args.highlight,
+                          images=args.responsive_images)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
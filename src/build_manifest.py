@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+Build Manifest - Persisted content hashes for incremental builds
+Used by: buildblog.py, build_projects.py, build.py
+
+Each generator keeps a manifest in .buildcache/ recording, per input file, its
+size, mtime, content hash and the outputs it produced, plus whatever the
+generator needs to rebuild its index files without re-parsing the input.
+The whole manifest is discarded when the generator version changes, so editing
+a template or the parser always triggers a full rebuild.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+
+from build_trace import trace_span
+
+CACHE_DIR = Path('.buildcache')
+
+# Bump when the manifest layout changes
+MANIFEST_FORMAT = 2
+
+
+def content_digest(data):
+    """Return the sha256 hex digest of str or bytes content"""
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+    return hashlib.sha256(data).hexdigest()
+
+
+def file_digest(path, chunk_size=1024 * 1024):
+    """Return the sha256 hex digest of a file, read in chunks"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def generator_version(*source_files):
+    """Hash the generator's own source files into a version string"""
+    digest = hashlib.sha256(f'manifest-{MANIFEST_FORMAT}'.encode('utf-8'))
+    for source_file in source_files:
+        digest.update(Path(source_file).read_bytes())
+    return digest.hexdigest()[:16]
+
+
+def load_manifest(name, version, force=False):
+    """Load the manifest for a generator, starting fresh if it is stale or forced"""
+    manifest_file = CACHE_DIR / f'{name}-manifest.json'
+    manifest = None
+
+    if not force and manifest_file.exists():
+        try:
+            manifest = json.loads(manifest_file.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            manifest = None
+
+    if not manifest or manifest.get('version') != version:
+        manifest = {'version': version, 'entries': {}, 'index': None}
+
+    manifest['name'] = name
+    return manifest
+
+
+def read_source(path):
+    """Read a source file, returning (content, stat) with the stat taken first"""
+    with trace_span('read_source', 'read', file=str(path)) as span:
+        stat = path.stat()
+        span['bytes'] = stat.st_size
+        return path.read_text(encoding='utf-8'), stat
+
+
+def lookup(manifest, path):
+    """Return the recorded entry for path if it and its outputs are unchanged
+
+    A matching size and mtime is trusted without reading the file. A touched
+    file is re-hashed and kept if its content did not actually change.
+    """
+    entry = manifest['entries'].get(str(path))
+    if not entry:
+        return None
+
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+
+    if (stat.st_size, stat.st_mtime_ns) != (entry['size'], entry['mtime_ns']):
+        if file_digest(path) != entry['digest']:
+            return None
+        entry['size'] = stat.st_size
+        entry['mtime_ns'] = stat.st_mtime_ns
+
+    # Outputs rewritten or removed behind the manifest's back (e.g. by an
+    # interrupted run) no longer match their recorded stat
+    for output, recorded in entry['outputs'].items():
+        if _stat_key(Path(output)) != recorded:
+            return None
+
+    return entry
+
+
+def _stat_key(path):
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+def record(manifest, path, digest, stat, outputs, **data):
+    """Record a freshly built input along with its outputs and index data
+
+    digest is the content_digest of the source as read together with stat.
+
+    Output stats are captured by save_manifest, after the outputs are committed.
+    """
+    entry = {
+        'size': stat.st_size,
+        'mtime_ns': stat.st_mtime_ns,
+        'digest': digest,
+        'outputs': {str(output): None for output in outputs},
+    }
+    entry.update(data)
+    manifest['entries'][str(path)] = entry
+    return entry
+
+
+def index_is_current(manifest, sources):
+    """True when the index files were last built from exactly these sources and are untouched"""
+    index = manifest.get('index')
+    if not index or index['sources'] != [str(source) for source in sources]:
+        return False
+    return all(_stat_key(Path(output)) == recorded for output, recorded in index['outputs'].items())
+
+
+def removed_outputs(manifest, sources):
+    """Return the recorded outputs of sources that are no longer built
+
+    Outputs still claimed by a live source are left out.
+    """
+    live = {str(source) for source in sources}
+    claimed = {output for key, entry in manifest['entries'].items() if key in live for output in entry['outputs']}
+    return sorted({Path(output) for key, entry in manifest['entries'].items() if key not in live
+                   for output in entry['outputs'] if output not in claimed})
+
+
+def save_manifest(manifest, sources, index_outputs=()):
+    """Drop entries for deleted sources and write the manifest atomically
+
+    index_outputs are the files generated from all sources together
+    (e.g. BlogIndex.ts); their stat is recorded for index_is_current.
+    Returns the list of sources that were dropped.
+    """
+    live = {str(source) for source in sources}
+    removed = [key for key in manifest['entries'] if key not in live]
+    for key in removed:
+        del manifest['entries'][key]
+
+    for entry in manifest['entries'].values():
+        for output, recorded in entry['outputs'].items():
+            if recorded is None:
+                entry['outputs'][output] = _stat_key(Path(output))
+
+    manifest['index'] = {
+        'sources': [str(source) for source in sources],
+        'outputs': {str(output): _stat_key(Path(output)) for output in index_outputs},
+    }
+
+    CACHE_DIR.mkdir(exist_ok=True)
+    manifest_file = CACHE_DIR / f"{manifest['name']}-manifest.json"
+    tmp_file = manifest_file.with_suffix('.json.tmp')
+    tmp_file.write_text(json.dumps(manifest, indent=2), encoding='utf-8')
+    os.replace(tmp_file, manifest_file)
+
+    return removed
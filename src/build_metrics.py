@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+Build Metrics - Per-document build report, size/time budgets and history
+Used by: buildblog.py, build_projects.py
+
+Every run of the blog and project generators writes metrics/<collection>.json:
+for each document its parse and render time (parse is near zero when the
+model came from the parse cache), its content block counts by type and the raw
+and gzipped size of its generated page, plus the sizes of the shared outputs
+(BlogIndex.ts and Blogs.tsx, ProjectIndex.ts and Projects.tsx). The page sizes
+of a built document are measured once and recorded with its metrics in the
+build manifest; documents that were not rebuilt keep the metrics and sizes
+recorded when they last were, so their pages are neither read nor gzipped.
+
+build_budgets.json sets the budgets: "outputs" maps glob patterns of output
+paths to a maximum "bytes" and/or "gzip" size (the first matching pattern
+applies), optionally plus "bytes_per_document"/"gzip_per_document" times the
+number of documents for outputs that list every document, and "documents" a
+maximum "parse_ms" and "render_ms". An exceeded budget is reported with ✗ and
+fails the build.
+
+Each run also appends a line to metrics/<collection>-history.jsonl. Documents
+whose page grew by more than SIZE_JUMP, or whose build time grew by more than
+TIME_JUMP, since the previous run are flagged with ⚠.
+"""
+
+import fnmatch
+import gzip
+import json
+import time
+from pathlib import Path
+
+
+METRICS_DIR = Path('metrics')
+BUDGETS_FILE = Path('build_budgets.json')
+
+# Runs kept in a history file
+HISTORY_LIMIT = 100
+
+# Growth that flags a document: a ratio and a minimum absolute change, so tiny
+# pages and timer noise do not trip it
+SIZE_JUMP = (1.25, 1024)
+TIME_JUMP = (2.0, 20.0)
+
+
+def add_metrics_arguments(parser):
+    """Add the shared --budgets option to an argparse parser"""
+    parser.add_argument('--budgets', type=Path, default=BUDGETS_FILE, metavar='FILE',
+                        help='size and time budgets that fail the build (default: build_budgets.json)')
+
+
+def block_counts(blocks):
+    """Return {block type: count} of content blocks"""
+    counts = {}
+    for block in blocks:
+        counts[block['type']] = counts.get(block['type'], 0) + 1
+    return counts
+
+
+def iter_counted(blocks, counts):
+    """Pass streamed content blocks through, counting them by type into counts"""
+    for block in blocks:
+        counts[block['type']] = counts.get(block['type'], 0) + 1
+        yield block
+
+
+def document_metrics(parse_seconds, render_seconds, cached, counts):
+    """The metrics of one built document, as recorded in the build manifest"""
+    return {
+        'parse_ms': None if parse_seconds is None else round(parse_seconds * 1000, 2),
+        'render_ms': None if render_seconds is None else round(render_seconds * 1000, 2),
+        'cached': cached,
+        'blocks': counts,
+    }
+
+
+def output_size(path, known):
+    """Return {path, bytes, gzip, mtime_ns} of an output, reusing the gzip size in known if it is unchanged"""
+    stat = path.stat()
+    previous = known.get(str(path))
+    if previous and previous['bytes'] == stat.st_size and previous['mtime_ns'] == stat.st_mtime_ns:
+        gzipped = previous['gzip']
+    else:
+        gzipped = len(gzip.compress(path.read_bytes(), mtime=0))
+    return {'path': str(path), 'bytes': stat.st_size, 'gzip': gzipped, 'mtime_ns': stat.st_mtime_ns}
+
+
+def load_budgets(budgets_file):
+    """Load the budgets file, or no budgets if there is none"""
+    if not budgets_file or not Path(budgets_file).exists():
+        return {'outputs': {}, 'documents': {}}
+    budgets = json.loads(Path(budgets_file).read_text(encoding='utf-8'))
+    return {'outputs': budgets.get('outputs', {}), 'documents': budgets.get('documents', {})}
+
+
+def check_budgets(documents, outputs, budgets):
+    """Return a message for every output size or document time over its budget"""
+    violations = []
+    for output in outputs + [output for document in documents for output in document['outputs']]:
+        limits = next((limits for pattern, limits in budgets['outputs'].items()
+                       if fnmatch.fnmatch(output['path'], pattern)), {})
+        for field in ('bytes', 'gzip'):
+            if field not in limits:
+                continue
+            limit = limits[field] + limits.get(f'{field}_per_document', 0) * len(documents)
+            if output[field] > limit:
+                violations.append(f"{output['path']}: {output[field]:,} {field} bytes "
+                                  f"over the budget of {limit:,}")
+
+    for document in documents:
+        for field in ('parse_ms', 'render_ms'):
+            limit = budgets['documents'].get(field)
+            if limit is not None and (document.get(field) or 0) > limit:
+                violations.append(f"{document['file']}: {field} {document[field]:.1f} over the budget of {limit}")
+    return violations
+
+
+def format_size(size):
+    """Human-readable byte count"""
+    return f"{size / 1024:.1f} KB" if size >= 1024 else f"{size} B"
+
+
+def _grew(before, after, jump):
+    ratio, minimum = jump
+    return before is not None and after is not None and after - before > minimum and after > before * ratio
+
+
+def check_history(collection, documents):
+    """Append this run to the history file and return a message per document that jumped since the last run"""
+    summary = {
+        document['file']: {
+            'gzip': sum(output['gzip'] for output in document['outputs']),
+            'ms': None if document.get('cached') or document.get('render_ms') is None
+            else (document.get('parse_ms') or 0) + document['render_ms'],
+        }
+        for document in documents
+    }
+
+    history_file = METRICS_DIR / f'{collection}-history.jsonl'
+    try:
+        lines = [line for line in history_file.read_text(encoding='utf-8').splitlines() if line.strip()]
+    except OSError:
+        lines = []
+    # Only the last run is compared, so only it is parsed
+    previous = json.loads(lines[-1])['documents'] if lines else {}
+
+    jumps = []
+    for file, current in summary.items():
+        before = previous.get(file)
+        if not before:
+            continue
+        if _grew(before['gzip'], current['gzip'], SIZE_JUMP):
+            jumps.append(f"{file}: page grew from {format_size(before['gzip'])} "
+                         f"to {format_size(current['gzip'])} gzipped")
+        if _grew(before['ms'], current['ms'], TIME_JUMP):
+            jumps.append(f"{file}: build time grew from {before['ms']:.0f} ms to {current['ms']:.0f} ms")
+
+    lines.append(json.dumps({'time': time.strftime('%Y-%m-%dT%H:%M:%S'), 'documents': summary},
+                            separators=(',', ':')))
+    history_file.write_text(''.join(line + '\n' for line in lines[-HISTORY_LIMIT:]), encoding='utf-8')
+    return jumps
+
+
+def write_metrics(collection, manifest, sources, shared_outputs, budgets_file=BUDGETS_FILE):
+    """Write metrics/<collection>.json for the built sources, check budgets and history
+
+    Call after the outputs are committed and before the manifest is saved: the
+    sizes of the pages of documents built in this run are recorded in their
+    manifest entries. Returns False if a budget was exceeded.
+    """
+    report_file = METRICS_DIR / f'{collection}.json'
+    try:
+        previous = json.loads(report_file.read_text(encoding='utf-8'))
+        known = {output['path']: output for output in previous['outputs']}
+        known.update((output['path'], output) for document in previous['documents']
+                     for output in document['outputs'])
+    except (OSError, ValueError, KeyError):
+        known = {}
+
+    documents = []
+    for source in sources:
+        entry = manifest['entries'].get(str(source))
+        if entry is None:
+            continue
+        metrics = entry.setdefault('metrics', {})
+        if 'outputs' not in metrics:
+            metrics['outputs'] = [output_size(Path(output), known) for output in entry['outputs']
+                                  if Path(output).exists()]
+        documents.append({'file': str(source), **metrics})
+    outputs = [output_size(Path(output), known) for output in shared_outputs if Path(output).exists()]
+
+    violations = check_budgets(documents, outputs, load_budgets(budgets_file))
+
+    METRICS_DIR.mkdir(exist_ok=True)
+    jumps = check_history(collection, documents)
+    report = {
+        'version': 1,
+        'collection': collection,
+        'documents': documents,
+        'outputs': outputs,
+        'violations': violations,
+        'jumps': jumps,
+    }
+    report_file.write_text(json.dumps(report, indent=2), encoding='utf-8')
+
+    pages = sum(output['gzip'] for document in documents for output in document['outputs'])
+    print(f"✓ Wrote {report_file} ({len(documents)} documents, {format_size(pages)} of pages gzipped)")
+    for jump in jumps:
+        print(f"⚠ {jump}")
+    for violation in violations:
+        print(f"✗ Over budget: {violation}")
+    return not violations
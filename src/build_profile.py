@@ -0,0 +1,345 @@
+#!/usr/bin/env python3
+"""
+Build Profile - CPU and memory profiles of a build, per stage and per document
+Used by: buildblog.py, build_projects.py, build.py (--profile, --trace-memory), build_all.py
+
+With --profile every document is built under its own cProfile profiler, so the
+report can name the functions a slow document spent its time in. Their stats
+and those of the work outside documents (indexes, listings, writes) are merged
+into .buildcache/profile/<name>.prof, for `python -m pstats` or snakeviz.
+With --trace-memory tracemalloc records the peak of every stage and document,
+and the source lines that allocated what each document's result holds.
+
+Stages are the generator functions named in the generator's PROFILE_STAGES
+({function name: stage}): parse, styled-text, render, index and write. They are
+only wrapped while profiling, so a normal build pays nothing. Stage times are
+inclusive: styled-text time is also part of parse.
+
+While profiling, documents are built in-process (--jobs is ignored), as worker
+processes would keep their profiles to themselves. The report ranks the slowest
+and the most memory-hungry documents and is also saved as
+.buildcache/profile/<name>.json.
+"""
+
+import cProfile
+import functools
+import json
+import pstats
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+from pathlib import Path
+
+from build_manifest import CACHE_DIR
+
+
+PROFILE_DIR = CACHE_DIR / 'profile'
+
+# Documents listed in each ranking, and functions/allocation sites per document
+REPORT_COUNT = 10
+HOTSPOT_COUNT = 3
+
+# The profile in progress, or None
+_active = None
+
+
+def add_profile_arguments(parser):
+    """Add the shared --profile and --trace-memory options to an argparse parser"""
+    parser.add_argument('--profile', action='store_true',
+                        help='profile CPU time per stage and document with cProfile and rank the slowest documents')
+    parser.add_argument('--trace-memory', action='store_true',
+                        help='trace memory per stage and document with tracemalloc and rank the hungriest documents')
+
+
+def profile_flags(args):
+    """The --profile/--trace-memory options of parsed args, to pass on to a generator"""
+    return [flag for flag, enabled in (('--profile', args.profile), ('--trace-memory', args.trace_memory))
+            if enabled]
+
+
+def _timing():
+    return {'calls': 0, 'wall': 0.0, 'cpu': 0.0, 'peak': 0}
+
+
+def _enter(timings):
+    frame = {'timings': timings, 'wall': time.perf_counter(), 'cpu': time.process_time(), 'base': 0, 'peak': 0}
+    frames = _active['frames']
+    if _active['memory']:
+        # tracemalloc has one peak; hand the outer frame its peak so far before resetting it
+        current, peak = tracemalloc.get_traced_memory()
+        if frames:
+            frames[-1]['peak'] = max(frames[-1]['peak'], peak)
+        tracemalloc.reset_peak()
+        frame['base'] = frame['peak'] = current
+    frames.append(frame)
+    return frame
+
+
+def _exit(frame):
+    frames = _active['frames']
+    frames.pop()
+    wall = time.perf_counter() - frame['wall']
+    cpu = time.process_time() - frame['cpu']
+    peak = 0
+    if _active['memory']:
+        top = max(frame['peak'], tracemalloc.get_traced_memory()[1])
+        peak = top - frame['base']
+        if frames:
+            frames[-1]['peak'] = max(frames[-1]['peak'], top)
+    for timing in frame['timings']:
+        timing['calls'] += 1
+        timing['wall'] += wall
+        timing['cpu'] += cpu
+        timing['peak'] = max(timing['peak'], peak)
+
+
+def _timed(function, stage):
+    @functools.wraps(function)
+    def timed(*args, **kwargs):
+        if _active is None:
+            return function(*args, **kwargs)
+        timings = [_active['stages'].setdefault(stage, _timing())]
+        if _active['document'] is not None:
+            timings.append(_active['document']['stages'].setdefault(stage, _timing()))
+        frame = _enter(timings)
+        try:
+            return function(*args, **kwargs)
+        finally:
+            _exit(frame)
+    return timed
+
+
+@contextmanager
+def profiling(name, args, namespace, stages):
+    """Profile the build inside the block if args asks for it
+
+    name names the report ('blog', 'projects', 'home'), namespace is the
+    globals() of the generator and stages its PROFILE_STAGES.
+    """
+    global _active
+    if not (args.profile or args.trace_memory):
+        yield
+        return
+
+    if getattr(args, 'jobs', 1) != 1:
+        print("⚠ Profiling builds every document in this process - ignoring --jobs")
+        args.jobs = 1
+
+    originals = {function: namespace[function] for function in stages}
+    for function, stage in stages.items():
+        namespace[function] = _timed(originals[function], stage)
+
+    _active = {
+        'name': name,
+        'cpu': args.profile,
+        'memory': args.trace_memory,
+        'frames': [],
+        'stages': {},
+        'documents': {},
+        'document': None,
+        'profiler': cProfile.Profile() if args.profile else None,
+        'stats': None,
+    }
+    if args.trace_memory:
+        tracemalloc.start()
+    total = _timing()
+    frame = _enter([total])
+    if _active['profiler']:
+        _active['profiler'].enable()
+    try:
+        yield
+    finally:
+        if _active['profiler']:
+            _active['profiler'].disable()
+        _exit(frame)
+        if args.trace_memory:
+            tracemalloc.stop()
+        namespace.update(originals)
+        profile, _active = _active, None
+        report_profile(save_profile(profile, total))
+
+
+@contextmanager
+def document(path):
+    """Attribute the work inside the block to the document at path"""
+    if _active is None:
+        yield None
+        return
+
+    record = _active['documents'].get(str(path))
+    if record is None:
+        record = _active['documents'][str(path)] = {
+            'file': str(path), **_timing(), 'stages': {}, 'functions': [], 'allocations': []}
+    outer = _active['document']
+    _active['document'] = record
+    frame = _enter([record])
+    try:
+        yield record
+    finally:
+        _exit(frame)
+        _active['document'] = outer
+
+
+def profiled(worker):
+    """Wrap a worker(file, *args) to be profiled as the document file, if profiling"""
+    if _active is None:
+        return worker
+
+    @functools.wraps(worker)
+    def build(file, *args):
+        profiler = cProfile.Profile() if _active['cpu'] else None
+        with document(file) as record:
+            result = _profile_call(profiler, worker, file, *args)
+        if profiler:
+            stats = pstats.Stats(profiler)
+            record['functions'] += hot_functions(stats)
+            if _active['stats'] is None:
+                _active['stats'] = stats
+            else:
+                _active['stats'].add(stats)
+        if _active['memory']:
+            record['allocations'] += held_allocations(result)
+        return result
+    return build
+
+
+def profile_documents(results):
+    """Attribute the caller's handling of each (file, result) of map_documents to its document"""
+    if _active is None:
+        return results
+    return _attributed(results)
+
+
+def _attributed(results):
+    for file, result in results:
+        with document(file):
+            yield file, result
+
+
+def _profile_call(profiler, worker, *args):
+    if profiler is None:
+        return worker(*args)
+
+    # One profiler per document; only one can be enabled at a time
+    _active['profiler'].disable()
+    profiler.enable()
+    try:
+        return worker(*args)
+    finally:
+        profiler.disable()
+        _active['profiler'].enable()
+
+
+def hot_functions(stats, count=HOTSPOT_COUNT):
+    """Return the [{function, seconds}] with the most own time in pstats stats"""
+    # Leave out the stage wrappers of this module; built-in functions have no file ('~')
+    functions = [item for item in stats.stats.items() if item[0][0] != __file__]
+    ranked = sorted(functions, key=lambda item: -item[1][2])[:count]
+    return [{'function': name if file == '~' else f"{name} ({Path(file).name}:{line})", 'seconds': round(own, 6)}
+            for (file, line, name), (_, _, own, _, _) in ranked]
+
+
+def held_allocations(result, count=HOTSPOT_COUNT):
+    """Return the [{line, bytes}] that allocated the most of what a worker result holds
+
+    Walks the dicts, lists and strings of the result and groups their sizes by
+    the line tracemalloc recorded for them, which is much cheaper than comparing
+    snapshots of the whole heap around every document.
+    """
+    sizes = {}
+    seen = set()
+    pending = [result]
+    while pending:
+        value = pending.pop()
+        if id(value) in seen:
+            continue
+        seen.add(id(value))
+        traceback = tracemalloc.get_object_traceback(value)
+        if traceback is not None:
+            line = f"{Path(traceback[0].filename).name}:{traceback[0].lineno}"
+            sizes[line] = sizes.get(line, 0) + sys.getsizeof(value)
+        if isinstance(value, dict):
+            pending.extend(value.keys())
+            pending.extend(value.values())
+        elif isinstance(value, (list, tuple, set)):
+            pending.extend(value)
+    largest = sorted(sizes.items(), key=lambda item: -item[1])[:count]
+    return [{'line': line, 'bytes': size} for line, size in largest]
+
+
+def save_profile(profile, total):
+    """Write .buildcache/profile/<name>.json (and .prof with --profile) and return the report"""
+    report = {
+        'name': profile['name'],
+        'cpu': profile['cpu'],
+        'memory': profile['memory'],
+        'total': total,
+        'stages': profile['stages'],
+        'documents': list(profile['documents'].values()),
+    }
+    PROFILE_DIR.mkdir(parents=True, exist_ok=True)
+    report_file = PROFILE_DIR / f"{profile['name']}.json"
+    report_file.write_text(json.dumps(report, indent=2), encoding='utf-8')
+    report['files'] = [report_file]
+
+    if profile['profiler']:
+        stats = pstats.Stats(profile['profiler'])
+        if profile['stats'] is not None:
+            stats.add(profile['stats'])
+        stats_file = PROFILE_DIR / f"{profile['name']}.prof"
+        stats.dump_stats(stats_file)
+        report['files'].append(stats_file)
+    return report
+
+
+def format_bytes(size):
+    """Human-readable byte count"""
+    for unit in ('B', 'KB', 'MB'):
+        if size < 1024:
+            return f"{size:.0f} {unit}" if unit == 'B' else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GB"
+
+
+def _stage_summary(stages, field, format_value):
+    return ' · '.join(f"{stage} {format_value(timing[field])}" for stage, timing in stages.items())
+
+
+def report_profile(report):
+    """Print the stage totals and the slowest and most memory-hungry documents"""
+    documents = report['documents']
+    print(f"\n⏱ Profile of {report['name']}: {len(documents)} documents in {report['total']['wall'] * 1000:.0f} ms "
+          f"(CPU {report['total']['cpu'] * 1000:.0f} ms)")
+
+    print(f"  {'Stage':<12} {'calls':>7} {'wall':>10} {'CPU':>10} {'peak':>10}")
+    for stage, timing in sorted(report['stages'].items(), key=lambda item: -item[1]['wall']):
+        peak = format_bytes(timing['peak']) if report['memory'] else '-'
+        print(f"  {stage:<12} {timing['calls']:>7} {timing['wall'] * 1000:>7.1f} ms "
+              f"{timing['cpu'] * 1000:>7.1f} ms {peak:>10}")
+
+    if not documents:
+        print("\n  No documents were rebuilt - add --force to profile all of them")
+
+    if documents:
+        print("\n  Slowest documents:")
+        for rank, record in enumerate(sorted(documents, key=lambda r: -r['wall'])[:REPORT_COUNT], 1):
+            print(f"  {rank:>3}. {record['file']}  {record['wall'] * 1000:.1f} ms "
+                  f"(CPU {record['cpu'] * 1000:.1f} ms)")
+            if record['stages']:
+                print(f"       {_stage_summary(record['stages'], 'wall', lambda s: f'{s * 1000:.1f} ms')}")
+            if record['functions']:
+                print("       hot: " + ', '.join(f"{f['function']} {f['seconds'] * 1000:.1f} ms"
+                                              for f in record['functions']))
+
+    if documents and report['memory']:
+        print("\n  Most memory-hungry documents:")
+        for rank, record in enumerate(sorted(documents, key=lambda r: -r['peak'])[:REPORT_COUNT], 1):
+            print(f"  {rank:>3}. {record['file']}  peak {format_bytes(record['peak'])}")
+            if record['stages']:
+                print(f"       {_stage_summary(record['stages'], 'peak', format_bytes)}")
+            if record['allocations']:
+                print("       held: " + ', '.join(f"{a['line']} {format_bytes(a['bytes'])}"
+                                               for a in record['allocations']))
+
+    print(f"\n✓ Saved profile to {', '.join(str(f) for f in report['files'])}")
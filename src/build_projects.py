@@ -1,15 +1,96 @@
 #!/usr/bin/env python3
 """
 Project Generator - Converts project markdown files to React components
-Usage: python build_projects.py
+Usage: python build_projects.py [--force] [--jobs N] [--stream] [--data-modules] [--compact] [--highlight] [--responsive-images]
+                                 [--profile] [--trace-memory] [--trace FILE] [--budgets FILE]
 """
 
 import re
 import json
 import os
+import argparse
+import hashlib
+import sys
+import time
 from pathlib import Path
 from datetime import datetime
 
+import inline_markup
+from inline_markup import render_inline
+from build_manifest import (
+    generator_version, content_digest, load_manifest, read_source, lookup, record,
+    index_is_current, removed_outputs, save_manifest,
+)
+from parse_cache import parser_version, load_model, evict_models
+import output_writer
+from output_writer import (
+    start_outputs, stage_output, stage_file, stage_removal, write_temporary, commit_outputs,
+    report_outputs,
+)
+import stream_build
+from stream_build import (
+    split_lines, read_lines, collect_document, spill_document, iter_spilled, stream_page, should_stream,
+)
+from parallel_build import add_jobs_argument, map_documents
+from build_profile import add_profile_arguments, profiling, profiled, profile_documents
+from build_trace import add_trace_argument, tracing
+from build_metrics import add_metrics_arguments, block_counts, iter_counted, document_metrics, write_metrics
+import compact_json
+from compact_json import dumps, hoist_strings, string_constants, output_bytes, report_savings
+import code_highlight
+from code_highlight import HIGHLIGHT_VERSION, highlight_blocks, iter_highlighted
+import image_variants
+from image_variants import IMAGES_VERSION, add_responsive_images, iter_responsive, variant_dirs, write_variants
+import image_dimensions
+from image_dimensions import add_dimensions, iter_dimensions, images_current
+from asset_sync import add_references, iter_references
+import search_index
+from search_index import (SEARCH_DIR, document_terms, cached_terms, start_terms, add_meta,
+                          iter_search_terms, store_terms, stage_search_index)
+import listing_shards
+from listing_shards import LISTINGS_DIR, display_order, is_active, stage_listings
+import related_docs
+from related_docs import stage_related
+import static_pages
+from static_pages import (static_page_file, render_static_page, write_static_page, stage_static_page,
+                          prune_static_pages)
+
+
+# Version of the parser and templates; any edit to them invalidates the build manifest
+GENERATOR_VERSION = generator_version(__file__, inline_markup.__file__, image_dimensions.__file__,
+                                      listing_shards.__file__, related_docs.__file__, static_pages.__file__,
+                                      compact_json.__file__, stream_build.__file__, search_index.__file__,
+                                      output_writer.__file__)
+
+# Card image of projects without a hero image on ProjectsPage
+LISTING_IMAGE = 'https://images.unsplash.com/photo-1628017973088-8feb5de8dddd?crop=entropy&cs=tinysrgb&fit=max&fm=jpg&w=1080'
+
+# Functions timed as build stages by --profile and --trace-memory (see build_profile.py)
+PROFILE_STAGES = {
+    'load_model': 'parse',
+    'parse_styled_text': 'styled-text',
+    'highlight_blocks': 'render',
+    'render_project_page': 'render',
+    'render_static_page': 'render',
+    'write_temporary': 'render',
+    'write_static_page': 'render',
+    'stage_project_listings': 'index',
+    'stage_search_outputs': 'index',
+    'stage_output': 'write',
+    'stage_file': 'write',
+    'commit_outputs': 'write',
+}
+
+
+def manifest_version(data_modules=False, compact=False, highlight=False, images=False):
+    """Manifest version for an output mode, so switching modes rebuilds every project"""
+    version = GENERATOR_VERSION + ('-data' if data_modules else '') + ('-compact' if compact else '')
+    if highlight and HIGHLIGHT_VERSION:
+        version += f'-highlight-{HIGHLIGHT_VERSION}'
+    if images and image_variants.Image:
+        version += f'-images-{IMAGES_VERSION}'
+    return version
+
 
 def parse_styled_text(text, project_title=""):
     """Parse text for orange styling, links, and comment-style lines
@@ -21,88 +102,31 @@ def parse_styled_text(text, project_title=""):
     - [link](url) - Regular external link
     - [orange-link](url) - Orange external link
     """
-    if not text:
-        return text
-    
-    # Replace **bold** with bold styled span (must be before *italic* to avoid conflicts)
-    text = re.sub(r'\*\*(.*?)\*\*', r"<strong>\1</strong>", text)
-    
-    # Replace *italic* with italic styled span - but avoid matching underscores in code like __init__
-    # Only match single asterisks around words, not underscores
-    text = re.sub(r'(?<!\*)\*([^\*]+?)\*(?!\*)', r"<em>\1</em>", text)
-    
-    # Handle [dev](url) - route through development page
-    # Format: [dev](url) where url is the link to send to dev page
-    text = re.sub(
-        r'\[dev\]\(([^)]+)\)',
-        lambda m: f"<a href='#/development?demo={m.group(1)}' style='color: #ff6b3d; text-decoration: underline;'>View Resource</a>",
-        text
-    )
-    
-    # Protect markdown links before processing underscores
-    # This prevents underscores in URLs from being converted to italics
-    link_placeholder_map = {}
-    link_counter = [0]
-    
-    def protect_link(match):
-        link_counter[0] += 1
-        # Use a placeholder WITHOUT underscores to avoid getting italicized
-        placeholder = f"LINKPLACEHOLDER{link_counter[0]}"
-        link_placeholder_map[placeholder] = match.group(0)
-        return placeholder
-    
-    # Temporarily replace markdown links [text](url) with placeholders
-    text = re.sub(r'\[([^\]]+)\]\(([^)]+)\)', protect_link, text)
-    
-    # Now safely apply underscore italic formatting without affecting URLs
-    text = re.sub(r'(?<!_)_([^_]+?)_(?!_)', r"<em>\1</em>", text)
-    
-    # Restore the links and convert them to HTML
-    for placeholder, original_link in link_placeholder_map.items():
-        # Parse the markdown link [text](url)
-        link_match = re.match(r'\[([^\]]+)\]\(([^)]+)\)', original_link)
-        if link_match:
-            link_text = link_match.group(1)
-            link_url = link_match.group(2)
-            # Convert to HTML link
-            html_link = f"<a href='{link_url}' target='_blank' rel='noopener noreferrer' style='color: #ff6b3d; text-decoration: underline;'>{link_text}</a>"
-            text = text.replace(placeholder, html_link)
-    
-    # Replace [orange](text) with orange styled span (using inline styles for reliability)
-    text = re.sub(r'\[orange\]\((.*?)\)', r"<span style='color: #ff6b3d;'>\1</span>", text)
-    
-    # Replace [comment](text) with comment-style text
-    text = re.sub(r'\[comment\]\((.*?)\)', r"<span className='font-mono text-muted-foreground text-sm'>// \1</span>", text)
-    
-    # Replace [link](url) with regular links (using inline styles)
-    text = re.sub(r'\[link\]\((.*?)\)', r"<a href='\1' target='_blank' rel='noopener noreferrer' style='text-decoration: underline;'>\1</a>", text)
-    
-    # Replace [orange-link](url) with orange styled links (using inline styles)
-    text = re.sub(r'\[orange-link\]\((.*?)\)', r"<a href='\1' target='_blank' rel='noopener noreferrer' style='color: #ff6b3d; text-decoration: underline;'>\1</a>", text)
-    
-    return text
+    return render_inline(text)
 
 
 def parse_project_markdown(content):
     """Parse project markdown content into structured data"""
-    lines = content.split('\n')
-    i = 0
-    
-    # Initialize project data
-    project_data = {
-        'meta': {},
-        'toc': [],
-        'content_blocks': []
-    }
+    return collect_document(iter_project_markdown(content.split('\n')))
+
+
+def iter_project_markdown(lines):
+    """Parse project markdown from an iterable of lines, yielding events as they complete
+    
+    Yields ('meta', key, value), ('toc', item) and ('block', block) tuples.
+    Lines may still end in a newline (e.g. when iterating over an open file).
+    """
+    lines = split_lines(lines)
+    raw = next(lines, None)
     
-    while i < len(lines):
-        line = lines[i].strip()
+    while raw is not None:
+        line = raw.strip()
         
         # Parse META section
         if line == '---META---':
-            i += 1
-            while i < len(lines) and not lines[i].strip().startswith('---'):
-                meta_line = lines[i].strip()
+            raw = next(lines, None)
+            while raw is not None and not raw.strip().startswith('---'):
+                meta_line = raw.strip()
                 if ':' in meta_line:
                     key, value = meta_line.split(':', 1)
                     key = key.strip()
@@ -112,32 +136,32 @@ def parse_project_markdown(content):
                     if key in ['tags', 'technologies', 'team'] and value.startswith('[') and value.endswith(']'):
                         # Parse JSON array
                         try:
-                            project_data['meta'][key] = json.loads(value)
+                            yield 'meta', key, json.loads(value)
                         except json.JSONDecodeError:
                             # Fallback to simple string split
-                            project_data['meta'][key] = [item.strip().strip('"\'') for item in value[1:-1].split(',')]
+                            yield 'meta', key, [item.strip().strip('"\'') for item in value[1:-1].split(',')]
                     # Handle booleans
                     elif value.lower() in ['true', 'false']:
-                        project_data['meta'][key] = value.lower() == 'true'
+                        yield 'meta', key, value.lower() == 'true'
                     # Handle numbers
                     elif value.isdigit():
-                        project_data['meta'][key] = int(value)
+                        yield 'meta', key, int(value)
                     else:
-                        project_data['meta'][key] = value
-                i += 1
+                        yield 'meta', key, value
+                raw = next(lines, None)
         
         # Parse TOC section
         elif line == '---TOC---':
-            i += 1
+            raw = next(lines, None)
             # TOC ends when we hit a blank line followed by content, or a markdown heading
-            while i < len(lines):
-                toc_line = lines[i].strip()
+            while raw is not None:
+                toc_line = raw.strip()
                 # TOC ends at a blank line followed by a heading, or at --- markers, or at actual content
                 if not toc_line or toc_line.startswith('---') or toc_line.startswith('#'):
-                    # Don't increment i, let the main loop handle this line
+                    # Don't advance, let the main loop handle this line
                     # But if we hit the closing ---TOC---, skip it
                     if toc_line == '---TOC---':
-                        i += 1
+                        raw = next(lines, None)
                     break
                     
                 if toc_line.startswith('-') and '[' in toc_line and '](' in toc_line:
@@ -147,13 +171,13 @@ def parse_project_markdown(content):
                         title = match.group(1)
                         id_val = match.group(2)
                         level = toc_line.count('  ') + 2  # Determine heading level
-                        project_data['toc'].append({
+                        yield 'toc', {
                             'title': title,
                             'id': id_val,
                             'level': level
-                        })
-                i += 1
-            continue  # Skip the final i += 1 at the end of the loop
+                        }
+                raw = next(lines, None)
+            continue  # Skip the final advance at the end of the loop
         
         # Parse content sections
         elif line.startswith('##') or line.startswith('###'):
@@ -175,29 +199,29 @@ def parse_project_markdown(content):
                 else:
                     content_type = 'heading3'
                 
-                project_data['content_blocks'].append({
+                yield 'block', {
                     'type': content_type,
                     'id': heading_id,
                     'content': parse_styled_text(title)
-                })
-            i += 1
-            continue  # Skip the final i += 1 at the end of the loop
+                }
+            raw = next(lines, None)
+            continue  # Skip the final advance at the end of the loop
             
         # Parse paragraphs
         elif line and not line.startswith(('#', '>', '```', '![', '---')):
             paragraph_lines = [line]
-            i += 1
+            raw = next(lines, None)
             # Collect continuation lines
-            while i < len(lines) and lines[i].strip() and not lines[i].strip().startswith(('#', '>', '```', '![', '---')):
-                paragraph_lines.append(lines[i].strip())
-                i += 1
+            while raw is not None and raw.strip() and not raw.strip().startswith(('#', '>', '```', '![', '---')):
+                paragraph_lines.append(raw.strip())
+                raw = next(lines, None)
             
             content = ' '.join(paragraph_lines)
-            project_data['content_blocks'].append({
+            yield 'block', {
                 'type': 'paragraph',
                 'content': parse_styled_text(content)
-            })
-            continue  # Skip the final i += 1 at the end of the loop
+            }
+            continue  # Skip the final advance at the end of the loop
         
         # Parse quotes
         elif line.startswith('>'):
@@ -205,43 +229,43 @@ def parse_project_markdown(content):
             author = None
             
             # Collect quote lines
-            while i < len(lines) and lines[i].strip().startswith('>'):
-                quote_line = lines[i].strip()[1:].strip()
+            while raw is not None and raw.strip().startswith('>'):
+                quote_line = raw.strip()[1:].strip()
                 if quote_line.startswith('-'):
                     author = quote_line[1:].strip()
                 else:
                     quote_lines.append(quote_line)
-                i += 1
+                raw = next(lines, None)
             
             if quote_lines:
-                project_data['content_blocks'].append({
+                yield 'block', {
                     'type': 'quote',
                     'content': parse_styled_text(' '.join(quote_lines)),
                     'author': author
-                })
-            continue  # Skip the final i += 1 at the end of the loop
+                }
+            continue  # Skip the final advance at the end of the loop
         
         # Parse code blocks
         elif line.startswith('```'):
             language = line[3:].strip() or 'text'
-            i += 1
+            raw = next(lines, None)
             code_lines = []
             
             # Collect code lines until closing ```
-            while i < len(lines) and not lines[i].strip().startswith('```'):
-                code_lines.append(lines[i])
-                i += 1
+            while raw is not None and not raw.strip().startswith('```'):
+                code_lines.append(raw)
+                raw = next(lines, None)
             
             # Skip the closing ``` line
-            if i < len(lines) and lines[i].strip().startswith('```'):
-                i += 1
+            if raw is not None and raw.strip().startswith('```'):
+                raw = next(lines, None)
             
-            project_data['content_blocks'].append({
+            yield 'block', {
                 'type': 'code',
                 'language': language,
                 'content': '\n'.join(code_lines)
-            })
-            continue  # Skip the final i += 1 at the end of the loop
+            }
+            continue  # Skip the final advance at the end of the loop
         
         # Parse images
         elif line.startswith('!['):
@@ -261,55 +285,30 @@ def parse_project_markdown(content):
                 if width:
                     block['width'] = width
                 
-                project_data['content_blocks'].append(block)
+                yield 'block', block
         
-        i += 1
-    
-    return project_data
-
-
-def generate_project_page_component(project_data, filename):
-    """Generate a React component for a project page with blog-style hero section"""
-    meta = project_data['meta']
-    toc_items = project_data['toc']
-    content_blocks = project_data['content_blocks']
-    
-    # Generate component name from filename
-    component_name = ''.join([word.capitalize() for word in filename.replace('.md', '').replace('-', ' ').split()])
-    component_name += 'Page'
-    
-    # Convert meta to JSON string
-    meta_json = json.dumps(meta, indent=4)
-    
-    # Convert TOC to JSON string
-    toc_json = json.dumps(toc_items, indent=8)
-    
-    # Convert content blocks to JSON string
-    content_json = json.dumps(content_blocks, indent=8)
-    
-    component_content = f'''import {{ ArrowLeft, Calendar, Clock, Github, ExternalLink, MapPin, Users, Code }} from "lucide-react";
-import {{ Header }} from "../components/Header";
-import {{ Footer }} from "../components/Footer";
-import {{ ImageWithFallback }} from "../components/figma/ImageWithFallback";
-import {{ TableOfContents }} from "../components/blog/TableOfContents";
-import {{ BlogContent, BlogContentBlock }} from "../components/blog/BlogContent";
+        raw = next(lines, None)
 
-export function {component_name}() {{
-  // Project data generated from markdown
-  const projectData = {meta_json};
-
-  const tocItems = {toc_json};
 
-  const contentBlocks: BlogContentBlock[] = {content_json};
+# Imports of a generated project page (paths relative to pages/)
+PROJECT_PAGE_IMPORTS = '''import { ArrowLeft, Calendar, Clock, Github, ExternalLink, MapPin, Users, Code } from "lucide-react";
+import { Header } from "../components/Header";
+import { Footer } from "../components/Footer";
+import { ImageWithFallback } from "../components/figma/ImageWithFallback";
+import { TableOfContents } from "../components/blog/TableOfContents";
+import { BlogContent, BlogContentBlock } from "../components/blog/BlogContent";
+import { RelatedLinks } from "../components/shared/RelatedLinks";
+'''
 
-  return (
+# JSX of a project page, rendered from projectData, tocItems and contentBlocks
+PROJECT_PAGE_BODY = '''  return (
     <div className="size-full relative">
       <Header />
 
-      {{/* Hero Section */}}
+      {/* Hero Section */}
       <section>
         <div className="max-w-7xl mx-auto px-8 py-20 pb-8">
-          {{/* Back Button */}}
+          {/* Back Button */}
           <a
             href="#/projects"
             className="inline-flex items-center gap-2 mb-8 px-4 py-2 border-2 border-border bg-background hover:bg-foreground hover:text-background transition-colors font-mono"
@@ -318,91 +317,95 @@ export function {component_name}() {{
             <span>Back to Projects</span>
           </a>
 
-          {{/* Boxed Hero Content */}}
+          {/* Boxed Hero Content */}
           <div className="border-2 border-border">
             <div className="grid grid-cols-1 lg:grid-cols-12">
               
-              {{/* Left Column - Hero Image (Optional) */}}
-              {{projectData.heroImage && (
+              {/* Left Column - Hero Image (Optional) */}
+              {projectData.heroImage && (
                 <div className="lg:col-span-5 bg-background border-r border-b border-border lg:border-b-0">
                   <div className="relative h-full min-h-[250px] lg:min-h-[400px]">
                     <ImageWithFallback
-                      src={{projectData.heroImage}}
-                      alt={{projectData.title}}
+                      src={projectData.heroImage}
+                      srcSet={projectData.heroSrcset}
+                      sizes={projectData.heroSizes}
+                      width={projectData.heroWidth}
+                      height={projectData.heroHeight}
+                      alt={projectData.title}
                       className="w-full h-full object-cover"
                     />
                   </div>
                 </div>
-              )}}
+              )}
 
-              {{/* Right Column - Project Info */}}
-              <div className={{`${{projectData.heroImage ? 'lg:col-span-7' : 'lg:col-span-12'}} bg-background p-6 md:p-12`}}>
+              {/* Right Column - Project Info */}
+              <div className={`${projectData.heroImage ? 'lg:col-span-7' : 'lg:col-span-12'} bg-background p-6 md:p-12`}>
                 <div className="space-y-6 md:space-y-8">
-                  {{/* Category & Meta Info */}}
+                  {/* Category & Meta Info */}
                   <div className="space-y-4">
                     <div className="flex flex-col sm:flex-row sm:items-center gap-3 sm:gap-4">
                       <span className="px-4 py-2 border-2 border-border bg-background font-mono text-sm inline-block w-fit">
-                        {{projectData.category}}
+                        {projectData.category}
                       </span>
                       <div className="flex items-center gap-3 sm:gap-4 font-mono text-xs sm:text-sm text-muted-foreground">
                         <span className="flex items-center gap-2">
                           <Calendar className="w-4 h-4 flex-shrink-0" />
-                          <span className="whitespace-nowrap">{{projectData.date}}</span>
+                          <span className="whitespace-nowrap">{projectData.date}</span>
                         </span>
-                        {{projectData.duration && (
+                        {projectData.duration && (
                           <>
                             <span>•</span>
                             <span className="flex items-center gap-2">
                               <Clock className="w-4 h-4 flex-shrink-0" />
-                              <span className="whitespace-nowrap">{{projectData.duration}}</span>
+                              <span className="whitespace-nowrap">{projectData.duration}</span>
                             </span>
                           </>
-                        )}}
+                        )}
                       </div>
                     </div>
                   </div>
 
-                  {{/* Title */}}
+                  {/* Title */}
                   <div>
-                    <h1 className="mb-6 text-3xl md:text-4xl lg:text-5xl">{{projectData.title}}</h1>
+                    <h1 className="mb-6 text-3xl md:text-4xl lg:text-5xl">{projectData.title}</h1>
                   </div>
 
-                  {{/* Author/Project Info */}}
+                  {/* Author/Project Info */}
                   <div className="flex items-center gap-3">
                     <div className="w-12 h-12 rounded-full overflow-hidden border-2 border-border bg-secondary flex items-center justify-center">
                       <Code className="w-6 h-6" />
                     </div>
                     <div>
                       <p className="font-mono text-sm text-muted-foreground">
-                        {{projectData.company || 'Project by'}}
+                        {projectData.company || 'Project by'}
                       </p>
-                      <p>{{projectData.type || 'Development Team'}}</p>
+                      <p>{projectData.type || 'Development Team'}</p>
                     </div>
                   </div>
 
-                  {{/* Tags Section */}}
+                  {/* Tags Section */}
                   <div className="-mx-12 px-12 border-t border-border pt-8">
                     <p className="font-mono text-muted-foreground mb-4">// TECHNOLOGIES</p>
                     <div className="flex flex-wrap gap-2">
-                      {{projectData.technologies && projectData.technologies.length > 0 ? (
+                      {projectData.technologies && projectData.technologies.length > 0 ? (
                         projectData.technologies.map((tech: string, index: number) => (
                           <span
-                            key={{index}}
+                            key={index}
                             className="px-3 py-1 border-2 border-border font-mono text-sm bg-background hover:bg-secondary transition-colors"
                           >
-                            #{{tech}}
+                            #{tech}
                           </span>
                         ))
                       ) : (
                         projectData.tags && projectData.tags.map((tag: string, index: number) => (
                           <span
-                            key={{index}}
+                            key={index}
                             className="px-3 py-1 border-2 border-border font-mono text-sm bg-background hover:bg-secondary transition-colors"
                           >
-                            #{{tag}}
+                            #{tag}
                           </span>
                         ))
-                      )}}
+                      )}
                     </div>
                   </div>
                 </div>
@@ -412,48 +415,51 @@ export function {component_name}() {{
         </div>
       </section>
 
-      {{/* Main Content */}}
+      {/* Main Content */}
       <section className="border-b border-border">
         <div className="max-w-7xl mx-auto px-8 py-12 pt-8">
           <div className="grid grid-cols-1 lg:grid-cols-12 gap-12">
-            {{/* Table of Contents - Desktop */}}
+            {/* Table of Contents - Desktop */}
             <aside className="hidden lg:block lg:col-span-3">
-              <TableOfContents items={{tocItems}} />
+              <TableOfContents items={tocItems} />
             </aside>
 
-            {{/* Project Content */}}
+            {/* Project Content */}
             <article className="lg:col-span-9">
               <div className="bg-background p-4 rounded-lg">
-                <BlogContent blocks={{contentBlocks}} />
+                <BlogContent blocks={contentBlocks} />
 
-                {{/* Action Buttons */}}
-                {{(projectData.github || projectData.demo) && (
+                {/* Action Buttons */}
+                {(projectData.github || projectData.demo) && (
                 <div className="mt-16 pt-8 border-t-2 border-border">
                   <p className="font-mono text-sm text-muted-foreground mb-4">
                     // PROJECT LINKS
                   </p>
                   <div className="flex gap-3">
-                    {{projectData.github && (
+                    {projectData.github && (
                       <a
-                        href={{`#/development?name=${{encodeURIComponent(projectData.title)}}&github=${{encodeURIComponent(projectData.github)}}&demo=${{encodeURIComponent(projectData.demo || '')}}`}}
+                        href={`#/development?name=${encodeURIComponent(projectData.title)}&github=${encodeURIComponent(projectData.github)}&demo=${encodeURIComponent(projectData.demo || '')}`}
                         className="px-4 py-2 border-2 border-border bg-background hover:bg-foreground hover:text-background transition-colors font-mono inline-flex items-center gap-2"
                       >
                         <Github className="w-4 h-4" />
                         Code
                       </a>
-                    )}}
-                    {{projectData.demo && (
+                    )}
+                    {projectData.demo && (
                       <a
-                        href={{`#/development?name=${{encodeURIComponent(projectData.title)}}&github=${{encodeURIComponent(projectData.github || '')}}&demo=${{encodeURIComponent(projectData.demo)}}`}}
+                        href={`#/development?name=${encodeURIComponent(projectData.title)}&github=${encodeURIComponent(projectData.github || '')}&demo=${encodeURIComponent(projectData.demo)}`}
                         className="px-4 py-2 border-2 border-border bg-background hover:bg-foreground hover:text-background transition-colors font-mono inline-flex items-center gap-2"
                       >
                         <ExternalLink className="w-4 h-4" />
                         Demo
                       </a>
-                    )}}
+                    )}
                   </div>
                 </div>
-                )}}
+                )}
+
+                {/* Related Projects */}
+                <RelatedLinks collection="projects" slug={projectData.slug} label="// RELATED PROJECTS" />
               </div>
             </article>
           </div>
@@ -463,62 +469,160 @@ export function {component_name}() {{
       <Footer />
     </div>
   );
-}}'''
+'''
+
+
+def generate_project_page_component(project_data, filename, compact=False):
+    """Generate a React component for a project page with blog-style hero section"""
+    meta = project_data['meta']
+    toc_items = project_data['toc']
+    content_blocks = project_data['content_blocks']
+    
+    # Generate component name from filename
+    component_name = ''.join([word.capitalize() for word in filename.replace('.md', '').replace('-', ' ').split()])
+    component_name += 'Page'
+    
+    # Strings shared by meta, TOC and content, declared once with --compact
+    strings = hoist_strings(meta, toc_items, content_blocks) if compact else {}
+    
+    # Convert meta to JSON string
+    meta_json = dumps(meta, 4, compact, strings)
+    
+    # Convert TOC to JSON string
+    toc_json = dumps(toc_items, 8, compact, strings)
+    
+    # Convert content blocks to JSON string
+    content_json = dumps(content_blocks, 8, compact, strings)
+    
+    component_content = (
+        PROJECT_PAGE_IMPORTS
+        + 'import type { ProjectMeta } from "./ProjectIndex";\n'
+        + string_constants(strings)
+        + f'''
+export function {component_name}() {{
+  // Project data generated from markdown
+  const projectData: ProjectMeta = {meta_json};
+
+  const tocItems = {toc_json};
+
+  const contentBlocks: BlogContentBlock[] = {content_json};
+
+'''
+        + PROJECT_PAGE_BODY
+        + '}'
+    )
     
     return component_content
 
 
-def generate_project_index():
-    """Generate index file with all project metadata and components"""
-    projects_dir = Path('assets/projects')
+def generate_project_page_view():
+    """Generate the ProjectPageView component shared by all data modules"""
+    return (
+        '// Auto-generated by build_projects.py --data-modules - DO NOT EDIT MANUALLY\n'
+        '// Renders every project page; the project data comes from pages/data/<Project>Page.ts\n'
+        'import type { ComponentProps } from "react";\n'
+        + PROJECT_PAGE_IMPORTS
+        + '''import type { ProjectMeta } from "./ProjectIndex";
+
+export interface ProjectPageViewProps {
+  projectData: ProjectMeta;
+  tocItems: ComponentProps<typeof TableOfContents>["items"];
+  contentBlocks: BlogContentBlock[];
+}
+
+export function ProjectPageView({ projectData, tocItems, contentBlocks }: ProjectPageViewProps) {
+'''
+        + PROJECT_PAGE_BODY
+        + '}\n'
+    )
+
+
+def generate_project_data_module(project_data, component_name, compact=False):
+    """Generate the data module of one project, rendered by ProjectPageView"""
+    meta = project_data['meta']
+    toc_items = project_data['toc']
+    content_blocks = project_data['content_blocks']
     
-    # Get all markdown files, excluding documentation files
-    project_files = [
-        f for f in projects_dir.glob('*.md') 
-        if f.name.upper() not in ['README.MD', 'HOW-TO-ADD-PROJECTS.MD']
+    strings = hoist_strings(meta, toc_items, content_blocks) if compact else {}
+    meta_json = dumps(meta, 2, compact, strings)
+    toc_json = dumps(toc_items, 2, compact, strings)
+    content_json = dumps(content_blocks, 2, compact, strings)
+    
+    return f'''// Auto-generated by build_projects.py --data-modules - DO NOT EDIT MANUALLY
+import {{ createElement }} from "react";
+import type {{ BlogContentBlock }} from "../../components/blog/BlogContent";
+import {{ ProjectPageView }} from "../ProjectPageView";
+{string_constants(strings)}
+const projectData = {meta_json};
+
+const tocItems = {toc_json};
+
+const contentBlocks: BlogContentBlock[] = {content_json};
+
+export default function {component_name}() {{
+  return createElement(ProjectPageView, {{ projectData, tocItems, contentBlocks }});
+}}
+'''
+
+
+def stage_search_outputs(project_index, keys, outputs):
+    """Stage the search index and the related project links, both built from the cached term maps"""
+    docs = search_docs(project_index)
+    stage_search_index('projects', docs, keys, 'projects-search', outputs)
+    stage_related('projects', docs, keys, [entry['meta'] for entry in project_index], 'projects-search', outputs)
+
+
+def search_docs(project_index):
+    """The {slug, title, href} of each project, as listed in the search index"""
+    return [
+        {
+            'slug': entry['slug'],
+            'title': entry['meta'].get('title', entry['slug']),
+            'href': f"#/project/{entry['slug']}",
+        }
+        for entry in project_index
     ]
+
+
+def search_keys(manifest, project_files):
+    """The cached term map key of each project, in the order of project_files"""
+    return [manifest['entries'][str(f)].get('search') for f in project_files]
+
+
+def lazy_component(component_name, data_modules=False):
+    """Return a React.lazy() expression that loads a generated page on demand"""
+    if data_modules:
+        return f'lazy(() => import("./data/{component_name}"))'
+    return f'lazy(() => import("./{component_name}").then((module) => ({{ default: module.{component_name} }})))'
+
+
+def generate_project_index(projects, data_modules=False, compact=False):
+    """Generate index file with all project metadata and components
     
+    projects is the list of {'slug', 'component', 'meta'} entries built by main,
+    in index order.
+    """
     project_index = []
     project_components = {}
     
-    for project_file in project_files:
-        with open(project_file, 'r', encoding='utf-8') as f:
-            content = f.read()
+    for project in projects:
+        # Add to index
+        project_index.append({
+            'slug': project['slug'],
+            'meta': project['meta']
+        })
         
-        try:
-            project_data = parse_project_markdown(content)
-            meta = project_data['meta']
-            
-            # Generate component name
-            filename = project_file.stem
-            component_name = ''.join([word.capitalize() for word in filename.replace('-', ' ').split()]) + 'Page'
-            
-            # Ensure display flags have default values
-            if 'featuredOnHome' not in meta:
-                meta['featuredOnHome'] = False
-            if 'featuredOnProjects' not in meta:
-                meta['featuredOnProjects'] = False
-            if 'displayOrder' not in meta:
-                meta['displayOrder'] = 999  # Default to low priority
-            
-            # Add to index
-            project_index.append({
-                'slug': meta.get('slug', filename),
-                'meta': meta
-            })
-            
-            # Add to components mapping
-            project_components[meta.get('slug', filename)] = component_name
-            
-        except Exception as e:
-            print(f"Error parsing {project_file}: {e}")
-            continue
+        # Add to components mapping
+        project_components[project['slug']] = project['component']
+    
+    strings = hoist_strings(project_index) if compact else {}
     
     # Generate TypeScript interfaces and exports
     index_content = f'''// Auto-generated project index
 // This file is automatically generated by build_projects.py
 // Do not edit manually
-
+import {{ lazy }} from "react";
+{string_constants(strings)}
 export interface ProjectMeta {{
   title: string;
   category: string;
@@ -527,6 +631,10 @@ export interface ProjectMeta {{
   location?: string;
   type?: string;
   heroImage?: string;
+  heroSrcset?: string;
+  heroSizes?: string;
+  heroWidth?: number;
+  heroHeight?: number;
   tags: string[];
   github?: string;
   demo?: string;
@@ -546,35 +654,27 @@ export interface ProjectIndexItem {{
   meta: ProjectMeta;
 }}
 
-// Import all project page components
 '''
-
-    # Add imports
-    for slug, component_name in project_components.items():
-        index_content += f'import {{ {component_name} }} from "./{component_name}";\n'
     
-    index_content += '\n// Project index with metadata\n'
-    index_content += f'export const PROJECT_INDEX: ProjectIndexItem[] = {json.dumps(project_index, indent=2)};\n\n'
+    index_content += '// Project index with metadata\n'
+    index_content += f'export const PROJECT_INDEX: ProjectIndexItem[] = {dumps(project_index, 2, compact, strings)};\n\n'
     
-    index_content += '// Project components mapping\n'
+    index_content += '// Project components mapping, each page loaded in its own chunk on first visit\n'
+    index_content += '// (render them inside a <Suspense> boundary)\n'
     index_content += f'export const PROJECT_COMPONENTS = {{\n'
     for slug, component_name in project_components.items():
-        index_content += f'  "{slug}": {component_name},\n'
+        index_content += f'  "{slug}": {lazy_component(component_name, data_modules)},\n'
     index_content += '};\n'
     
     return index_content
 
 
-def generate_projects_component(project_index):
-    """Generate Projects.tsx component for HomePage with featured projects"""
-    # Filter and sort projects for home page
-    featured_projects = [
-        p for p in project_index 
-        if p['meta'].get('featuredOnHome', False) and p['meta'].get('active', True)
-    ]
+def generate_projects_component(ordered, compact=False):
+    """Generate Projects.tsx component for HomePage with featured projects
     
-    # Sort by display order
-    featured_projects.sort(key=lambda p: p['meta'].get('displayOrder', 999))
+    ordered are the active index entries in display order.
+    """
+    featured_projects = [p for p in ordered if p['meta'].get('featuredOnHome', False)]
     
     # Prepare project data
     projects_data = []
@@ -595,11 +695,12 @@ def generate_projects_component(project_index):
             
         projects_data.append(project_obj)
     
-    projects_json = json.dumps(projects_data, indent=8)
+    strings = hoist_strings(projects_data) if compact else {}
+    projects_json = dumps(projects_data, 8, compact, strings)
     
     component_content = f'''import {{ PageHeader }} from "./shared/PageHeader";
 import {{ ProjectCard }} from "./shared/ProjectCard";
-
+{string_constants(strings)}
 interface Project {{
   title: string;
   description: string;
@@ -657,107 +758,459 @@ The featured project logic should be updated to use featuredOnProjects flag.
 """
 
 
-def main():
+def stage_project_listings(project_index, pages_dir, components_dir, outputs, data_modules=False, compact=False):
+    """Stage ProjectIndex.ts, the homepage Projects.tsx and the ProjectsPage listing shards for the given index entries
+    
+    Also removes the static pages of projects that are no longer in the index, and the
+    pages a project had in the other --data-modules mode.
+    
+    Returns the (path, indented bytes, compact bytes) of each listing with --compact.
+    """
+    savings = []
+    
+    # Generate project index
+    try:
+        index_content = generate_project_index(project_index, data_modules, compact)
+        index_file = pages_dir / "ProjectIndex.ts"
+        if stage_output(outputs, index_file, index_content):
+            print("✓ Generated ProjectIndex.ts")
+        else:
+            print("✓ ProjectIndex.ts unchanged")
+        if compact:
+            indented = generate_project_index(project_index, data_modules)
+            savings.append((index_file, output_bytes(indented), output_bytes(index_content)))
+    except Exception as e:
+        print(f"✗ Error generating project index: {e}")
+    
+    # Pages of the other --data-modules mode, left over from switching modes
+    for entry in project_index:
+        if entry['component']:
+            stage_removal(outputs, project_output_file(pages_dir, entry['component'], not data_modules))
+    if not data_modules:
+        stage_removal(outputs, pages_dir / "ProjectPageView.tsx")
+    
+    # Shared page component for the per-project data modules
+    if data_modules:
+        view_file = pages_dir / "ProjectPageView.tsx"
+        if stage_output(outputs, view_file, generate_project_page_view()):
+            print("✓ Generated ProjectPageView.tsx")
+        else:
+            print("✓ ProjectPageView.tsx unchanged")
+    
+    # Active projects in display order, shared by Projects.tsx and the listing shards
+    ordered = [entry for entry in display_order(project_index) if is_active(entry)]
+    
+    # Generate Projects.tsx component for HomePage
+    try:
+        projects_component = generate_projects_component(ordered, compact)
+        projects_file = components_dir / "Projects.tsx"
+        if stage_output(outputs, projects_file, projects_component):
+            print("✓ Generated Projects.tsx component")
+        else:
+            print("✓ Projects.tsx unchanged")
+        if compact:
+            indented = generate_projects_component(ordered)
+            savings.append((projects_file, output_bytes(indented), output_bytes(projects_component)))
+    except Exception as e:
+        print(f"✗ Error generating Projects component: {e}")
+    
+    # Generate the ProjectsPage listing shards (featured: first project in file order with featuredOnProjects)
+    active = [entry for entry in project_index if is_active(entry)]
+    featured = next((entry for entry in active if entry['meta'].get('featuredOnProjects')), None)
+    stage_listings('projects', ordered, listing_card, featured or next(iter(active), None), outputs)
+    
+    # Static pages of removed projects
+    prune_static_pages('projects', [entry['slug'] for entry in project_index], outputs)
+    
+    return savings
+
+
+def listing_card(entry):
+    """The ProjectCard fields of a project, as listed on ProjectsPage"""
+    meta = entry['meta']
+    tags = meta.get('tags') or []
+    date = meta.get('date', '')
+    card = {
+        'title': meta.get('title', ''),
+        'description': f"{meta.get('title', '')} - {', '.join(tags[:3])}",
+        'image': meta.get('heroImage') or LISTING_IMAGE,
+        'tags': meta.get('technologies') or tags,
+        'category': meta.get('category', ''),
+        'year': '2023' if '2023' in date and '2024' not in date else '2024',
+        'slug': entry['slug'],
+    }
+    if meta.get('github'):
+        card['github'] = meta['github']
+    if meta.get('demo'):
+        card['demo'] = meta['demo']
+    return card
+
+
+def find_project_files(projects_dir):
+    """Return the project markdown files, sorted so the index order does not depend on the filesystem"""
+    return sorted(
+        f for f in projects_dir.glob('*.md') 
+        if f.name.upper() not in ['README.MD', 'HOW-TO-ADD-PROJECTS.MD', 'DEV_PAGE_ROUTING.MD']
+    )
+
+
+# Version of the parser alone; template edits keep cached parse results valid
+PARSER_VERSION = parser_version(parse_project_markdown, iter_project_markdown, parse_styled_text,
+                                inline_markup.__file__, stream_build.__file__)
+
+
+def apply_meta_defaults(meta):
+    """Ensure display flags have default values for the index"""
+    if 'featuredOnHome' not in meta:
+        meta['featuredOnHome'] = False
+    if 'featuredOnProjects' not in meta:
+        meta['featuredOnProjects'] = False
+    if 'displayOrder' not in meta:
+        meta['displayOrder'] = 999  # Default to low priority
+
+
+def render_project_page(project_data, filename, component_name, data_modules=False, compact=False):
+    """Render a project as a full page, or as a data module with --data-modules"""
+    if data_modules:
+        return generate_project_data_module(project_data, component_name, compact)
+    return generate_project_page_component(project_data, filename, compact)
+
+
+def project_output_file(pages_dir, component_name, data_modules=False):
+    """Path of the page or data module generated for a project"""
+    if data_modules:
+        return pages_dir / 'data' / f"{component_name}.ts"
+    return pages_dir / f"{component_name}.tsx"
+
+
+def build_project_page(project_file, pages_dir, stream=False, data_modules=False, compact=False,
+                       highlight=False, images=False):
+    """Read, parse and render one project page (runs in a worker process with --jobs)"""
+    if should_stream(project_file, stream):
+        return stream_project_page(project_file, pages_dir, data_modules, compact, highlight, images)
+    
+    try:
+        content, stat = read_source(project_file)
+        
+        # Parse project markdown
+        started = time.perf_counter()
+        project_data, model_key, model_cached = load_model(
+            'projects', content, PARSER_VERSION, parse_project_markdown)
+        parse_seconds = time.perf_counter() - started
+        
+        # Pre-highlight code blocks so the page does not need the runtime highlighter
+        highlights = highlight_blocks(project_data['content_blocks'], 'projects-code') if highlight else []
+        
+        # Pixel sizes of local images, so the page can reserve their space
+        found = {}
+        add_dimensions(project_data['content_blocks'], project_data['meta'], found)
+        
+        # Asset files the project points at; only these are published
+        references = set()
+        add_references(project_data['content_blocks'], project_data['meta'], references)
+        
+        # Responsive variants of local images, written once per source hash
+        plans = {}
+        if images:
+            add_responsive_images(project_data['content_blocks'], project_data['meta'], plans)
+        
+        # Generate component
+        filename = project_file.stem
+        component_name = ''.join([word.capitalize() for word in filename.replace('-', ' ').split()]) + 'Page'
+        output_file = project_output_file(pages_dir, component_name, data_modules)
+        slug = project_data['meta'].get('slug', filename)
+        static_file = static_page_file('projects', slug)
+        started = time.perf_counter()
+        component_content = render_project_page(project_data, filename, component_name, data_modules, compact)
+        static_html = render_static_page('projects', slug, project_data['meta'], project_data['toc'],
+                                         project_data['content_blocks'])
+        render_seconds = time.perf_counter() - started
+        savings = None
+        if compact:
+            # Size of the same page without --compact, for the savings report
+            indented = render_project_page(project_data, filename, component_name, data_modules)
+            savings = (output_bytes(indented), output_bytes(component_content))
+        
+        # Ensure display flags have default values for the index
+        # (after rendering, so the page itself only carries the authored meta)
+        meta = project_data['meta']
+        apply_meta_defaults(meta)
+        
+        # Term map for the search index
+        digest = content_digest(content)
+        search = document_terms('projects-search', digest, project_data['content_blocks'], meta)
+    except Exception as e:
+        return {'error': str(e)}
+    
+    return {
+        'digest': digest,
+        'stat': stat,
+        'model': model_key,
+        'model_cached': model_cached,
+        'highlights': highlights,
+        'images': found,
+        'references': sorted(references),
+        'variants': variant_dirs(plans),
+        'search': search,
+        'output_file': output_file,
+        'component_content': component_content,
+        'component_file': None,
+        'static_file': static_file,
+        'static_html': static_html,
+        'static_temp': None,
+        'savings': savings,
+        'metrics': document_metrics(parse_seconds, render_seconds, model_cached,
+                                     block_counts(project_data['content_blocks'])),
+        'index_entry': {
+            'slug': meta.get('slug', filename),
+            'component': component_name,
+            'meta': meta
+        }
+    }
+
+
+def stream_project_page(project_file, pages_dir, data_modules=False, compact=False,
+                        highlight=False, images=False):
+    """Parse and render one project page without holding the whole document in memory
+    
+    The page is written to a temporary file ('component_file') for stage_file;
+    the parse cache is bypassed since the model would not fit in memory either.
+    With --compact only strings shared by the meta and TOC are hoisted, and no
+    savings are reported, since that would need the whole document.
+    """
+    try:
+        stat = project_file.stat()
+        digest = hashlib.sha256()
+        meta, toc, spill = spill_document(iter_project_markdown(read_lines(project_file, digest)))
+        highlights = []
+        found = {}
+        plans = {}
+        counts = {}
+        references = set()
+        
+        with spill:
+            filename = project_file.stem
+            component_name = ''.join([word.capitalize() for word in filename.replace('-', ' ').split()]) + 'Page'
+            output_file = project_output_file(pages_dir, component_name, data_modules)
+            add_dimensions([], meta, found)
+            add_references([], meta, references)
+            if images:
+                add_responsive_images([], meta, plans)
+            search = cached_terms('projects-search', digest.hexdigest())
+            terms = None if search else start_terms()
+            if terms:
+                add_meta(terms, meta)
+            project_data = {'meta': meta, 'toc': toc, 'content_blocks': []}
+            page = render_project_page(project_data, filename, component_name, data_modules, compact)
+            if compact:
+                indent = None
+            else:
+                indent = 2 if data_modules else 8
+            if images:
+                # Encode the variants up front, like the in-memory path, so only rendering is timed
+                write_variants(iter_spilled(spill), plans)
+            blocks = iter_counted(iter_spilled(spill), counts)
+            if highlight:
+                blocks = iter_highlighted(blocks, 'projects-code', highlights)
+            blocks = iter_dimensions(blocks, found)
+            blocks = iter_references(blocks, references)
+            if terms:
+                blocks = iter_search_terms(blocks, terms)
+            if images:
+                blocks = iter_responsive(blocks, plans)
+            started = time.perf_counter()
+            component_file = write_temporary(output_file, stream_page(page, blocks, indent))
+            
+            # Second pass over the spilled blocks for the static page
+            slug = meta.get('slug', filename)
+            static_file = static_page_file('projects', slug)
+            blocks = iter_spilled(spill)
+            if highlight:
+                blocks = iter_highlighted(blocks, 'projects-code', [])
+            blocks = iter_dimensions(blocks, found)
+            if images:
+                blocks = iter_responsive(blocks, plans)
+            static_temp = write_static_page('projects', slug, meta, toc, blocks)
+            render_seconds = time.perf_counter() - started
+            if terms:
+                search = store_terms('projects-search', digest.hexdigest(), terms)
+    except Exception as e:
+        return {'error': str(e)}
+    
+    apply_meta_defaults(meta)
+    
+    return {
+        'digest': digest.hexdigest(),
+        'stat': stat,
+        'model': None,
+        'model_cached': False,
+        'highlights': highlights,
+        'images': found,
+        'references': sorted(references),
+        'variants': variant_dirs(plans),
+        'search': search,
+        'output_file': output_file,
+        'component_content': None,
+        'component_file': component_file,
+        'static_file': static_file,
+        'static_html': None,
+        'static_temp': static_temp,
+        'savings': None,
+        # Parsing is interleaved with rendering, so it is all counted as render time
+        'metrics': document_metrics(None, render_seconds, False, counts),
+        'index_entry': {
+            'slug': meta.get('slug', filename),
+            'component': component_name,
+            'meta': meta
+        }
+    }
+
+
+def main(argv=None):
     """Main function to generate all project pages"""
+    parser = argparse.ArgumentParser(description='Generate project pages from markdown')
+    parser.add_argument('--force', action='store_true',
+                        help='ignore the build manifest and rebuild every project')
+    add_jobs_argument(parser)
+    parser.add_argument('--stream', action='store_true',
+                        help='parse and render every project in bounded memory (automatic for very large files)')
+    parser.add_argument('--data-modules', action='store_true',
+                        help='emit a small data module per project, rendered by one shared ProjectPageView page')
+    parser.add_argument('--compact', action='store_true',
+                        help='emit minified page data with repeated strings hoisted, and report the bytes saved')
+    parser.add_argument('--highlight', action='store_true',
+                        help='syntax-highlight code blocks at build time (needs Pygments)')
+    parser.add_argument('--responsive-images', action='store_true',
+                        help='write resized WebP variants of local images and add srcset/sizes (needs Pillow)')
+    add_profile_arguments(parser)
+    add_trace_argument(parser)
+    add_metrics_arguments(parser)
+    args = parser.parse_args(argv)
+
+    with profiling('projects', args, globals(), PROFILE_STAGES), tracing(args, globals(), PROFILE_STAGES):
+        return build_project_pages(args)
+
+
+def build_project_pages(args):
+    """Generate the pages, index and listings of every project
+    
+    Returns 1 if a project failed to build or a size or time budget was exceeded.
+    """
     projects_dir = Path('assets/projects')
     pages_dir = Path('pages')
     components_dir = Path('components')
     
     if not projects_dir.exists():
         print("Error: assets/projects/ directory not found")
-        return
+        return 1
     
     if not pages_dir.exists():
         pages_dir.mkdir(exist_ok=True)
     
     # Get all markdown files, excluding documentation files
-    project_files = [
-        f for f in projects_dir.glob('*.md') 
-        if f.name.upper() not in ['README.MD', 'HOW-TO-ADD-PROJECTS.MD']
-    ]
+    project_files = find_project_files(projects_dir)
     
     if not project_files:
         print("No project markdown files found in assets/projects/ directory")
         return
     
-    generated_files = []
+    if args.highlight and code_highlight.pygments is None:
+        print("⚠ Pygments is not installed - code blocks are left to the browser highlighter")
+    if args.responsive_images and image_variants.Image is None:
+        print("⚠ Pillow is not installed - images are published without responsive variants")
+    
+    version = manifest_version(args.data_modules, args.compact, args.highlight, args.responsive_images)
+    manifest = load_manifest('projects', version, force=args.force)
+    index_outputs = [pages_dir / 'ProjectIndex.ts', components_dir / 'Projects.tsx',
+                     SEARCH_DIR / 'projects' / 'index.json', LISTINGS_DIR / 'projects' / 'index.json']
+    if args.data_modules:
+        index_outputs.append(pages_dir / 'ProjectPageView.tsx')
+    index_current = index_is_current(manifest, project_files)
+    metrics_outputs = [pages_dir / 'ProjectIndex.ts', components_dir / 'Projects.tsx']
     
+    # Unchanged projects reuse their recorded index entry without parsing
+    fresh_entries = {}
     for project_file in project_files:
-        try:
-            with open(project_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            # Parse project markdown
-            project_data = parse_project_markdown(content)
-            
-            # Generate component
-            filename = project_file.stem
-            component_name = ''.join([word.capitalize() for word in filename.replace('-', ' ').split()]) + 'Page'
-            component_content = generate_project_page_component(project_data, filename)
-            
-            # Write component file
-            output_file = pages_dir / f"{component_name}.tsx"
-            with open(output_file, 'w', encoding='utf-8') as f:
-                f.write(component_content)
-            
-            generated_files.append(f"pages/{component_name}.tsx")
-            print(f"✓ Generated {component_name}.tsx")
-            
-        except Exception as e:
-            print(f"✗ Error processing {{project_file}}: {{e}}")
-            continue
+        entry = lookup(manifest, project_file)
+        if entry and images_current(entry.get('images')):
+            fresh_entries[project_file] = entry['index_entry']
+    stale_files = [f for f in project_files if f not in fresh_entries]
     
-    # Generate project index
-    project_index = []
-    try:
-        index_content = generate_project_index()
-        index_file = pages_dir / "ProjectIndex.ts"
-        with open(index_file, 'w', encoding='utf-8') as f:
-            f.write(index_content)
-        print("✓ Generated ProjectIndex.ts")
+    outputs = start_outputs()
+    built_entries = {}
+    cached_models = 0
+    failed = 0
+    savings = []
+    
+    results = map_documents(profiled(build_project_page), stale_files, args.jobs, pages_dir,
+                            args.stream, args.data_modules, args.compact, args.highlight, args.responsive_images)
+    for project_file, result in profile_documents(results):
+        if 'error' in result:
+            print(f"✗ Error processing {project_file}: {result['error']}")
+            failed += 1
+            continue
         
-        # Parse the index to get project data for other components
-        # Read back the project files to get the full index
-        for project_file in project_files:
-            with open(project_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-            try:
-                project_data = parse_project_markdown(content)
-                meta = project_data['meta']
-                filename = project_file.stem
-                
-                # Ensure display flags have default values
-                if 'featuredOnHome' not in meta:
-                    meta['featuredOnHome'] = False
-                if 'featuredOnProjects' not in meta:
-                    meta['featuredOnProjects'] = False
-                if 'displayOrder' not in meta:
-                    meta['displayOrder'] = 999
-                    
-                project_index.append({
-                    'slug': meta.get('slug', filename),
-                    'meta': meta
-                })
-            except:
-                continue
-                
-    except Exception as e:
-        print(f"✗ Error generating project index: {e}")
+        output_file = result['output_file']
+        if result['component_file']:
+            changed = stage_file(outputs, output_file, result['component_file'])
+        else:
+            changed = stage_output(outputs, output_file, result['component_content'])
+        if changed:
+            print(f"✓ Generated {output_file.name}")
+        else:
+            print(f"✓ {output_file.name} unchanged")
+        stage_static_page(outputs, result)
+        if result['savings']:
+            savings.append((output_file, *result['savings']))
+        
+        built_entries[project_file] = result['index_entry']
+        cached_models += result['model_cached']
+        record(manifest, project_file, result['digest'], result['stat'], [output_file, result['static_file']],
+               index_entry=result['index_entry'], model=result['model'], highlights=result['highlights'],
+               images=result['images'], references=result['references'], variants=result['variants'],
+               search=result['search'], metrics=result['metrics'])
     
-    # Generate Projects.tsx component for HomePage
-    try:
-        projects_component = generate_projects_component(project_index)
-        projects_file = components_dir / "Projects.tsx"
-        with open(projects_file, 'w', encoding='utf-8') as f:
-            f.write(projects_component)
-        print("✓ Generated Projects.tsx component")
-    except Exception as e:
-        print(f"✗ Error generating Projects component: {e}")
+    if fresh_entries:
+        print(f"✓ Skipped {len(fresh_entries)} unchanged projects")
+    if cached_models:
+        print(f"✓ Loaded {cached_models} parsed projects from the parse cache")
+    
+    # Merge fresh and rebuilt entries back in file order (projects that failed are left out)
+    indexed_files = [f for f in project_files if f in fresh_entries or f in built_entries]
+    project_index = [fresh_entries.get(f) or built_entries[f] for f in indexed_files]
+    
+    if built_entries or not index_current:
+        savings += stage_project_listings(project_index, pages_dir, components_dir, outputs,
+                                          args.data_modules, args.compact)
+        stage_search_outputs(project_index, search_keys(manifest, indexed_files), outputs)
+    else:
+        print("✓ ProjectIndex.ts and Projects.tsx are up to date")
+    
+    # Pages of deleted projects, removed before save_manifest forgets them
+    for output in removed_outputs(manifest, project_files):
+        stage_removal(outputs, output)
+    
+    # Commit all changed outputs together, then record their stats
+    changed = commit_outputs(outputs)
+    report_outputs(changed, outputs)
+    report_savings(savings)
+    within_budget = write_metrics('projects', manifest, project_files, metrics_outputs, args.budgets)
+    save_manifest(manifest, project_files, index_outputs)
+    evict_models('projects', manifest)
+    evict_models('projects-code', manifest, 'highlights')
+    evict_models('projects-search', manifest, 'search')
+    image_dimensions.save_index(manifest)
     
-    print(f"\n✅ Project generation complete! Generated {len(generated_files)} files:")
-    for file in generated_files:
+    print(f"\n✅ Project generation complete! Generated {len(changed)} files:")
+    for file in changed:
         print(f"  - {file}")
+    if not within_budget:
+        print(f"✗ Project build is over budget (see {args.budgets})")
+    if failed:
+        print(f"✗ {failed} of {len(stale_files)} changed projects failed to build")
+    if failed or not within_budget:
+        return 1
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    sys.exit(main())
\ No newline at end of file
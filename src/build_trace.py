@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+Build Trace - Trace-event timeline of a build, for chrome://tracing or Perfetto
+Used by: buildblog.py, build_projects.py, build.py, build_all.py (--trace FILE),
+         parallel_build.py, build_manifest.py, parse_cache.py, output_writer.py
+
+With --trace FILE the build is written to FILE as Chrome trace events (load it
+in chrome://tracing or https://ui.perfetto.dev). Every document is a span on
+the process that built it, holding spans for reading the file, its
+parse_*_markdown call and generating its component. The main process adds
+staging and writing every output and generating the indexes, listings and
+search shards; build_all.py adds a span per stage. Spans carry the file, the
+worker (process id) and byte counts, so the critical path of a --jobs build
+and workers sitting idle show up directly on the timeline.
+
+Reads, parses and writes are traced where they happen (read_source, load_model,
+the output writer). Component and index generation are the functions of a
+generator's PROFILE_STAGES in TRACED_STAGES, wrapped only while tracing.
+Worker processes hand their events back with each result and map_documents
+merges them; time.perf_counter is the same monotonic clock in every process.
+"""
+
+import functools
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+
+# Stages of PROFILE_STAGES traced as spans (styled-text would add a span per paragraph)
+TRACED_STAGES = ('render', 'index')
+
+# The trace in progress in this process, or None
+_trace = None
+
+# The document being built by the current thread
+_local = threading.local()
+
+
+def add_trace_argument(parser):
+    """Add the shared --trace option to an argparse parser"""
+    parser.add_argument('--trace', metavar='FILE',
+                        help='write a trace-event timeline of the build to FILE (chrome://tracing, Perfetto)')
+
+
+def _now():
+    return time.perf_counter_ns() / 1000
+
+
+@contextmanager
+def trace_span(name, category, **args):
+    """Record the block as a span; yields its args, which the block may add to"""
+    if _trace is None:
+        yield args
+        return
+
+    document = getattr(_local, 'document', None)
+    if document is not None:
+        args.setdefault('file', document)
+    args['worker'] = os.getpid()
+    start = _now()
+    try:
+        yield args
+    finally:
+        _trace['events'].append({
+            'name': name, 'cat': category, 'ph': 'X', 'ts': start, 'dur': _now() - start,
+            'pid': os.getpid(), 'tid': threading.get_native_id(), 'args': args,
+        })
+
+
+def _traced(function, category):
+    @functools.wraps(function)
+    def traced(*args, **kwargs):
+        with trace_span(function.__name__, category) as span:
+            result = function(*args, **kwargs)
+            if _trace is not None and isinstance(result, str):
+                span['bytes'] = len(result.encode('utf-8'))
+            return result
+    traced.traced_stage = category
+    return traced
+
+
+def _install(namespace, stages):
+    """Wrap the traced stages of a namespace, returning the original functions"""
+    originals = {}
+    for function, stage in stages.items():
+        if stage in TRACED_STAGES and not hasattr(namespace[function], 'traced_stage'):
+            originals[function] = namespace[function]
+            namespace[function] = _traced(originals[function], stage)
+    return originals
+
+
+@contextmanager
+def tracing(args, namespace, stages):
+    """Trace the build inside the block if args.trace is set, then write the trace file
+
+    namespace is the globals() of the generator and stages its PROFILE_STAGES.
+    Inside a build that is already traced (build_all.py) the generator joins
+    that timeline instead of writing its own.
+    """
+    global _trace
+    owner = _trace is None and getattr(args, 'trace', None)
+    if _trace is None and not owner:
+        yield
+        return
+
+    if owner:
+        _trace = {'pid': os.getpid(), 'events': [], 'stages': {}}
+    _trace['stages'][namespace['__name__']] = stages
+    originals = _install(namespace, stages)
+    try:
+        yield
+    finally:
+        namespace.update(originals)
+        if owner:
+            trace, _trace = _trace, None
+            write_trace(args.trace, trace)
+
+
+def traced_worker(worker):
+    """Wrap a worker(file, *args) to trace each document it builds, if tracing
+
+    The wrapper can be pickled, so it also runs in map_documents' worker processes.
+    """
+    if _trace is None:
+        return worker
+    return functools.partial(_traced_call, worker, _trace['stages'].get(worker.__module__, {}))
+
+
+def _traced_call(worker, stages, file, *args):
+    global _trace
+    if _trace is None or _trace['pid'] != os.getpid():
+        # First document of a worker process: start its own trace
+        _trace = {'pid': os.getpid(), 'events': [], 'stages': {}, 'worker': True}
+        _install(worker.__globals__, stages)
+
+    _local.document = str(file)
+    try:
+        with trace_span(Path(file).name, 'document', bytes=Path(file).stat().st_size):
+            result = worker(file, *args)
+    finally:
+        _local.document = None
+
+    if _trace.get('worker') and isinstance(result, dict):
+        result['trace'] = _trace['events']
+        _trace['events'] = []
+    return result
+
+
+def merge_trace(result):
+    """Move the trace events a worker process returned with result into this trace"""
+    events = result.pop('trace', None) if isinstance(result, dict) else None
+    if events and _trace is not None:
+        _trace['events'] += events
+    return result
+
+
+def write_trace(trace_file, trace):
+    """Write the events as a trace-event JSON file, with named processes"""
+    events = trace['events']
+    start = min((event['ts'] for event in events), default=0)
+    for event in events:
+        event['ts'] = round(event['ts'] - start, 3)
+        event['dur'] = round(event['dur'], 3)
+
+    pids = sorted({event['pid'] for event in events} | {trace['pid']})
+    names = [{'name': 'process_name', 'ph': 'M', 'pid': pid, 'tid': 0,
+              'args': {'name': 'build' if pid == trace['pid'] else f'worker {pid}'}} for pid in pids]
+    names += [{'name': 'process_sort_index', 'ph': 'M', 'pid': pid, 'tid': 0,
+               'args': {'sort_index': 0 if pid == trace['pid'] else 1}} for pid in pids]
+
+    trace_file = Path(trace_file)
+    trace_file.parent.mkdir(parents=True, exist_ok=True)
+    trace_file.write_text(json.dumps({'traceEvents': names + events, 'displayTimeUnit': 'ms'}), encoding='utf-8')
+    print(f"✓ Wrote build trace to {trace_file} ({len(events)} spans, {len(pids) - 1} worker processes)")
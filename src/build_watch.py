@@ -0,0 +1,368 @@
+#!/usr/bin/env python3
+"""
+Build Watch - Regenerate only the affected outputs while markdown is edited
+Used by: python build_watch.py (run from src/, instead of the three build scripts)
+
+After one normal incremental run of buildblog.py, build_projects.py and build.py
+the watcher keeps every post's and project's index entry in memory and watches
+assets/blogs, assets/projects, home.md and global.md. A saved file is re-parsed
+on its own: its page is re-rendered, and BlogIndex.ts/Blogs.tsx or
+ProjectIndex.ts/Projects.tsx are only regenerated when its index entry (slug or
+meta) changed or a file was added or removed. The build manifests are kept up
+to date, so a later plain run of the scripts still skips everything.
+
+Changes are picked up by polling (no extra dependencies). If the optional
+watchdog package is installed, filesystem events wake the watcher immediately.
+"""
+
+import argparse
+import threading
+import time
+from pathlib import Path
+
+import build
+import buildblog
+import build_projects
+from build_manifest import load_manifest, record, removed_outputs, save_manifest
+from parse_cache import evict_models
+import image_dimensions
+from search_index import SEARCH_DIR
+from listing_shards import LISTINGS_DIR
+from output_writer import start_outputs, stage_output, stage_file, stage_removal, commit_outputs, report_outputs
+from static_pages import stage_static_page
+
+try:
+    from watchdog.observers import Observer
+    from watchdog.events import FileSystemEventHandler
+except ImportError:
+    Observer = None
+
+
+BLOGS_DIR = Path('assets/blogs')
+PROJECTS_DIR = Path('assets/projects')
+HOME_FILE = Path('home.md')
+GLOBAL_FILE = Path('global.md')
+PAGES_DIR = Path('pages')
+COMPONENTS_DIR = Path('components')
+
+# Seconds between polls; with watchdog running polling is only a safety net
+POLL_INTERVAL = 0.05
+EVENT_POLL_INTERVAL = 1.0
+
+# Editors often write a file in several steps; wait this long before reading it
+SETTLE_DELAY = 0.02
+
+
+def load_documents(data_modules=False, compact=False, highlight=False, images=False):
+    """Load the in-memory document state from the manifests of the initial build"""
+    blog_manifest = load_manifest('blog', buildblog.manifest_version(data_modules, compact, highlight, images))
+    project_manifest = load_manifest('projects', build_projects.manifest_version(data_modules, compact, highlight, images))
+    return {
+        'blog': {
+            'manifest': blog_manifest,
+            'entries': {Path(key): entry['index_entry'] for key, entry in blog_manifest['entries'].items()},
+            'data_modules': data_modules,
+            'compact': compact,
+            'highlight': highlight,
+            'images': images,
+        },
+        'projects': {
+            'manifest': project_manifest,
+            'entries': {Path(key): entry['index_entry'] for key, entry in project_manifest['entries'].items()},
+            'data_modules': data_modules,
+            'compact': compact,
+            'highlight': highlight,
+            'images': images,
+        },
+        'home': {
+            'manifest': load_manifest('home', build.GENERATOR_VERSION),
+        },
+    }
+
+
+def snapshot():
+    """Return {path: (size, mtime_ns)} for every watched source file"""
+    sources = buildblog.find_blog_files(BLOGS_DIR) if BLOGS_DIR.exists() else []
+    if PROJECTS_DIR.exists():
+        sources += build_projects.find_project_files(PROJECTS_DIR)
+    sources += [HOME_FILE, GLOBAL_FILE]
+
+    stats = {}
+    for source in sources:
+        try:
+            stat = source.stat()
+        except OSError:
+            continue
+        stats[source] = (stat.st_size, stat.st_mtime_ns)
+    return stats
+
+
+def live_sources(documents, removed):
+    """The recorded sources of a collection other than a removed one"""
+    return [key for key in documents['manifest']['entries'] if key != str(removed)]
+
+
+def update_blog(documents, changed, outputs):
+    """Rebuild changed posts, the blog listings if any index entry changed, the search index and related links
+
+    A deleted post's page and static page are removed along with its index entry;
+    stage_blog_listings also prunes static pages that no longer belong to a post.
+    The search index and the related post links are restaged together by
+    buildblog.stage_search_outputs.
+    """
+    entries = documents['entries']
+    listings_changed = False
+    search_changed = False
+
+    for blog_file in changed:
+        if not blog_file.exists():
+            for output in removed_outputs(documents['manifest'], live_sources(documents, blog_file)):
+                stage_removal(outputs, output)
+            if entries.pop(blog_file, None) is not None:
+                print(f"✓ Removed {blog_file.name} from the blog index")
+                listings_changed = True
+                search_changed = True
+            continue
+
+        result = buildblog.build_blog_post(blog_file, PAGES_DIR, False, documents['data_modules'],
+                                           documents['compact'], documents['highlight'], documents['images'])
+        if 'error' in result:
+            print(f"✗ Error processing {blog_file.name}: {result['error']}")
+            continue
+
+        output_file = result['output_file']
+        if output_file:
+            if result['component_file']:
+                changed = stage_file(outputs, output_file, result['component_file'])
+            else:
+                changed = stage_output(outputs, output_file, result['component_code'])
+            if changed:
+                print(f"✓ Generated {output_file.name}")
+            else:
+                print(f"✓ {output_file.name} unchanged")
+            stage_static_page(outputs, result)
+
+        record(documents['manifest'], blog_file, result['digest'], result['stat'],
+               [output_file, result['static_file']] if output_file else [], index_entry=result['index_entry'],
+               model=result['model'], highlights=result['highlights'], images=result['images'],
+               references=result['references'], variants=result['variants'], search=result['search'])
+        search_changed = True
+        if entries.get(blog_file) != result['index_entry']:
+            listings_changed = True
+        entries[blog_file] = result['index_entry']
+
+    if listings_changed:
+        blog_index = [entries[f] for f in sorted(entries)]
+        buildblog.stage_blog_listings(blog_index, PAGES_DIR, COMPONENTS_DIR, outputs,
+                                      documents['data_modules'], documents['compact'])
+    if search_changed:
+        blog_files = sorted(entries)
+        buildblog.stage_search_outputs([entries[f] for f in blog_files],
+                                       buildblog.search_keys(documents['manifest'], blog_files), outputs)
+
+
+def update_projects(documents, changed, outputs):
+    """Rebuild changed projects, the project listings if any index entry changed, the search index and related links
+
+    A deleted project's page and static page are removed along with its index entry;
+    stage_project_listings also prunes static pages that no longer belong to a project.
+    The search index and the related project links are restaged together by
+    build_projects.stage_search_outputs.
+    """
+    entries = documents['entries']
+    listings_changed = False
+    search_changed = False
+
+    for project_file in changed:
+        if not project_file.exists():
+            for output in removed_outputs(documents['manifest'], live_sources(documents, project_file)):
+                stage_removal(outputs, output)
+            if entries.pop(project_file, None) is not None:
+                print(f"✓ Removed {project_file.name} from the project index")
+                listings_changed = True
+                search_changed = True
+            continue
+
+        result = build_projects.build_project_page(project_file, PAGES_DIR, False, documents['data_modules'],
+                                                   documents['compact'], documents['highlight'], documents['images'])
+        if 'error' in result:
+            print(f"✗ Error processing {project_file}: {result['error']}")
+            continue
+
+        output_file = result['output_file']
+        if result['component_file']:
+            changed = stage_file(outputs, output_file, result['component_file'])
+        else:
+            changed = stage_output(outputs, output_file, result['component_content'])
+        if changed:
+            print(f"✓ Generated {output_file.name}")
+        else:
+            print(f"✓ {output_file.name} unchanged")
+        stage_static_page(outputs, result)
+
+        record(documents['manifest'], project_file, result['digest'], result['stat'],
+               [output_file, result['static_file']],
+               index_entry=result['index_entry'], model=result['model'], highlights=result['highlights'],
+               images=result['images'], references=result['references'], variants=result['variants'],
+               search=result['search'])
+        search_changed = True
+        if entries.get(project_file) != result['index_entry']:
+            listings_changed = True
+        entries[project_file] = result['index_entry']
+
+    if listings_changed:
+        project_index = [entries[f] for f in sorted(entries)]
+        build_projects.stage_project_listings(project_index, PAGES_DIR, COMPONENTS_DIR, outputs,
+                                             documents['data_modules'], documents['compact'])
+    if search_changed:
+        project_files = sorted(entries)
+        build_projects.stage_search_outputs([entries[f] for f in project_files],
+                                            build_projects.search_keys(documents['manifest'], project_files),
+                                            outputs)
+
+
+def update_home(documents, changed, outputs):
+    """Regenerate Hero/Timeline and Header/Footer for a changed home.md or global.md"""
+    for md_file, build_file in ((HOME_FILE, build.build_home), (GLOBAL_FILE, build.build_global)):
+        if md_file not in changed:
+            continue
+        if not md_file.exists():
+            print(f"⚠ {md_file} was removed - its components were left as they are")
+            continue
+        try:
+            result = build_file(md_file, outputs)
+        except Exception as e:
+            print(f"✗ Error processing {md_file}: {e}")
+            continue
+        record(documents['manifest'], md_file, result['digest'], result['stat'], result['output_files'],
+               model=result['model'])
+
+
+def rebuild(documents, changed):
+    """Regenerate the outputs that depend on the changed source files"""
+    started = time.perf_counter()
+    outputs = start_outputs()
+
+    blog_changed = sorted(f for f in changed if f.parent == BLOGS_DIR)
+    project_changed = sorted(f for f in changed if f.parent == PROJECTS_DIR)
+
+    if blog_changed:
+        update_blog(documents['blog'], blog_changed, outputs)
+    if project_changed:
+        update_projects(documents['projects'], project_changed, outputs)
+    if HOME_FILE in changed or GLOBAL_FILE in changed:
+        update_home(documents['home'], changed, outputs)
+
+    changed_outputs = commit_outputs(outputs)
+    report_outputs(changed_outputs, outputs)
+
+    # Keep the manifests in step so the next plain build skips these files too
+    if blog_changed:
+        index_outputs = [PAGES_DIR / 'BlogIndex.ts', COMPONENTS_DIR / 'Blogs.tsx', SEARCH_DIR / 'blog' / 'index.json',
+                         LISTINGS_DIR / 'blog' / 'index.json']
+        if documents['blog']['data_modules']:
+            index_outputs.append(PAGES_DIR / 'BlogPostView.tsx')
+        save_manifest(documents['blog']['manifest'], sorted(documents['blog']['entries']), index_outputs)
+        evict_models('blog', documents['blog']['manifest'])
+        evict_models('blog-code', documents['blog']['manifest'], 'highlights')
+        evict_models('blog-search', documents['blog']['manifest'], 'search')
+        image_dimensions.save_index(documents['blog']['manifest'])
+    if project_changed:
+        index_outputs = [PAGES_DIR / 'ProjectIndex.ts', COMPONENTS_DIR / 'Projects.tsx',
+                         SEARCH_DIR / 'projects' / 'index.json', LISTINGS_DIR / 'projects' / 'index.json']
+        if documents['projects']['data_modules']:
+            index_outputs.append(PAGES_DIR / 'ProjectPageView.tsx')
+        save_manifest(documents['projects']['manifest'], sorted(documents['projects']['entries']), index_outputs)
+        evict_models('projects', documents['projects']['manifest'])
+        evict_models('projects-code', documents['projects']['manifest'], 'highlights')
+        evict_models('projects-search', documents['projects']['manifest'], 'search')
+        image_dimensions.save_index(documents['projects']['manifest'])
+    if HOME_FILE in changed or GLOBAL_FILE in changed:
+        save_manifest(documents['home']['manifest'], [f for f in (HOME_FILE, GLOBAL_FILE) if f.exists()])
+        evict_models('home', documents['home']['manifest'])
+
+    print(f"✅ Rebuilt in {(time.perf_counter() - started) * 1000:.0f} ms")
+
+
+def start_observer(wake):
+    """Wake the poll loop on filesystem events when watchdog is available"""
+    if Observer is None:
+        return None
+
+    handler = FileSystemEventHandler()
+    handler.on_any_event = lambda event: wake.set()
+    observer = Observer()
+    for directory in (BLOGS_DIR, PROJECTS_DIR, Path('.')):
+        if directory.exists():
+            observer.schedule(handler, str(directory), recursive=False)
+    observer.daemon = True
+    observer.start()
+    return observer
+
+
+def watch(interval=POLL_INTERVAL, data_modules=False, compact=False, highlight=False, images=False):
+    """Poll the sources forever, rebuilding whatever changed"""
+    documents = load_documents(data_modules, compact, highlight, images)
+    wake = threading.Event()
+    observer = start_observer(wake)
+    if observer:
+        interval = max(interval, EVENT_POLL_INTERVAL)
+        print("👀 Watching for changes (filesystem events)... press Ctrl+C to stop")
+    else:
+        print(f"👀 Watching for changes (polling every {interval * 1000:.0f} ms)... press Ctrl+C to stop")
+
+    previous = snapshot()
+    try:
+        while True:
+            wake.wait(interval)
+            wake.clear()
+            current = snapshot()
+            if current == previous:
+                continue
+
+            time.sleep(SETTLE_DELAY)
+            current = snapshot()
+            changed = {f for f in current.keys() | previous.keys() if current.get(f) != previous.get(f)}
+            previous = current
+
+            print(f"\n↻ Changed: {', '.join(sorted(f.name for f in changed))}")
+            rebuild(documents, changed)
+    except KeyboardInterrupt:
+        print("\nStopped watching.")
+    finally:
+        if observer:
+            observer.stop()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Watch the markdown sources and regenerate affected components')
+    parser.add_argument('--interval', type=float, default=POLL_INTERVAL, metavar='SECONDS',
+                        help='polling interval when watchdog is not installed (default: 0.05)')
+    parser.add_argument('--data-modules', action='store_true',
+                        help='emit per-document data modules instead of full pages (see buildblog.py)')
+    parser.add_argument('--compact', action='store_true',
+                        help='emit minified page data (see buildblog.py)')
+    parser.add_argument('--highlight', action='store_true',
+                        help='syntax-highlight code blocks at build time (see buildblog.py)')
+    parser.add_argument('--responsive-images', action='store_true',
+                        help='write resized WebP variants of images and add srcset (see buildblog.py)')
+    args = parser.parse_args(argv)
+
+    if not Path('home.md').exists() and not BLOGS_DIR.exists():
+        print("Error: run build_watch.py from the src/ directory")
+        return
+
+    # Bring everything up to date once, then only touch what changes
+    mode = [flag for flag, enabled in (('--data-modules', args.data_modules), ('--compact', args.compact),
+                                       ('--highlight', args.highlight),
+                                       ('--responsive-images', args.responsive_images)) if enabled]
+    buildblog.main(mode)
+    build_projects.main(mode)
+    build.main([])
+
+    print()
+    watch(args.interval, args.data_modules, args.compact, args.highlight, args.responsive_images)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,14 +1,94 @@
 #!/usr/bin/env python3
 """
 Blog Generator - Converts blog markdown files to React components
-Usage: python buildblog.py
+Usage: python buildblog.py [--force] [--jobs N] [--stream] [--data-modules] [--compact] [--highlight] [--responsive-images]
+                           [--profile] [--trace-memory] [--trace FILE] [--budgets FILE]
 """
 
 import re
-import json
+import argparse
+import hashlib
+import sys
+import time
 from pathlib import Path
 import os
 
+import inline_markup
+from inline_markup import render_inline
+from build_manifest import (
+    generator_version, content_digest, load_manifest, read_source, lookup, record,
+    index_is_current, removed_outputs, save_manifest,
+)
+from parse_cache import parser_version, load_model, evict_models
+import output_writer
+from output_writer import (
+    start_outputs, stage_output, stage_file, stage_removal, write_temporary, commit_outputs,
+    report_outputs,
+)
+import stream_build
+from stream_build import (
+    split_lines, read_lines, collect_document, spill_document, iter_spilled, stream_page, should_stream,
+)
+from parallel_build import add_jobs_argument, map_documents
+from build_profile import add_profile_arguments, profiling, profiled, profile_documents
+from build_trace import add_trace_argument, tracing
+from build_metrics import add_metrics_arguments, block_counts, iter_counted, document_metrics, write_metrics
+import compact_json
+from compact_json import dumps, hoist_strings, string_constants, output_bytes, report_savings
+import code_highlight
+from code_highlight import HIGHLIGHT_VERSION, highlight_blocks, iter_highlighted
+import image_variants
+from image_variants import IMAGES_VERSION, add_responsive_images, iter_responsive, variant_dirs, write_variants
+import image_dimensions
+from image_dimensions import add_dimensions, iter_dimensions, images_current
+from asset_sync import add_references, iter_references
+import search_index
+from search_index import (SEARCH_DIR, document_terms, cached_terms, start_terms, add_meta,
+                          iter_search_terms, store_terms, stage_search_index)
+import listing_shards
+from listing_shards import LISTINGS_DIR, display_order, is_active, stage_listings
+import related_docs
+from related_docs import stage_related
+import static_pages
+from static_pages import (static_page_file, render_static_page, write_static_page, stage_static_page,
+                          prune_static_pages)
+
+
+# Version of the parser and templates; any edit to them invalidates the build manifest
+GENERATOR_VERSION = generator_version(__file__, inline_markup.__file__, image_dimensions.__file__,
+                                      listing_shards.__file__, related_docs.__file__, static_pages.__file__,
+                                      compact_json.__file__, stream_build.__file__, search_index.__file__,
+                                      output_writer.__file__)
+
+# Card image of posts without a hero image on BlogPage
+LISTING_IMAGE = 'https://images.unsplash.com/photo-1628017973088-8feb5de8dddd?crop=entropy&cs=tinysrgb&fit=max&fm=jpg&w=1080'
+
+# Functions timed as build stages by --profile and --trace-memory (see build_profile.py)
+PROFILE_STAGES = {
+    'load_model': 'parse',
+    'parse_styled_text': 'styled-text',
+    'highlight_blocks': 'render',
+    'render_blog_post': 'render',
+    'render_static_page': 'render',
+    'write_temporary': 'render',
+    'write_static_page': 'render',
+    'stage_blog_listings': 'index',
+    'stage_search_outputs': 'index',
+    'stage_output': 'write',
+    'stage_file': 'write',
+    'commit_outputs': 'write',
+}
+
+
+def manifest_version(data_modules=False, compact=False, highlight=False, images=False):
+    """Manifest version for an output mode, so switching modes rebuilds every post"""
+    version = GENERATOR_VERSION + ('-data' if data_modules else '') + ('-compact' if compact else '')
+    if highlight and HIGHLIGHT_VERSION:
+        version += f'-highlight-{HIGHLIGHT_VERSION}'
+    if images and image_variants.Image:
+        version += f'-images-{IMAGES_VERSION}'
+    return version
+
 
 def parse_styled_text(text):
     """Parse text for orange styling and links
@@ -20,88 +100,31 @@ def parse_styled_text(text):
     - [link](url) - Regular external link
     - [orange-link](url) - Orange external link
     """
-    if not text:
-        return text
-    
-    # Replace **bold** with bold styled span (must be before *italic* to avoid conflicts)
-    text = re.sub(r'\*\*(.*?)\*\*', r"<strong>\1</strong>", text)
-    
-    # Replace *italic* with italic styled span - but avoid matching underscores in code like __init__
-    # Only match single asterisks around words, not underscores
-    text = re.sub(r'(?<!\*)\*([^\*]+?)\*(?!\*)', r"<em>\1</em>", text)
-    
-    # Handle [dev](url) - route through development page
-    # Format: [dev](url) where url is the link to send to dev page
-    text = re.sub(
-        r'\[dev\]\(([^)]+)\)',
-        lambda m: f"<a href='#/development?demo={m.group(1)}' style='color: #ff6b3d; text-decoration: underline;'>View Resource</a>",
-        text
-    )
-    
-    # Protect markdown links before processing underscores
-    # This prevents underscores in URLs from being converted to italics
-    link_placeholder_map = {}
-    link_counter = [0]
-    
-    def protect_link(match):
-        link_counter[0] += 1
-        # Use a placeholder WITHOUT underscores to avoid getting italicized
-        placeholder = f"LINKPLACEHOLDER{link_counter[0]}"
-        link_placeholder_map[placeholder] = match.group(0)
-        return placeholder
-    
-    # Temporarily replace markdown links [text](url) with placeholders
-    text = re.sub(r'\[([^\]]+)\]\(([^)]+)\)', protect_link, text)
-    
-    # Now safely apply underscore italic formatting without affecting URLs
-    text = re.sub(r'(?<!_)_([^_]+?)_(?!_)', r"<em>\1</em>", text)
-    
-    # Restore the links and convert them to HTML
-    for placeholder, original_link in link_placeholder_map.items():
-        # Parse the markdown link [text](url)
-        link_match = re.match(r'\[([^\]]+)\]\(([^)]+)\)', original_link)
-        if link_match:
-            link_text = link_match.group(1)
-            link_url = link_match.group(2)
-            # Convert to HTML link
-            html_link = f"<a href='{link_url}' target='_blank' rel='noopener noreferrer' style='color: #ff6b3d; text-decoration: underline;'>{link_text}</a>"
-            text = text.replace(placeholder, html_link)
-    
-    # Replace [orange](text) with orange styled span
-    text = re.sub(r'\[orange\]\((.*?)\)', r"<span style='color: #ff6b3d;'>\1</span>", text)
-    
-    # Replace [comment](text) with comment-style text
-    text = re.sub(r'\[comment\]\((.*?)\)', r"<span className='font-mono text-muted-foreground text-sm'>// \1</span>", text)
-    
-    # Replace [link](url) with regular links
-    text = re.sub(r'\[link\]\((.*?)\)', r"<a href='\1' target='_blank' rel='noopener noreferrer' style='text-decoration: underline;'>\1</a>", text)
-    
-    # Replace [orange-link](url) with orange styled links
-    text = re.sub(r'\[orange-link\]\((.*?)\)', r"<a href='\1' target='_blank' rel='noopener noreferrer' style='color: #ff6b3d; text-decoration: underline;'>\1</a>", text)
-    
-    return text
+    return render_inline(text)
 
 
 def parse_blog_markdown(content):
     """Parse blog markdown file"""
-    lines = content.split('\n')
-    i = 0
-    
-    # Initialize blog data
-    blog_data = {
-        'meta': {},
-        'toc': [],
-        'content_blocks': []
-    }
+    return collect_document(iter_blog_markdown(content.split('\n')))
+
+
+def iter_blog_markdown(lines):
+    """Parse blog markdown from an iterable of lines, yielding events as they complete
+    
+    Yields ('meta', key, value), ('toc', item) and ('block', block) tuples.
+    Lines may still end in a newline (e.g. when iterating over an open file).
+    """
+    lines = split_lines(lines)
+    raw = next(lines, None)
     
-    while i < len(lines):
-        line = lines[i].strip()
+    while raw is not None:
+        line = raw.strip()
         
         # Parse META section
         if line == '---META---':
-            i += 1
-            while i < len(lines) and not lines[i].strip().startswith('---'):
-                meta_line = lines[i].strip()
+            raw = next(lines, None)
+            while raw is not None and not raw.strip().startswith('---'):
+                meta_line = raw.strip()
                 if ':' in meta_line:
                     key, value = meta_line.split(':', 1)
                     key = key.strip()
@@ -109,31 +132,31 @@ def parse_blog_markdown(content):
                     
                     # Handle arrays
                     if key == 'tags':
-                        blog_data['meta'][key] = [tag.strip() for tag in value.split(',')]
+                        yield 'meta', key, [tag.strip() for tag in value.split(',')]
                     # Handle booleans
                     elif value.lower() in ['true', 'false']:
-                        blog_data['meta'][key] = value.lower() == 'true'
+                        yield 'meta', key, value.lower() == 'true'
                     # Handle numbers
                     elif value.isdigit():
-                        blog_data['meta'][key] = int(value)
+                        yield 'meta', key, int(value)
                     else:
-                        blog_data['meta'][key] = value
-                i += 1
+                        yield 'meta', key, value
+                raw = next(lines, None)
         
         # Parse TOC section
         elif line == '---TOC---':
-            i += 1
-            while i < len(lines) and not lines[i].strip().startswith('---'):
-                toc_line = lines[i].strip()
+            raw = next(lines, None)
+            while raw is not None and not raw.strip().startswith('---'):
+                toc_line = raw.strip()
                 if toc_line.startswith('-'):
                     toc_parts = toc_line[1:].strip().split('|')
                     if len(toc_parts) >= 3:
-                        blog_data['toc'].append({
+                        yield 'toc', {
                             'title': toc_parts[0].strip(),
                             'id': toc_parts[1].strip(),
                             'level': int(toc_parts[2].strip())
-                        })
-                i += 1
+                        }
+                raw = next(lines, None)
         
         # Parse content sections
         elif line.startswith('##') or line.startswith('###'):
@@ -155,29 +178,29 @@ def parse_blog_markdown(content):
                 else:
                     content_type = 'heading3'
                 
-                blog_data['content_blocks'].append({
+                yield 'block', {
                     'type': content_type,
                     'id': heading_id,
                     'content': title
-                })
-            i += 1
-            continue  # Skip the final i += 1 at the end of the loop
+                }
+            raw = next(lines, None)
+            continue  # Skip the final advance at the end of the loop
             
         # Parse paragraphs
         elif line and not line.startswith(('#', '>', '```', '![', '---')):
             paragraph_lines = [line]
-            i += 1
+            raw = next(lines, None)
             # Collect continuation lines
-            while i < len(lines) and lines[i].strip() and not lines[i].strip().startswith(('#', '>', '```', '![', '---')):
-                paragraph_lines.append(lines[i].strip())
-                i += 1
+            while raw is not None and raw.strip() and not raw.strip().startswith(('#', '>', '```', '![', '---')):
+                paragraph_lines.append(raw.strip())
+                raw = next(lines, None)
             
             content = ' '.join(paragraph_lines)
-            blog_data['content_blocks'].append({
+            yield 'block', {
                 'type': 'paragraph',
                 'content': parse_styled_text(content)
-            })
-            i -= 1  # Back up one since we advanced
+            }
+            continue  # The line that ended the paragraph is parsed next
         
         # Parse quotes
         elif line.startswith('>'):
@@ -185,38 +208,38 @@ def parse_blog_markdown(content):
             author = None
             
             # Collect quote lines
-            while i < len(lines) and lines[i].strip().startswith('>'):
-                quote_line = lines[i].strip()[1:].strip()
+            while raw is not None and raw.strip().startswith('>'):
+                quote_line = raw.strip()[1:].strip()
                 if quote_line.startswith('-'):
                     author = quote_line[1:].strip()
                 else:
                     quote_lines.append(quote_line)
-                i += 1
+                raw = next(lines, None)
             
             if quote_lines:
-                blog_data['content_blocks'].append({
+                yield 'block', {
                     'type': 'quote',
                     'content': parse_styled_text(' '.join(quote_lines)),
                     'author': author
-                })
-            continue  # Skip the final i += 1 at the end of the loop
+                }
+            continue  # Skip the final advance at the end of the loop
         
         # Parse code blocks
         elif line.startswith('```'):
             language = line[3:].strip() or 'text'
-            i += 1
+            raw = next(lines, None)
             code_lines = []
             
-            while i < len(lines) and not lines[i].strip().startswith('```'):
-                code_lines.append(lines[i])
-                i += 1
+            while raw is not None and not raw.strip().startswith('```'):
+                code_lines.append(raw)
+                raw = next(lines, None)
             
-            blog_data['content_blocks'].append({
+            yield 'block', {
                 'type': 'code',
                 'language': language,
                 'content': '\n'.join(code_lines)
-            })
-            continue  # Skip the final i += 1 at the end of the loop
+            }
+            continue  # Skip the final advance at the end of the loop
         
         # Parse images
         elif line.startswith('!['):
@@ -236,156 +259,119 @@ def parse_blog_markdown(content):
                 if width:
                     block['width'] = width
                 
-                blog_data['content_blocks'].append(block)
+                yield 'block', block
         
-        i += 1
-    
-    return blog_data
+        raw = next(lines, None)
 
 
-def generate_blog_post_component(blog_data, blog_slug):
-    """Generate BlogPostPage component from blog data"""
-    meta = blog_data['meta']
-    toc = blog_data['toc']
-    content_blocks = blog_data['content_blocks']
-    
-    # Convert content blocks to TSX format
-    content_blocks_tsx = []
-    for block in content_blocks:
-        block_tsx = {
-            'type': block['type'],
-            'content': block.get('content', '')
-        }
-        
-        # Add additional fields based on block type
-        if 'id' in block:
-            block_tsx['id'] = block['id']
-        if 'author' in block:
-            block_tsx['author'] = block['author']
-        if 'language' in block:
-            block_tsx['language'] = block['language']
-        if 'alt' in block:
-            block_tsx['alt'] = block['alt']
-        if 'width' in block:
-            block_tsx['width'] = block['width']
-        
-        content_blocks_tsx.append(block_tsx)
-    
-    # Generate JSON for the component
-    meta_json = json.dumps(meta, indent=4)
-    toc_json = json.dumps(toc, indent=4)
-    content_json = json.dumps(content_blocks_tsx, indent=4)
-    
-    component_name = ''.join(word.capitalize() for word in blog_slug.split('-')) + 'Page'
-    
-    return f'''import {{ ArrowLeft, Calendar, Clock }} from "lucide-react";
-import {{ Header }} from "../components/Header";
-import {{ Footer }} from "../components/Footer";
-import {{ ImageWithFallback }} from "../components/figma/ImageWithFallback";
-import {{ TableOfContents }} from "../components/blog/TableOfContents";
-import {{ BlogContent, BlogContentBlock }} from "../components/blog/BlogContent";
-import {{ GiscusComments }} from "../components/GiscusComments";
-
-export function {component_name}() {{
-  // Blog post data generated from markdown
-  const blogPost = {meta_json};
-
-  const tocItems = {toc_json};
-
-  const contentBlocks: BlogContentBlock[] = {content_json};
+# Imports of a generated blog post page (paths relative to pages/)
+BLOG_POST_IMPORTS = '''import { ArrowLeft, Calendar, Clock } from "lucide-react";
+import { Header } from "../components/Header";
+import { Footer } from "../components/Footer";
+import { ImageWithFallback } from "../components/figma/ImageWithFallback";
+import { TableOfContents } from "../components/blog/TableOfContents";
+import { BlogContent, BlogContentBlock } from "../components/blog/BlogContent";
+import { GiscusComments } from "../components/GiscusComments";
+import { RelatedLinks } from "../components/shared/RelatedLinks";
+'''
 
-  return (
+# JSX of a blog post page, rendered from blogPost, tocItems and contentBlocks
+BLOG_POST_BODY = '''  return (
     <div className="size-full relative">
       <Header />
 
-      {{/* Hero Section */}}
+      {/* Hero Section */}
       <section>
         <div className="max-w-7xl mx-auto px-8 py-20 pb-8">
-          {{/* Back Button */}}
+          {/* Back Button */}
           <a
             href="#/blog"
             className="inline-flex items-center gap-2 mb-8 px-4 py-2 border-2 border-border bg-background hover:bg-foreground hover:text-background transition-colors font-mono"
-            onClick={{() => {{
+            onClick={() => {
               // Scroll to top when going back to blog list
               setTimeout(() => window.scrollTo(0, 0), 10);
-            }}}}
+            }}
           >
             <ArrowLeft className="w-4 h-4" />
             <span>Back to Blog</span>
           </a>
 
-          {{/* Boxed Hero Content */}}
+          {/* Boxed Hero Content */}
           <div className="border-2 border-border">
             <div className="grid grid-cols-1 lg:grid-cols-12">
               
-              {{/* Left Column - Hero Image (Optional) */}}
-              {{blogPost.heroImage && (
+              {/* Left Column - Hero Image (Optional) */}
+              {blogPost.heroImage && (
                 <div className="lg:col-span-5 bg-background border-r border-b border-border lg:border-b-0">
                   <div className="relative h-full min-h-[250px] lg:min-h-[400px]">
                     <ImageWithFallback
-                      src={{blogPost.heroImage}}
-                      alt={{blogPost.title}}
+                      src={blogPost.heroImage}
+                      srcSet={blogPost.heroSrcset}
+                      sizes={blogPost.heroSizes}
+                      width={blogPost.heroWidth}
+                      height={blogPost.heroHeight}
+                      alt={blogPost.title}
                       className="w-full h-full object-cover"
                     />
                   </div>
                 </div>
-              )}}
+              )}
 
-              {{/* Right Column - Post Info */}}
-              <div className={{`${{blogPost.heroImage ? 'lg:col-span-7' : 'lg:col-span-12'}} bg-background p-6 md:p-12`}}>
+              {/* Right Column - Post Info */}
+              <div className={`${blogPost.heroImage ? 'lg:col-span-7' : 'lg:col-span-12'} bg-background p-6 md:p-12`}>
                 <div className="space-y-6 md:space-y-8">
-                  {{/* Category & Meta Info */}}
+                  {/* Category & Meta Info */}
                   <div className="space-y-4">
                     <div className="flex flex-col sm:flex-row sm:items-center gap-3 sm:gap-4">
                       <span className="px-4 py-2 border-2 border-border bg-background font-mono text-sm inline-block w-fit">
-                        {{blogPost.category}}
+                        {blogPost.category}
                       </span>
                       <div className="flex items-center gap-3 sm:gap-4 font-mono text-xs sm:text-sm text-muted-foreground">
                         <span className="flex items-center gap-2">
                           <Calendar className="w-4 h-4 flex-shrink-0" />
-                          <span className="whitespace-nowrap">{{blogPost.date}}</span>
+                          <span className="whitespace-nowrap">{blogPost.date}</span>
                         </span>
                         <span>•</span>
                         <span className="flex items-center gap-2">
                           <Clock className="w-4 h-4 flex-shrink-0" />
-                          <span className="whitespace-nowrap">{{blogPost.readTime}}</span>
+                          <span className="whitespace-nowrap">{blogPost.readTime}</span>
                         </span>
                       </div>
                     </div>
                   </div>
 
-                  {{/* Title */}}
+                  {/* Title */}
                   <div>
-                    <h1 className="mb-6 text-3xl md:text-4xl lg:text-5xl">{{blogPost.title}}</h1>
+                    <h1 className="mb-6 text-3xl md:text-4xl lg:text-5xl">{blogPost.title}</h1>
                   </div>
 
-                  {{/* Author Info */}}
+                  {/* Author Info */}
                   <div className="flex items-center gap-3">
                     <div className="w-12 h-12 rounded-full overflow-hidden border-2 border-border">
                       <ImageWithFallback
-                        src={{blogPost.authorAvatar}}
-                        alt={{blogPost.author}}
+                        src={blogPost.authorAvatar}
+                        alt={blogPost.author}
                         className="w-full h-full object-cover"
                       />
                     </div>
                     <div>
                       <p className="font-mono text-sm text-muted-foreground">Written by</p>
-                      <p>{{blogPost.author}}</p>
+                      <p>{blogPost.author}</p>
                     </div>
                   </div>
 
-                  {{/* Tags Section */}}
+                  {/* Tags Section */}
                   <div className="-mx-12 px-12 border-t border-border pt-8">
                     <p className="font-mono text-muted-foreground mb-4">// TAGS</p>
                     <div className="flex flex-wrap gap-2">
-                      {{blogPost.tags.map((tag) => (
+                      {blogPost.tags.map((tag) => (
                         <span
-                          key={{tag}}
+                          key={tag}
                           className="px-3 py-1 border-2 border-border font-mono text-sm bg-background hover:bg-secondary transition-colors"
                         >
-                          #{{tag}}
+                          #{tag}
                         </span>
-                      ))}}
+                      ))}
                     </div>
                   </div>
                 </div>
@@ -395,65 +381,68 @@ export function {component_name}() {{
         </div>
       </section>
 
-      {{/* Main Content */}}
+      {/* Main Content */}
       <section className="border-b border-border">
         <div className="max-w-7xl mx-auto px-8 py-12 pt-8">
           <div className="grid grid-cols-1 lg:grid-cols-12 gap-12">
-            {{/* Table of Contents - Desktop */}}
+            {/* Table of Contents - Desktop */}
             <aside className="hidden lg:block lg:col-span-3">
-              <TableOfContents items={{tocItems}} />
+              <TableOfContents items={tocItems} />
             </aside>
 
-            {{/* Article Content */}}
+            {/* Article Content */}
             <article className="lg:col-span-9">
               <div className="bg-background p-4 rounded-lg">
-                <BlogContent blocks={{contentBlocks}} />
+                <BlogContent blocks={contentBlocks} />
 
-                {{/* Share Section */}}
+                {/* Share Section */}
                 <div className="mt-16 pt-8 border-t-2 border-border">
                   <p className="font-mono text-sm text-muted-foreground mb-4">
                     // SHARE THIS ARTICLE
                   </p>
                   <div className="flex gap-3">
                     <button 
-                      onClick={{() => {{
-                        const url = `https://twitter.com/intent/tweet?text=${{encodeURIComponent(blogPost.title)}}&url=${{encodeURIComponent(window.location.href)}}`;
+                      onClick={() => {
+                        const url = `https://twitter.com/intent/tweet?text=${encodeURIComponent(blogPost.title)}&url=${encodeURIComponent(window.location.href)}`;
                         window.open(url, '_blank', 'noopener,noreferrer');
-                      }}}}
+                      }}
                       className="px-4 py-2 border-2 border-border bg-background hover:bg-foreground hover:text-background transition-colors font-mono"
                     >
                       Twitter
                     </button>
                     <button 
-                      onClick={{() => {{
-                        const url = `https://www.linkedin.com/sharing/share-offsite/?url=${{encodeURIComponent(window.location.href)}}`;
+                      onClick={() => {
+                        const url = `https://www.linkedin.com/sharing/share-offsite/?url=${encodeURIComponent(window.location.href)}`;
                         window.open(url, '_blank', 'noopener,noreferrer');
-                      }}}}
+                      }}
                       className="px-4 py-2 border-2 border-border bg-background hover:bg-foreground hover:text-background transition-colors font-mono"
                     >
                       LinkedIn
                     </button>
                     <button 
-                      onClick={{() => {{
-                        navigator.clipboard.writeText(window.location.href).then(() => {{
+                      onClick={() => {
+                        navigator.clipboard.writeText(window.location.href).then(() => {
                           alert('Link copied to clipboard!');
-                        }}).catch(err => {{
+                        }).catch(err => {
                           console.error('Failed to copy link:', err);
-                        }});
-                      }}}}
+                        });
+                      }}
                       className="px-4 py-2 border-2 border-border bg-background hover:bg-foreground hover:text-background transition-colors font-mono"
                     >
                       Copy Link
                     </button>
                   </div>
                 </div>
+
+                {/* Related Posts */}
+                <RelatedLinks collection="blog" slug={blogPost.slug} label="// RELATED POSTS" />
               </div>
             </article>
           </div>
         </div>
       </section>
 
-      {{/* Comments Section */}}
+      {/* Comments Section */}
       <section className="border-b border-border">
         <div className="max-w-7xl mx-auto px-8 py-12">
           <div className="mb-8 inline-block border-2 border-border px-6 py-4 bg-background shadow-retro">
@@ -469,12 +458,387 @@ export function {component_name}() {{
       <Footer />
     </div>
   );
+'''
+
+
+def content_block_tsx(block):
+    """Convert a parsed content block to the BlogContentBlock shape"""
+    block_tsx = {
+        'type': block['type'],
+        'content': block.get('content', '')
+    }
+    
+    # Add additional fields based on block type
+    if 'id' in block:
+        block_tsx['id'] = block['id']
+    if 'author' in block:
+        block_tsx['author'] = block['author']
+    if 'language' in block:
+        block_tsx['language'] = block['language']
+    if 'alt' in block:
+        block_tsx['alt'] = block['alt']
+    if 'width' in block:
+        block_tsx['width'] = block['width']
+    if 'tokens' in block:
+        block_tsx['tokens'] = block['tokens']
+    if 'imageWidth' in block:
+        block_tsx['imageWidth'] = block['imageWidth']
+        block_tsx['imageHeight'] = block['imageHeight']
+    if 'srcset' in block:
+        block_tsx['srcset'] = block['srcset']
+        block_tsx['sizes'] = block['sizes']
+    
+    return block_tsx
+
+
+def generate_blog_post_component(blog_data, blog_slug, compact=False):
+    """Generate BlogPostPage component from blog data"""
+    meta = blog_data['meta']
+    toc = blog_data['toc']
+    content_blocks = blog_data['content_blocks']
+    
+    # Convert content blocks to TSX format
+    content_blocks_tsx = [content_block_tsx(block) for block in content_blocks]
+    
+    # Generate JSON for the component (minified, with shared strings, for --compact)
+    strings = hoist_strings(meta, toc, content_blocks_tsx) if compact else {}
+    meta_json = dumps(meta, 4, compact, strings)
+    toc_json = dumps(toc, 4, compact, strings)
+    content_json = dumps(content_blocks_tsx, 4, compact, strings)
+    
+    component_name = ''.join(word.capitalize() for word in blog_slug.split('-')) + 'Page'
+    
+    return (
+        BLOG_POST_IMPORTS
+        + 'import type { BlogMeta } from "./BlogIndex";\n'
+        + string_constants(strings)
+        + f'''
+export function {component_name}() {{
+  // Blog post data generated from markdown
+  const blogPost: BlogMeta = {meta_json};
+
+  const tocItems = {toc_json};
+
+  const contentBlocks: BlogContentBlock[] = {content_json};
+
+'''
+        + BLOG_POST_BODY
+        + '}\n'
+    )
+
+
+def generate_blog_post_view():
+    """Generate the BlogPostView component shared by all data modules"""
+    return (
+        '// Auto-generated by buildblog.py --data-modules - DO NOT EDIT MANUALLY\n'
+        '// Renders every blog post; the post data comes from pages/data/<Post>Page.ts\n'
+        'import type { ComponentProps } from "react";\n'
+        + BLOG_POST_IMPORTS
+        + '''import type { BlogMeta } from "./BlogIndex";
+
+export interface BlogPostViewProps {
+  blogPost: BlogMeta;
+  tocItems: ComponentProps<typeof TableOfContents>["items"];
+  contentBlocks: BlogContentBlock[];
+}
+
+export function BlogPostView({ blogPost, tocItems, contentBlocks }: BlogPostViewProps) {
+'''
+        + BLOG_POST_BODY
+        + '}\n'
+    )
+
+
+def generate_blog_data_module(blog_data, component_name, compact=False):
+    """Generate the data module of one blog post, rendered by BlogPostView"""
+    content_blocks_tsx = [content_block_tsx(block) for block in blog_data['content_blocks']]
+    
+    strings = hoist_strings(blog_data['meta'], blog_data['toc'], content_blocks_tsx) if compact else {}
+    meta_json = dumps(blog_data['meta'], 2, compact, strings)
+    toc_json = dumps(blog_data['toc'], 2, compact, strings)
+    content_json = dumps(content_blocks_tsx, 2, compact, strings)
+    
+    return f'''// Auto-generated by buildblog.py --data-modules - DO NOT EDIT MANUALLY
+import {{ createElement }} from "react";
+import type {{ BlogContentBlock }} from "../../components/blog/BlogContent";
+import {{ BlogPostView }} from "../BlogPostView";
+{string_constants(strings)}
+const blogPost = {meta_json};
+
+const tocItems = {toc_json};
+
+const contentBlocks: BlogContentBlock[] = {content_json};
+
+export default function {component_name}() {{
+  return createElement(BlogPostView, {{ blogPost, tocItems, contentBlocks }});
 }}
 '''
 
 
-def main():
+def find_blog_files(blogs_dir):
+    """Return the blog markdown files, sorted so the index order does not depend on the filesystem"""
+    return sorted(
+        f for f in blogs_dir.glob('*.md') 
+        if f.name.upper() not in ['README.MD']
+    )
+
+
+# Version of the parser alone; template edits keep cached parse results valid
+PARSER_VERSION = parser_version(parse_blog_markdown, iter_blog_markdown, parse_styled_text, inline_markup.__file__,
+                                stream_build.__file__)
+
+
+def apply_meta_defaults(meta):
+    """Ensure display flags have default values"""
+    if 'featuredOnHome' not in meta:
+        meta['featuredOnHome'] = False
+    if 'featuredOnBlog' not in meta:
+        meta['featuredOnBlog'] = False
+    if 'displayOrder' not in meta:
+        meta['displayOrder'] = 999
+    if 'external' not in meta:
+        meta['external'] = False
+    if 'externalUrl' not in meta:
+        meta['externalUrl'] = None
+
+
+def render_blog_post(blog_data, blog_slug, component_name, data_modules=False, compact=False):
+    """Render a post as a full page, or as a data module with --data-modules"""
+    if data_modules:
+        return generate_blog_data_module(blog_data, component_name, compact)
+    return generate_blog_post_component(blog_data, blog_slug, compact)
+
+
+def blog_output_file(pages_dir, component_name, data_modules=False):
+    """Path of the page or data module generated for a post"""
+    if data_modules:
+        return pages_dir / 'data' / f"{component_name}.ts"
+    return pages_dir / f"{component_name}.tsx"
+
+
+def build_blog_post(blog_file, pages_dir, stream=False, data_modules=False, compact=False,
+                    highlight=False, images=False):
+    """Read, parse and render one blog post (runs in a worker process with --jobs)"""
+    if should_stream(blog_file, stream):
+        return stream_blog_post(blog_file, pages_dir, data_modules, compact, highlight, images)
+    
+    try:
+        content, stat = read_source(blog_file)
+        started = time.perf_counter()
+        blog_data, model_key, model_cached = load_model('blog', content, PARSER_VERSION, parse_blog_markdown)
+        parse_seconds = time.perf_counter() - started
+        
+        # Pre-highlight code blocks so the page does not need the runtime highlighter
+        highlights = highlight_blocks(blog_data['content_blocks'], 'blog-code') if highlight else []
+        
+        # Get slug from filename or meta
+        blog_slug = blog_data['meta'].get('slug', blog_file.stem)
+        apply_meta_defaults(blog_data['meta'])
+        
+        # Pixel sizes of local images, so the page can reserve their space
+        found = {}
+        add_dimensions(blog_data['content_blocks'], blog_data['meta'], found)
+        
+        # Asset files the post points at; only these are published
+        references = set()
+        add_references([], blog_data['meta'], references)
+        
+        # Responsive variants of local images, written once per source hash
+        plans = {}
+        if images:
+            add_responsive_images(blog_data['content_blocks'], blog_data['meta'], plans)
+        
+        # Generate component only if not external
+        output_file = None
+        component_code = None
+        component_name = None
+        static_file = None
+        static_html = None
+        savings = None
+        render_seconds = None
+        if not blog_data['meta'].get('external', False):
+            component_name = ''.join(word.capitalize() for word in blog_slug.split('-')) + 'Page'
+            output_file = blog_output_file(pages_dir, component_name, data_modules)
+            static_file = static_page_file('blog', blog_slug)
+            add_references(blog_data['content_blocks'], None, references)
+            started = time.perf_counter()
+            component_code = render_blog_post(blog_data, blog_slug, component_name, data_modules, compact)
+            static_html = render_static_page('blog', blog_slug, blog_data['meta'], blog_data['toc'],
+                                             blog_data['content_blocks'])
+            render_seconds = time.perf_counter() - started
+            if compact:
+                # Size of the same page without --compact, for the savings report
+                indented = render_blog_post(blog_data, blog_slug, component_name, data_modules)
+                savings = (output_bytes(indented), output_bytes(component_code))
+        
+        # Term map for the search index; external posts are only indexed by their meta
+        digest = content_digest(content)
+        searched_blocks = [] if blog_data['meta'].get('external', False) else blog_data['content_blocks']
+        search = document_terms('blog-search', digest, searched_blocks, blog_data['meta'])
+    except Exception as e:
+        return {'error': str(e)}
+    
+    return {
+        'digest': digest,
+        'stat': stat,
+        'model': model_key,
+        'model_cached': model_cached,
+        'highlights': highlights,
+        'images': found,
+        'references': sorted(references),
+        'variants': variant_dirs(plans),
+        'search': search,
+        'output_file': output_file,
+        'component_code': component_code,
+        'component_file': None,
+        'static_file': static_file,
+        'static_html': static_html,
+        'static_temp': None,
+        'savings': savings,
+        'metrics': document_metrics(parse_seconds, render_seconds, model_cached,
+                                     block_counts(blog_data['content_blocks'])),
+        'index_entry': {
+            'slug': blog_slug,
+            'component': component_name,
+            'meta': blog_data['meta']
+        }
+    }
+
+
+def stream_blog_post(blog_file, pages_dir, data_modules=False, compact=False,
+                     highlight=False, images=False):
+    """Parse and render one blog post without holding the whole document in memory
+    
+    The page is written to a temporary file ('component_file') for stage_file;
+    the parse cache is bypassed since the model would not fit in memory either.
+    With --compact only strings shared by the meta and TOC are hoisted, and no
+    savings are reported, since that would need the whole document.
+    """
+    try:
+        stat = blog_file.stat()
+        digest = hashlib.sha256()
+        meta, toc, spill = spill_document(iter_blog_markdown(read_lines(blog_file, digest)))
+        
+        with spill:
+            blog_slug = meta.get('slug', blog_file.stem)
+            apply_meta_defaults(meta)
+            
+            output_file = None
+            component_file = None
+            component_name = None
+            static_file = None
+            static_temp = None
+            render_seconds = None
+            highlights = []
+            found = {}
+            plans = {}
+            counts = {}
+            references = set()
+            add_dimensions([], meta, found)
+            add_references([], meta, references)
+            if images:
+                add_responsive_images([], meta, plans)
+            search = cached_terms('blog-search', digest.hexdigest())
+            terms = None if search else start_terms()
+            if terms:
+                add_meta(terms, meta)
+            if not meta.get('external', False):
+                component_name = ''.join(word.capitalize() for word in blog_slug.split('-')) + 'Page'
+                output_file = blog_output_file(pages_dir, component_name, data_modules)
+                blog_data = {'meta': meta, 'toc': toc, 'content_blocks': []}
+                page = render_blog_post(blog_data, blog_slug, component_name, data_modules, compact)
+                if compact:
+                    indent = None
+                else:
+                    indent = 2 if data_modules else 4
+                if images:
+                    # Encode the variants up front, like the in-memory path, so only rendering is timed
+                    write_variants(iter_spilled(spill), plans)
+                blocks = iter_counted(iter_spilled(spill), counts)
+                if highlight:
+                    blocks = iter_highlighted(blocks, 'blog-code', highlights)
+                blocks = iter_dimensions(blocks, found)
+                blocks = iter_references(blocks, references)
+                if terms:
+                    blocks = iter_search_terms(blocks, terms)
+                if images:
+                    blocks = iter_responsive(blocks, plans)
+                blocks = (content_block_tsx(block) for block in blocks)
+                started = time.perf_counter()
+                component_file = write_temporary(output_file, stream_page(page, blocks, indent))
+                
+                # Second pass over the spilled blocks for the static page
+                static_file = static_page_file('blog', blog_slug)
+                blocks = iter_spilled(spill)
+                if highlight:
+                    blocks = iter_highlighted(blocks, 'blog-code', [])
+                blocks = iter_dimensions(blocks, found)
+                if images:
+                    blocks = iter_responsive(blocks, plans)
+                static_temp = write_static_page('blog', blog_slug, meta, toc, blocks)
+                render_seconds = time.perf_counter() - started
+            if terms:
+                search = store_terms('blog-search', digest.hexdigest(), terms)
+    except Exception as e:
+        return {'error': str(e)}
+    
+    return {
+        'digest': digest.hexdigest(),
+        'stat': stat,
+        'model': None,
+        'model_cached': False,
+        'highlights': highlights,
+        'images': found,
+        'references': sorted(references),
+        'variants': variant_dirs(plans),
+        'search': search,
+        'output_file': output_file,
+        'component_code': None,
+        'component_file': component_file,
+        'static_file': static_file,
+        'static_html': None,
+        'static_temp': static_temp,
+        'savings': None,
+        # Parsing is interleaved with rendering, so it is all counted as render time
+        'metrics': document_metrics(None, render_seconds, False, counts),
+        'index_entry': {
+            'slug': blog_slug,
+            'component': component_name,
+            'meta': meta
+        }
+    }
+
+
+def main(argv=None):
     """Main function to process all blog markdown files"""
+    parser = argparse.ArgumentParser(description='Generate blog pages from markdown')
+    parser.add_argument('--force', action='store_true',
+                        help='ignore the build manifest and rebuild every post')
+    add_jobs_argument(parser)
+    parser.add_argument('--stream', action='store_true',
+                        help='parse and render every post in bounded memory (automatic for very large files)')
+    parser.add_argument('--data-modules', action='store_true',
+                        help='emit a small data module per post, rendered by one shared BlogPostView page')
+    parser.add_argument('--compact', action='store_true',
+                        help='emit minified page data with repeated strings hoisted, and report the bytes saved')
+    parser.add_argument('--highlight', action='store_true',
+                        help='syntax-highlight code blocks at build time (needs Pygments)')
+    parser.add_argument('--responsive-images', action='store_true',
+                        help='write resized WebP variants of local images and add srcset/sizes (needs Pillow)')
+    add_profile_arguments(parser)
+    add_trace_argument(parser)
+    add_metrics_arguments(parser)
+    args = parser.parse_args(argv)
+
+    with profiling('blog', args, globals(), PROFILE_STAGES), tracing(args, globals(), PROFILE_STAGES):
+        return build_blogs(args)
+
+
+def build_blogs(args):
+    """Generate the pages, index and listings of every blog post
+    
+    Returns 1 if a post failed to build or a size or time budget was exceeded.
+    """
     blogs_dir = Path('assets/blogs')
     pages_dir = Path('pages')
     components_dir = Path('components')
@@ -482,96 +846,242 @@ def main():
     if not blogs_dir.exists():
         print("Error: assets/blogs/ directory not found!")
         print("Create the assets/blogs/ directory and add markdown files.")
-        return
+        return 1
     
     if not pages_dir.exists():
         pages_dir.mkdir()
     
     # Process all markdown files in blogs directory, excluding documentation
-    blog_files = [
-        f for f in blogs_dir.glob('*.md') 
-        if f.name.upper() not in ['README.MD']
-    ]
+    blog_files = find_blog_files(blogs_dir)
     
     if not blog_files:
         print("No markdown files found in assets/blogs/ directory.")
         return
     
-    generated_files = []
-    blog_index = []
+    if args.highlight and code_highlight.pygments is None:
+        print("⚠ Pygments is not installed - code blocks are left to the browser highlighter")
+    if args.responsive_images and image_variants.Image is None:
+        print("⚠ Pillow is not installed - images are published without responsive variants")
     
+    version = manifest_version(args.data_modules, args.compact, args.highlight, args.responsive_images)
+    manifest = load_manifest('blog', version, force=args.force)
+    index_outputs = [pages_dir / 'BlogIndex.ts', components_dir / 'Blogs.tsx', SEARCH_DIR / 'blog' / 'index.json',
+                     LISTINGS_DIR / 'blog' / 'index.json']
+    if args.data_modules:
+        index_outputs.append(pages_dir / 'BlogPostView.tsx')
+    index_current = index_is_current(manifest, blog_files)
+    metrics_outputs = [pages_dir / 'BlogIndex.ts', components_dir / 'Blogs.tsx']
+    
+    # Unchanged posts reuse their recorded index entry without parsing
+    fresh_entries = {}
     for blog_file in blog_files:
+        entry = lookup(manifest, blog_file)
+        if entry and images_current(entry.get('images')):
+            fresh_entries[blog_file] = entry['index_entry']
+    stale_files = [f for f in blog_files if f not in fresh_entries]
+    
+    outputs = start_outputs()
+    built_entries = {}
+    cached_models = 0
+    failed = 0
+    savings = []
+    
+    results = map_documents(profiled(build_blog_post), stale_files, args.jobs, pages_dir,
+                            args.stream, args.data_modules, args.compact, args.highlight, args.responsive_images)
+    for blog_file, result in profile_documents(results):
         print(f"Processing {blog_file.name}...")
+        if 'error' in result:
+            print(f"✗ Error processing {blog_file.name}: {result['error']}")
+            failed += 1
+            continue
         
-        content = blog_file.read_text(encoding='utf-8')
-        blog_data = parse_blog_markdown(content)
-        
-        # Get slug from filename or meta
-        blog_slug = blog_data['meta'].get('slug', blog_file.stem)
-        
-        # Ensure display flags have default values
-        if 'featuredOnHome' not in blog_data['meta']:
-            blog_data['meta']['featuredOnHome'] = False
-        if 'featuredOnBlog' not in blog_data['meta']:
-            blog_data['meta']['featuredOnBlog'] = False
-        if 'displayOrder' not in blog_data['meta']:
-            blog_data['meta']['displayOrder'] = 999
-        if 'external' not in blog_data['meta']:
-            blog_data['meta']['external'] = False
-        if 'externalUrl' not in blog_data['meta']:
-            blog_data['meta']['externalUrl'] = None
-        
-        # Generate component only if not external
-        if not blog_data['meta'].get('external', False):
-            component_code = generate_blog_post_component(blog_data, blog_slug)
-            component_name = ''.join(word.capitalize() for word in blog_slug.split('-')) + 'Page'
-            output_file = pages_dir / f"{component_name}.tsx"
-            output_file.write_text(component_code, encoding='utf-8')
-            generated_files.append(output_file.name)
-            print(f"✓ Generated {output_file.name}")
+        output_file = result['output_file']
+        if output_file:
+            if result['component_file']:
+                changed = stage_file(outputs, output_file, result['component_file'])
+            else:
+                changed = stage_output(outputs, output_file, result['component_code'])
+            if changed:
+                print(f"✓ Generated {output_file.name}")
+            else:
+                print(f"✓ {output_file.name} unchanged")
+            stage_static_page(outputs, result)
         else:
-            component_name = None
-            print(f"✓ External blog link: {blog_slug}")
+            print(f"✓ External blog link: {result['index_entry']['slug']}")
+        if result['savings']:
+            savings.append((output_file, *result['savings']))
         
-        # Add to blog index
-        blog_index.append({
-            'slug': blog_slug,
-            'component': component_name,
-            'meta': blog_data['meta']
-        })
+        built_entries[blog_file] = result['index_entry']
+        cached_models += result['model_cached']
+        record(manifest, blog_file, result['digest'], result['stat'],
+               [output_file, result['static_file']] if output_file else [], index_entry=result['index_entry'],
+               model=result['model'], highlights=result['highlights'],
+               images=result['images'], references=result['references'], variants=result['variants'],
+               search=result['search'], metrics=result['metrics'])
+    
+    if fresh_entries:
+        print(f"✓ Skipped {len(fresh_entries)} unchanged posts")
+    if cached_models:
+        print(f"✓ Loaded {cached_models} parsed posts from the parse cache")
+    
+    # Merge fresh and rebuilt entries back in file order (posts that failed are left out)
+    indexed_files = [f for f in blog_files if f in fresh_entries or f in built_entries]
+    blog_index = [fresh_entries.get(f) or built_entries[f] for f in indexed_files]
+    
+    if built_entries or not index_current:
+        savings += stage_blog_listings(blog_index, pages_dir, components_dir, outputs,
+                                       args.data_modules, args.compact)
+        stage_search_outputs(blog_index, search_keys(manifest, indexed_files), outputs)
+    else:
+        print("✓ BlogIndex.ts and Blogs.tsx are up to date")
+    
+    # Pages of deleted posts, removed before save_manifest forgets them
+    for output in removed_outputs(manifest, blog_files):
+        stage_removal(outputs, output)
+    
+    # Commit all changed outputs together, then record their stats
+    changed = commit_outputs(outputs)
+    report_outputs(changed, outputs)
+    report_savings(savings)
+    within_budget = write_metrics('blog', manifest, blog_files, metrics_outputs, args.budgets)
+    save_manifest(manifest, blog_files, index_outputs)
+    evict_models('blog', manifest)
+    evict_models('blog-code', manifest, 'highlights')
+    evict_models('blog-search', manifest, 'search')
+    image_dimensions.save_index(manifest)
+    
+    print(f"\n✅ Blog generation complete! Generated {len(changed)} files:")
+    for file in changed:
+        print(f"  - {file}")
+    if not within_budget:
+        print(f"✗ Blog build is over budget (see {args.budgets})")
+    if failed:
+        print(f"✗ {failed} of {len(stale_files)} changed posts failed to build")
+    if failed or not within_budget:
+        return 1
+
+
+def stage_blog_listings(blog_index, pages_dir, components_dir, outputs, data_modules=False, compact=False):
+    """Stage BlogIndex.ts, the homepage Blogs.tsx and the BlogPage listing shards for the given index entries
+    
+    Also removes the static pages of posts that are no longer in the index, and the
+    pages a post had in the other --data-modules mode.
+    
+    Returns the (path, indented bytes, compact bytes) of each listing with --compact.
+    """
+    savings = []
     
     # Generate blog index file
-    generate_blog_index(blog_index, pages_dir)
+    index_content = generate_blog_index(blog_index, pages_dir, outputs, data_modules, compact)
+    if compact:
+        indented = render_blog_index(blog_index, data_modules)
+        savings.append((pages_dir / 'BlogIndex.ts', output_bytes(indented), output_bytes(index_content)))
+    
+    # Pages of the other --data-modules mode, left over from switching modes
+    for entry in blog_index:
+        if entry['component']:
+            stage_removal(outputs, blog_output_file(pages_dir, entry['component'], not data_modules))
+    if not data_modules:
+        stage_removal(outputs, pages_dir / 'BlogPostView.tsx')
+    
+    # Shared page component for the per-post data modules
+    if data_modules:
+        view_file = pages_dir / 'BlogPostView.tsx'
+        if stage_output(outputs, view_file, generate_blog_post_view()):
+            print("✓ Generated BlogPostView.tsx")
+        else:
+            print("✓ BlogPostView.tsx unchanged")
+    
+    # Active posts in display order, shared by Blogs.tsx and the listing shards
+    ordered = [entry for entry in display_order(blog_index) if is_active(entry)]
     
     # Generate Blogs.tsx component for HomePage
     try:
-        blogs_component = generate_blogs_component(blog_index)
+        blogs_component = generate_blogs_component(ordered, compact)
         blogs_file = components_dir / "Blogs.tsx"
-        blogs_file.write_text(blogs_component, encoding='utf-8')
-        print("✓ Generated Blogs.tsx component")
+        if stage_output(outputs, blogs_file, blogs_component):
+            print("✓ Generated Blogs.tsx component")
+        else:
+            print("✓ Blogs.tsx unchanged")
+        if compact:
+            indented = generate_blogs_component(ordered)
+            savings.append((blogs_file, output_bytes(indented), output_bytes(blogs_component)))
     except Exception as e:
         print(f"✗ Error generating Blogs component: {e}")
     
-    print(f"\n✅ Blog generation complete! Generated {len(generated_files)} files:")
-    for file in generated_files:
-        print(f"  - pages/{file}")
+    # Generate the BlogPage listing shards (featured: first post with featuredOnBlog)
+    featured = next((entry for entry in ordered if entry['meta'].get('featuredOnBlog')), None)
+    stage_listings('blog', ordered, listing_card, featured or next(iter(ordered), None), outputs)
+    
+    # Static pages of removed posts and posts that became external links
+    prune_static_pages('blog', [entry['slug'] for entry in blog_index if not entry['meta'].get('external')], outputs)
+    
+    return savings
 
 
-def generate_blog_index(blog_index, pages_dir):
-    """Generate a blog index file with all blog metadata"""
-    blog_index_json = json.dumps(blog_index, indent=2)
-    
-    # Get imports for non-external blogs
-    imports = [f'import {{ {entry["component"]} }} from "./{entry["component"]}";' 
-               for entry in blog_index if entry['component'] is not None]
+def listing_card(entry):
+    """The BlogCard fields of a post, as listed on BlogPage"""
+    meta = entry['meta']
+    card = {
+        'title': meta.get('title', ''),
+        'excerpt': meta.get('excerpt') or f"{meta.get('title', '')} - {', '.join((meta.get('tags') or [])[:3])}",
+        'date': meta.get('date', ''),
+        'image': meta.get('heroImage') or LISTING_IMAGE,
+        'category': meta.get('category', ''),
+        'author': meta.get('author', ''),
+        'authorAvatar': meta.get('authorAvatar', ''),
+        'slug': entry['slug'],
+        'linkType': 'external' if meta.get('external') else 'internal',
+    }
+    if meta.get('external') and meta.get('externalUrl'):
+        card['linkUrl'] = meta['externalUrl']
+    return card
+
+
+def stage_search_outputs(blog_index, keys, outputs):
+    """Stage the search index and the related post links, both built from the cached term maps"""
+    docs = search_docs(blog_index)
+    stage_search_index('blog', docs, keys, 'blog-search', outputs)
+    stage_related('blog', docs, keys, [entry['meta'] for entry in blog_index], 'blog-search', outputs)
+
+
+def search_docs(blog_index):
+    """The {slug, title, href} of each post, as listed in the search index"""
+    return [
+        {
+            'slug': entry['slug'],
+            'title': entry['meta'].get('title', entry['slug']),
+            'href': entry['meta'].get('externalUrl') if entry['meta'].get('external') else f"#/blog/{entry['slug']}",
+        }
+        for entry in blog_index
+    ]
+
+
+def search_keys(manifest, blog_files):
+    """The cached term map key of each post, in the order of blog_files"""
+    return [manifest['entries'][str(f)].get('search') for f in blog_files]
+
+
+def lazy_component(component_name, data_modules=False):
+    """Return a React.lazy() expression that loads a generated page on demand"""
+    if data_modules:
+        return f'lazy(() => import("./data/{component_name}"))'
+    return f'lazy(() => import("./{component_name}").then((module) => ({{ default: module.{component_name} }})))'
+
+
+def render_blog_index(blog_index, data_modules=False, compact=False):
+    """Return the content of BlogIndex.ts"""
+    strings = hoist_strings(blog_index) if compact else {}
+    blog_index_json = dumps(blog_index, 2, compact, strings)
     
-    # Get components mapping for non-external blogs
-    components = [f'  "{entry["slug"]}": {entry["component"]},' 
+    # Get lazily loaded components mapping for non-external blogs
+    components = [f'  "{entry["slug"]}": {lazy_component(entry["component"], data_modules)},' 
                   for entry in blog_index if entry['component'] is not None]
     
-    index_content = f'''// Auto-generated blog index - DO NOT EDIT MANUALLY
+    return f'''// Auto-generated blog index - DO NOT EDIT MANUALLY
 // This file is generated by buildblog.py
-
+import {{ lazy }} from "react";
+{string_constants(strings)}
 export interface BlogMeta {{
   title: string;
   category: string;
@@ -580,6 +1090,10 @@ export interface BlogMeta {{
   author: string;
   authorAvatar: string;
   heroImage?: string;
+  heroSrcset?: string;
+  heroSizes?: string;
+  heroWidth?: number;
+  heroHeight?: number;
   tags: string[];
   slug: string;
   excerpt?: string;
@@ -599,29 +1113,32 @@ export interface BlogIndexEntry {{
 
 export const BLOG_INDEX: BlogIndexEntry[] = {blog_index_json};
 
-// Import all generated blog page components
-{chr(10).join(imports)}
-
+// Blog page components, each loaded in its own chunk on first visit
+// (render them inside a <Suspense> boundary)
 export const BLOG_COMPONENTS = {{
 {chr(10).join(components)}
 }};
 '''
+
+
+def generate_blog_index(blog_index, pages_dir, outputs, data_modules=False, compact=False):
+    """Generate a blog index file with all blog metadata, staged into outputs"""
+    index_content = render_blog_index(blog_index, data_modules, compact)
     
     index_file = pages_dir / 'BlogIndex.ts'
-    index_file.write_text(index_content, encoding='utf-8')
-    print("✓ Generated BlogIndex.ts")
+    if stage_output(outputs, index_file, index_content):
+        print("✓ Generated BlogIndex.ts")
+    else:
+        print("✓ BlogIndex.ts unchanged")
+    return index_content
 
 
-def generate_blogs_component(blog_index):
-    """Generate Blogs.tsx component for HomePage with featured blogs"""
-    # Filter and sort blogs for home page
-    featured_blogs = [
-        b for b in blog_index 
-        if b['meta'].get('featuredOnHome', False) and b['meta'].get('active', True)
-    ]
+def generate_blogs_component(ordered, compact=False):
+    """Generate Blogs.tsx component for HomePage with featured blogs
     
-    # Sort by display order
-    featured_blogs.sort(key=lambda b: b['meta'].get('displayOrder', 999))
+    ordered are the active index entries in display order.
+    """
+    featured_blogs = [b for b in ordered if b['meta'].get('featuredOnHome', False)]
     
     # Prepare blog data
     blogs_data = []
@@ -652,12 +1169,13 @@ def generate_blogs_component(blog_index):
         
         blogs_data.append(blog_obj)
     
-    blogs_json = json.dumps(blogs_data, indent=8)
+    strings = hoist_strings(blogs_data) if compact else {}
+    blogs_json = dumps(blogs_data, 8, compact, strings)
     
     component_content = f'''import {{ ArrowRight }} from "lucide-react";
 import {{ PageHeader }} from "./shared/PageHeader";
 import {{ BlogCard }} from "./shared/BlogCard";
-
+{string_constants(strings)}
 interface BlogPost {{
   title: string;
   excerpt: string;
@@ -705,4 +1223,4 @@ export function Blogs() {{
 
 
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    sys.exit(main())
\ No newline at end of file
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Code Highlight - Build-time syntax highlighting of code blocks
+Used by: buildblog.py, build_projects.py, build_watch.py
+
+With --highlight every code block gets a 'tokens' list: one list per line of
+[type, text] spans, using Prism's token types so that BlogContent.tsx can color
+them with the same Night Owl theme without loading prism-react-renderer. The
+tokens come from Pygments (optional, pip install pygments) and are cached in
+.buildcache/models/<namespace>/, keyed by a hash of the language, the code and
+the highlighter version. Blocks in languages Pygments does not know are left
+untouched and are still highlighted in the browser.
+"""
+
+from parse_cache import parser_version, load_model
+
+try:
+    import pygments
+    from pygments.lexers import get_lexer_by_name
+    from pygments.token import Token
+    from pygments.util import ClassNotFound
+except ImportError:
+    pygments = None
+
+
+# Cache version: this module plus the Pygments release that produced the tokens
+HIGHLIGHT_VERSION = f'{parser_version(__file__)}-{pygments.__version__}' if pygments else None
+
+# Language used when a block has none, as in BlogContent.tsx
+DEFAULT_LANGUAGE = 'javascript'
+
+if pygments:
+    # Pygments token type -> Prism token type, most specific first
+    TOKEN_TYPES = [
+        (Token.Keyword.Constant, 'boolean'),
+        (Token.Keyword, 'keyword'),
+        (Token.Operator.Word, 'keyword'),
+        (Token.Operator, 'operator'),
+        (Token.Punctuation, 'punctuation'),
+        (Token.Comment, 'comment'),
+        (Token.String.Char, 'char'),
+        (Token.String, 'string'),
+        (Token.Number, 'number'),
+        (Token.Name.Builtin, 'builtin'),
+        (Token.Name.Function, 'function'),
+        (Token.Name.Decorator, 'function'),
+        (Token.Name.Class, 'class-name'),
+        (Token.Name.Namespace, 'namespace'),
+        (Token.Name.Constant, 'constant'),
+        (Token.Name.Variable, 'variable'),
+        (Token.Name.Tag, 'tag'),
+        (Token.Name.Attribute, 'attr-name'),
+        (Token.Name.Property, 'property'),
+        (Token.Generic.Deleted, 'deleted'),
+        (Token.Generic.Inserted, 'inserted'),
+    ]
+
+
+def prism_type(token_type):
+    """Map a Pygments token type to the Prism token type the theme colors"""
+    for pygments_type, prism in TOKEN_TYPES:
+        if token_type in pygments_type:
+            return prism
+    return 'plain'
+
+
+def tokenize(source):
+    """Split '<language>\\n<code>' into lines of [type, text] spans
+
+    Returns an empty list if Pygments has no lexer for the language, so the
+    miss is cached like any other result instead of being retried every build.
+    """
+    language, code = source.split('\n', 1)
+    try:
+        lexer = get_lexer_by_name(language, stripnl=False, ensurenl=False)
+    except ClassNotFound:
+        return []
+
+    lines = [[]]
+    for token_type, text in lexer.get_tokens(code):
+        kind = prism_type(token_type)
+        for i, part in enumerate(text.split('\n')):
+            if i:
+                lines.append([])
+            if not part:
+                continue
+            line = lines[-1]
+            if line and line[-1][0] == kind:
+                line[-1][1] += part
+            else:
+                line.append([kind, part])
+    return lines
+
+
+def highlight_block(block, namespace):
+    """Add 'tokens' to a code block, returning the cache key used (None for other blocks)
+
+    The code is trimmed first, like BlogContent.tsx trims it before rendering.
+    """
+    if pygments is None or block.get('type') != 'code':
+        return None
+
+    source = f"{block.get('language') or DEFAULT_LANGUAGE}\n{block.get('content', '').strip()}"
+    tokens, key, _ = load_model(namespace, source, HIGHLIGHT_VERSION, tokenize)
+    if tokens:
+        block['tokens'] = tokens
+    return key
+
+
+def iter_highlighted(blocks, namespace, keys):
+    """Yield blocks with their code highlighted, appending the cache keys used to keys"""
+    for block in blocks:
+        key = highlight_block(block, namespace)
+        if key:
+            keys.append(key)
+        yield block
+
+
+def highlight_blocks(blocks, namespace):
+    """Highlight every code block in blocks in place, returning the cache keys used"""
+    keys = []
+    for _ in iter_highlighted(blocks, namespace, keys):
+        pass
+    return keys
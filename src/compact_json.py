@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Compact JSON - Minified data literals with shared strings for generated modules
+Used by: buildblog.py, build_projects.py
+
+With --compact the generators embed page data as minified JSON instead of
+json.dumps(..., indent=N). Strings that occur several times in one generated
+module (the default hero image, authorAvatar, categories, ...) are declared
+once as a const at the top of the module and referenced by name wherever that
+is shorter than repeating them. The result is a JavaScript expression rather
+than JSON, so it is only meant for literals embedded in generated TS/TSX.
+"""
+
+import json
+from collections import Counter
+
+
+# Prefix of the hoisted string constants (_s0, _s1, ...)
+HOIST_PREFIX = '_s'
+
+
+def _count_strings(value, counts):
+    """Count the string values (not object keys) inside value"""
+    if isinstance(value, str):
+        counts[value] += 1
+    elif isinstance(value, dict):
+        for item in value.values():
+            _count_strings(item, counts)
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            _count_strings(item, counts)
+
+
+def hoist_strings(*values):
+    """Return {string: constant name} for the strings worth declaring once
+
+    A string is hoisted when declaring it and referring to it by name is
+    shorter than repeating it; names are assigned in order of first use.
+    """
+    counts = Counter()
+    for value in values:
+        _count_strings(value, counts)
+
+    strings = {}
+    for string, count in counts.items():
+        if count < 2:
+            continue
+        literal = json.dumps(string)
+        name = f'{HOIST_PREFIX}{len(strings)}'
+        declaration = len(f'const {name} = {literal};\n')
+        if count * (len(literal) - len(name)) > declaration:
+            strings[string] = name
+    return strings
+
+
+def string_constants(strings):
+    """Return the const declarations for a hoist_strings table"""
+    return ''.join(f'const {name} = {json.dumps(string)};\n' for string, name in strings.items())
+
+
+def _literal(value, strings):
+    """Minified JavaScript literal for value, with hoisted strings replaced by name"""
+    if isinstance(value, str):
+        return strings.get(value) or json.dumps(value)
+    if isinstance(value, dict):
+        return '{' + ','.join(f'{json.dumps(str(key))}:{_literal(item, strings)}'
+                              for key, item in value.items()) + '}'
+    if isinstance(value, (list, tuple)):
+        return '[' + ','.join(_literal(item, strings) for item in value) + ']'
+    return json.dumps(value)
+
+
+def dumps(value, indent, compact=False, strings=None):
+    """json.dumps(value, indent=indent), or a minified literal in compact mode
+
+    strings is the hoist_strings table of the module the literal goes into.
+    """
+    if not compact:
+        return json.dumps(value, indent=indent)
+    if not strings:
+        return json.dumps(value, separators=(',', ':'))
+    return _literal(value, strings)
+
+
+def output_bytes(content):
+    """Size of a generated module as written to disk"""
+    return len(content.encode('utf-8'))
+
+
+def report_savings(savings):
+    """Print the bytes --compact saved per output file
+
+    savings is a list of (path, indented bytes, compact bytes).
+    """
+    if not savings:
+        return
+
+    print("\nCompact output:")
+    for path, before, after in savings:
+        print(f"  {str(path):<48} {before:>9,} → {after:>9,} bytes  {_percent(before, after)}")
+    before = sum(item[1] for item in savings)
+    after = sum(item[2] for item in savings)
+    print(f"  {'Total':<48} {before:>9,} → {after:>9,} bytes  {_percent(before, after)}")
+
+
+def _percent(before, after):
+    """Relative change from before to after, e.g. -34%"""
+    if not before:
+        return ''
+    return f"{(after - before) * 100 / before:+.0f}%"
@@ -1,5 +1,9 @@
 import { ImageWithFallback } from "../figma/ImageWithFallback";
-import { Highlight, themes } from "prism-react-renderer";
+import { lazy, Suspense } from "react";
+import { CodeLines, CodeToken, plainLines } from "./CodeLines";
+
+// Runtime highlighter, only loaded for code blocks without build-time tokens
+const PrismCode = lazy(() => import("./PrismCode"));
 
 export interface BlogContentBlock {
   type: "heading" | "subheading" | "heading3" | "paragraph" | "image" | "video" | "gif" | "code" | "quote";
@@ -9,6 +13,11 @@ export interface BlogContentBlock {
   language?: string;
   author?: string; // For quotes
   width?: string; // For images - e.g., "50%", "300px"
+  srcset?: string; // For images with responsive variants (--responsive-images)
+  sizes?: string;
+  imageWidth?: number; // Pixel size of local images, so their space is reserved before they load
+  imageHeight?: number;
+  tokens?: CodeToken[][]; // For code highlighted at build time (--highlight)
 }
 
 interface BlogContentProps {
@@ -117,8 +126,14 @@ export function BlogContent({ blocks }: BlogContentProps) {
               <figure key={index} className="border-2 border-border overflow-hidden" style={block.width ? { width: block.width, margin: '0 auto' } : {}}>
                 <ImageWithFallback
                   src={block.content}
+                  srcSet={block.srcset}
+                  sizes={block.sizes}
+                  width={block.imageWidth}
+                  height={block.imageHeight}
                   alt={block.alt || "Blog image"}
                   className="w-full h-auto"
+                  loading="lazy"
+                  decoding="async"
                 />
                 {block.alt && (
                   <figcaption className="px-4 py-3 border-t-2 border-border bg-secondary font-mono text-xs text-muted-foreground">
@@ -153,32 +168,16 @@ export function BlogContent({ blocks }: BlogContentProps) {
                 <div className="px-4 py-2 bg-secondary border-b-2 border-border font-mono text-xs text-muted-foreground">
                   {block.language || "code"}
                 </div>
-                <Highlight
-                  theme={themes.nightOwl}
-                  code={block.content.trim()}
-                  language={block.language || "javascript"}
-                >
-                  {({ className, style, tokens, getLineProps, getTokenProps }) => (
-                    <pre 
-                      className="p-6 overflow-x-auto text-sm" 
-                      style={{
-                        ...style,
-                        backgroundColor: '#011627',
-                      }}
-                    >
-                      {tokens.map((line, i) => (
-                        <div key={i} {...getLineProps({ line })}>
-                          <span className="inline-block w-8 text-right mr-4 text-muted-foreground select-none opacity-50">
-                            {i + 1}
-                          </span>
-                          {line.map((token, key) => (
-                            <span key={key} {...getTokenProps({ token })} />
-                          ))}
-                        </div>
-                      ))}
-                    </pre>
-                  )}
-                </Highlight>
+                {block.tokens ? (
+                  <CodeLines lines={block.tokens} />
+                ) : (
+                  <Suspense fallback={<CodeLines lines={plainLines(block.content.trim())} />}>
+                    <PrismCode
+                      code={block.content.trim()}
+                      language={block.language || "javascript"}
+                    />
+                  </Suspense>
+                )}
               </div>
             );
 
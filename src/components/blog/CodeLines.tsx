@@ -0,0 +1,67 @@
+import type { CSSProperties } from "react";
+
+// One line of a code block as [token type, text] spans, as generated by
+// buildblog.py / build_projects.py --highlight
+export type CodeToken = [string, string];
+
+// Night Owl colors (the theme PrismCode uses) by Prism token type
+const TOKEN_STYLES: Record<string, CSSProperties> = {
+  changed: { color: "rgb(162, 191, 252)", fontStyle: "italic" },
+  deleted: { color: "rgba(239, 83, 80, 0.56)", fontStyle: "italic" },
+  inserted: { color: "rgb(173, 219, 103)", fontStyle: "italic" },
+  "attr-name": { color: "rgb(173, 219, 103)", fontStyle: "italic" },
+  comment: { color: "rgb(99, 119, 119)", fontStyle: "italic" },
+  string: { color: "rgb(173, 219, 103)" },
+  url: { color: "rgb(173, 219, 103)" },
+  variable: { color: "rgb(214, 222, 235)" },
+  number: { color: "rgb(247, 140, 108)" },
+  builtin: { color: "rgb(130, 170, 255)" },
+  char: { color: "rgb(130, 170, 255)" },
+  constant: { color: "rgb(130, 170, 255)" },
+  function: { color: "rgb(130, 170, 255)" },
+  punctuation: { color: "rgb(199, 146, 234)" },
+  selector: { color: "rgb(199, 146, 234)", fontStyle: "italic" },
+  doctype: { color: "rgb(199, 146, 234)", fontStyle: "italic" },
+  "class-name": { color: "rgb(255, 203, 139)" },
+  tag: { color: "rgb(127, 219, 202)" },
+  operator: { color: "rgb(127, 219, 202)" },
+  keyword: { color: "rgb(127, 219, 202)" },
+  boolean: { color: "rgb(255, 88, 116)" },
+  property: { color: "rgb(128, 203, 196)" },
+  namespace: { color: "rgb(178, 204, 214)" },
+};
+
+interface CodeLinesProps {
+  lines: CodeToken[][];
+}
+
+// Renders pre-highlighted code without loading a highlighter in the browser
+export function CodeLines({ lines }: CodeLinesProps) {
+  return (
+    <pre
+      className="p-6 overflow-x-auto text-sm"
+      style={{
+        color: "#d6deeb",
+        backgroundColor: '#011627',
+      }}
+    >
+      {lines.map((line, i) => (
+        <div key={i} className="token-line">
+          <span className="inline-block w-8 text-right mr-4 text-muted-foreground select-none opacity-50">
+            {i + 1}
+          </span>
+          {line.map(([type, text], key) => (
+            <span key={key} className={`token ${type}`} style={TOKEN_STYLES[type]}>
+              {text}
+            </span>
+          ))}
+        </div>
+      ))}
+    </pre>
+  );
+}
+
+// Unhighlighted lines, shown while PrismCode is loading
+export function plainLines(code: string): CodeToken[][] {
+  return code.split("\n").map((line) => [["plain", line]]);
+}
@@ -0,0 +1,39 @@
+import { Highlight, themes } from "prism-react-renderer";
+
+interface PrismCodeProps {
+  code: string;
+  language: string;
+}
+
+// Highlights code in the browser; only loaded for code blocks that were not
+// highlighted at build time (see CodeLines)
+export default function PrismCode({ code, language }: PrismCodeProps) {
+  return (
+    <Highlight
+      theme={themes.nightOwl}
+      code={code}
+      language={language}
+    >
+      {({ className, style, tokens, getLineProps, getTokenProps }) => (
+        <pre
+          className="p-6 overflow-x-auto text-sm"
+          style={{
+            ...style,
+            backgroundColor: '#011627',
+          }}
+        >
+          {tokens.map((line, i) => (
+            <div key={i} {...getLineProps({ line })}>
+              <span className="inline-block w-8 text-right mr-4 text-muted-foreground select-none opacity-50">
+                {i + 1}
+              </span>
+              {line.map((token, key) => (
+                <span key={key} {...getTokenProps({ token })} />
+              ))}
+            </div>
+          ))}
+        </pre>
+      )}
+    </Highlight>
+  );
+}
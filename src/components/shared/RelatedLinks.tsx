@@ -0,0 +1,48 @@
+import { ArrowRight } from "lucide-react";
+import { useStaticJson } from "./staticData";
+
+interface RelatedLink {
+  slug: string;
+  title: string;
+  href: string;
+}
+
+interface RelatedLinksProps {
+  collection: "blog" | "projects";
+  slug?: string;
+  label: string;
+}
+
+// Related posts/projects precomputed by the generators (public/related/<collection>/<slug>.json)
+export function RelatedLinks({ collection, slug, label }: RelatedLinksProps) {
+  const related = useStaticJson<RelatedLink[]>(slug ? `/related/${collection}/${slug}.json` : null);
+  if (!related || related.length === 0) return null;
+
+  return (
+    <div className="mt-16 pt-8 border-t-2 border-border">
+      <p className="font-mono text-sm text-muted-foreground mb-4">{label}</p>
+      <div className="grid grid-cols-1 md:grid-cols-3 gap-3">
+        {related.map((link) => {
+          const isExternal = !link.href.startsWith("#");
+          return (
+            <a
+              key={link.slug}
+              href={link.href}
+              target={isExternal ? "_blank" : undefined}
+              rel={isExternal ? "noopener noreferrer" : undefined}
+              onClick={() => {
+                if (!isExternal) {
+                  setTimeout(() => window.scrollTo(0, 0), 10);
+                }
+              }}
+              className="flex items-center justify-between gap-3 px-4 py-3 border-2 border-border bg-background hover:bg-foreground hover:text-background transition-colors"
+            >
+              <span>{link.title}</span>
+              <ArrowRight className="w-4 h-4 flex-shrink-0" />
+            </a>
+          );
+        })}
+      </div>
+    </div>
+  );
+}
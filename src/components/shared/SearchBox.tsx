@@ -0,0 +1,75 @@
+import { useEffect, useState } from "react";
+import { ArrowRight, Search } from "lucide-react";
+import { search, SearchCollection, SearchResult } from "./search";
+
+interface SearchBoxProps {
+  collection: SearchCollection;
+  placeholder: string;
+}
+
+// Full-text search over the index the generators write to public/search/<collection>/
+export function SearchBox({ collection, placeholder }: SearchBoxProps) {
+  const [query, setQuery] = useState("");
+  const [results, setResults] = useState<SearchResult[] | null>(null);
+
+  useEffect(() => {
+    if (!query.trim()) {
+      setResults(null);
+      return;
+    }
+    let current = true;
+    // Wait for a pause in typing before fetching shards
+    const timer = setTimeout(() => {
+      search(collection, query)
+        .then((found) => current && setResults(found))
+        .catch((error) => console.error(error));
+    }, 200);
+    return () => {
+      current = false;
+      clearTimeout(timer);
+    };
+  }, [collection, query]);
+
+  return (
+    <div className="mb-8">
+      <label className="flex items-center gap-3 px-4 py-2 border-2 border-border bg-background max-w-xl">
+        <Search className="w-4 h-4 flex-shrink-0 text-muted-foreground" />
+        <input
+          type="search"
+          value={query}
+          onChange={(event) => setQuery(event.target.value)}
+          placeholder={placeholder}
+          className="w-full bg-transparent font-mono text-sm outline-none"
+        />
+      </label>
+
+      {results && (
+        <div className="mt-4 grid grid-cols-1 md:grid-cols-2 gap-3">
+          {results.length === 0 && (
+            <p className="font-mono text-sm text-muted-foreground">No matches.</p>
+          )}
+          {results.map((result) => {
+            const isExternal = !result.href.startsWith("#");
+            return (
+              <a
+                key={result.slug}
+                href={result.href}
+                target={isExternal ? "_blank" : undefined}
+                rel={isExternal ? "noopener noreferrer" : undefined}
+                onClick={() => {
+                  if (!isExternal) {
+                    setTimeout(() => window.scrollTo(0, 0), 10);
+                  }
+                }}
+                className="flex items-center justify-between gap-3 px-4 py-3 border-2 border-border bg-background hover:bg-foreground hover:text-background transition-colors"
+              >
+                <span>{result.title}</span>
+                <ArrowRight className="w-4 h-4 flex-shrink-0" />
+              </a>
+            );
+          })}
+        </div>
+      )}
+    </div>
+  );
+}
@@ -0,0 +1,43 @@
+// Loads the listing shards generated by buildblog.py / build_projects.py into
+// public/listings/<collection>/: index.json (featured card, category and tag
+// facets) and one page of cards at a time, already sorted and filtered.
+
+import { useStaticJson } from "./staticData";
+
+export type ListingCollection = "blog" | "projects";
+
+export interface Facet {
+  name: string;
+  slug: string;
+  count: number;
+}
+
+export interface ListingIndex<Card> {
+  version: number;
+  pageSize: number;
+  total: number;
+  featured: Card | null;
+  categories: Facet[];
+  tags: Facet[];
+}
+
+export interface ListingPage<Card> {
+  page: number;
+  pages: number;
+  total: number;
+  items: Card[];
+}
+
+// Shard of a category or tag facet, or of every entry
+export function listingShard(kind?: "category" | "tag", facet?: Facet): string {
+  return kind && facet ? `${kind}-${facet.slug}` : "all";
+}
+
+export function useListingIndex<Card>(collection: ListingCollection): ListingIndex<Card> | null {
+  return useStaticJson<ListingIndex<Card>>(`/listings/${collection}/index.json`);
+}
+
+// One page of a shard. The previous page stays in place until the next one has loaded.
+export function useListingPage<Card>(collection: ListingCollection, shard: string, page: number): ListingPage<Card> | null {
+  return useStaticJson<ListingPage<Card>>(`/listings/${collection}/${shard}-${page}.json`);
+}
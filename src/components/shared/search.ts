@@ -0,0 +1,95 @@
+// Queries the search index generated by buildblog.py / build_projects.py into
+// public/search/<collection>/. Only index.json, the shard of each query term and
+// the docs files of the best matches are fetched (a few kilobytes), and all of
+// them are kept for the rest of the session.
+
+import { fetchJson } from "./staticData";
+
+export type SearchCollection = "blog" | "projects";
+
+export interface SearchDoc {
+  slug: string;
+  title: string;
+  href: string;
+}
+
+export interface SearchResult extends SearchDoc {
+  score: number;
+}
+
+interface SearchIndex {
+  version: number;
+  documents: number;
+  // docs/<n>.json holds the documents from doc id n * docsPerFile on
+  docsPerFile: number;
+  shards: string[];
+}
+
+// [doc id, count, position, ...] - positions of the first occurrences, counted in terms
+type Posting = number[];
+
+// Same tokenization as search_index.py
+const MIN_TERM_LENGTH = 2;
+const STOP_WORDS = new Set([
+  "an", "and", "are", "as", "at", "be", "but", "by", "for", "from", "has", "have", "if", "in",
+  "into", "is", "it", "its", "of", "on", "or", "so", "that", "the", "their", "then", "there",
+  "these", "this", "to", "was", "we", "were", "which", "will", "with",
+]);
+
+export function queryTerms(query: string): string[] {
+  const text = query.normalize("NFKD").replace(/[^\x00-\x7f]/g, "").toLowerCase();
+  return (text.match(/[a-z0-9]+/g) ?? []).filter(
+    (term) => term.length >= MIN_TERM_LENGTH && !STOP_WORDS.has(term)
+  );
+}
+
+async function termPostings(collection: SearchCollection, index: SearchIndex, term: string): Promise<Posting[]> {
+  // Large shards are split, so the term lives in the shard with its longest prefix
+  let shard = "";
+  for (const prefix of index.shards) {
+    if (term.startsWith(prefix) && prefix.length > shard.length) {
+      shard = prefix;
+    }
+  }
+  if (!shard) {
+    return [];
+  }
+  const terms = await fetchJson<Record<string, Posting[]>>(`/search/${collection}/terms/${shard}.json`);
+  return terms[term] ?? [];
+}
+
+// Documents containing every query term, best first. Matches count more the more
+// often a term occurs and the earlier it first appears (the title and tags come first).
+export async function search(collection: SearchCollection, query: string, limit = 10): Promise<SearchResult[]> {
+  const terms = [...new Set(queryTerms(query))];
+  if (terms.length === 0) {
+    return [];
+  }
+
+  const index = await fetchJson<SearchIndex>(`/search/${collection}/index.json`);
+  const postings = await Promise.all(terms.map((term) => termPostings(collection, index, term)));
+
+  let scores: Map<number, number> | null = null;
+  for (const list of postings) {
+    const next = new Map<number, number>();
+    for (const [doc, count, first] of list) {
+      if (scores === null || scores.has(doc)) {
+        next.set(doc, (scores?.get(doc) ?? 0) + Math.log(1 + count) + 10 / (10 + first));
+      }
+    }
+    scores = next;
+  }
+
+  const best = [...(scores ?? new Map<number, number>())]
+    .sort((a, b) => b[1] - a[1])
+    .slice(0, limit);
+
+  const files = [...new Set(best.map(([doc]) => Math.floor(doc / index.docsPerFile)))];
+  const tables = new Map(await Promise.all(files.map(async (file) =>
+    [file, await fetchJson<SearchDoc[]>(`/search/${collection}/docs/${file}.json`)] as const
+  )));
+  return best.map(([doc, score]) => ({
+    ...tables.get(Math.floor(doc / index.docsPerFile))![doc % index.docsPerFile],
+    score,
+  }));
+}
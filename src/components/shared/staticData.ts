@@ -0,0 +1,43 @@
+// Fetches the JSON files the generators write to public/ (search index, listing
+// shards, related links). Each URL is requested once per session; a failed
+// request is retried on the next call.
+
+import { useEffect, useState } from "react";
+
+const cache = new Map<string, Promise<unknown>>();
+
+export function fetchJson<T>(url: string): Promise<T> {
+  let request = cache.get(url);
+  if (!request) {
+    request = fetch(url).then((response) => {
+      if (!response.ok) {
+        throw new Error(`Failed to load ${url}: ${response.status}`);
+      }
+      return response.json();
+    });
+    request.catch(() => cache.delete(url));
+    cache.set(url, request);
+  }
+  return request as Promise<T>;
+}
+
+// The data at url, or null until it has loaded (or if url is null). When url
+// changes, the previous data stays in place until the new one has loaded.
+export function useStaticJson<T>(url: string | null): T | null {
+  const [data, setData] = useState<T | null>(null);
+
+  useEffect(() => {
+    if (!url) {
+      return;
+    }
+    let current = true;
+    fetchJson<T>(url)
+      .then((loaded) => current && setData(loaded))
+      .catch((error) => console.error(error));
+    return () => {
+      current = false;
+    };
+  }, [url]);
+
+  return data;
+}
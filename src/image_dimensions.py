@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""
+Image Dimensions - Intrinsic pixel sizes of blog and project images
+Used by: buildblog.py, build_projects.py, build_watch.py
+
+Every image a post or project shows from this site gets its pixel size added
+('imageWidth'/'imageHeight' on image blocks, 'heroWidth'/'heroHeight' in the
+meta), so the page can reserve the space before the image loads. The size is
+read from the PNG, GIF, WebP or JPEG header (including the JPEG EXIF
+orientation) without decoding the image, and kept in .buildcache/
+image-dimensions.json keyed by path, size and mtime, so unchanged images are
+not opened again. The recorded stats also go into the build manifests, so a
+replaced image rebuilds the documents that show it.
+"""
+
+import json
+import os
+import struct
+import threading
+
+from build_manifest import CACHE_DIR
+from parse_cache import parser_version
+from image_variants import local_file
+
+
+DIMENSIONS_FILE = CACHE_DIR / 'image-dimensions.json'
+
+# Header parsing is part of the output; bump the index when it changes
+DIMENSIONS_VERSION = parser_version(__file__)
+
+# JPEG start-of-frame markers (everything from 0xC0 to 0xCF except DHT, JPG and DAC)
+_JPEG_SOF = set(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+
+# EXIF orientations that swap width and height
+_ROTATED = (5, 6, 7, 8)
+
+_index = None
+_lock = threading.Lock()
+
+
+def _png_size(header):
+    if header[12:16] == b'IHDR':
+        return struct.unpack('>II', header[16:24])
+    return None
+
+
+def _gif_size(header):
+    return struct.unpack('<HH', header[6:10])
+
+
+def _webp_size(header):
+    chunk = header[12:16]
+    if chunk == b'VP8 ' and header[23:26] == b'\x9d\x01\x2a':
+        width, height = struct.unpack('<HH', header[26:30])
+        return width & 0x3FFF, height & 0x3FFF
+    if chunk == b'VP8L' and header[20:21] == b'\x2f':
+        bits = int.from_bytes(header[21:25], 'little')
+        return (bits & 0x3FFF) + 1, ((bits >> 14) & 0x3FFF) + 1
+    if chunk == b'VP8X':
+        return int.from_bytes(header[24:27], 'little') + 1, int.from_bytes(header[27:30], 'little') + 1
+    return None
+
+
+def _exif_orientation(exif):
+    """Orientation tag of a JPEG APP1 Exif segment, or None"""
+    if exif[:6] != b'Exif\x00\x00':
+        return None
+    tiff = exif[6:]
+    order = {b'II': '<', b'MM': '>'}.get(tiff[:2])
+    if order is None or len(tiff) < 8:
+        return None
+
+    offset = struct.unpack(order + 'I', tiff[4:8])[0]
+    if offset + 2 > len(tiff):
+        return None
+    count = struct.unpack(order + 'H', tiff[offset:offset + 2])[0]
+    for i in range(count):
+        entry = tiff[offset + 2 + i * 12:offset + 14 + i * 12]
+        if len(entry) < 12:
+            break
+        tag, kind = struct.unpack(order + 'HH', entry[:4])
+        if tag == 0x0112 and kind == 3:
+            return struct.unpack(order + 'H', entry[8:10])[0]
+    return None
+
+
+def _jpeg_size(f):
+    """Walk the JPEG segments up to the first start-of-frame"""
+    orientation = None
+    f.seek(2)
+    while True:
+        marker = f.read(2)
+        while marker[:1] == b'\xff' and marker[1:] == b'\xff':
+            marker = marker[1:] + f.read(1)  # fill bytes
+        if len(marker) < 2 or marker[0] != 0xFF:
+            return None
+        if marker[1] in (0x01, *range(0xD0, 0xD8)):
+            continue  # markers without a length
+        length_bytes = f.read(2)
+        if len(length_bytes) < 2:
+            return None
+        length = struct.unpack('>H', length_bytes)[0]
+        if marker[1] in _JPEG_SOF:
+            height, width = struct.unpack('>xHH', f.read(5))
+            if orientation in _ROTATED:
+                width, height = height, width
+            return width, height
+        if marker[1] == 0xE1 and orientation is None:
+            orientation = _exif_orientation(f.read(length - 2))
+        else:
+            f.seek(length - 2, os.SEEK_CUR)
+
+
+def read_dimensions(path):
+    """Return the (width, height) of a PNG/GIF/WebP/JPEG file from its header, or None"""
+    try:
+        with open(path, 'rb') as f:
+            header = f.read(32)
+            if header.startswith(b'\x89PNG\r\n\x1a\n'):
+                size = _png_size(header)
+            elif header[:6] in (b'GIF87a', b'GIF89a'):
+                size = _gif_size(header)
+            elif header[:4] == b'RIFF' and header[8:12] == b'WEBP':
+                size = _webp_size(header)
+            elif header[:3] == b'\xff\xd8\xff':
+                size = _jpeg_size(f)
+            else:
+                size = None
+    except (OSError, struct.error):
+        return None
+
+    if not size or not all(size):
+        return None
+    return tuple(size)
+
+
+def load_index():
+    """Load the dimension index once per process, starting fresh if it is stale"""
+    global _index
+    with _lock:
+        if _index is None:
+            try:
+                index = json.loads(DIMENSIONS_FILE.read_text(encoding='utf-8'))
+            except (OSError, ValueError):
+                index = None
+            if not index or index.get('version') != DIMENSIONS_VERSION:
+                index = {'version': DIMENSIONS_VERSION, 'images': {}}
+            index['changed'] = False
+            _index = index
+        return _index
+
+
+def image_dimensions(source, found):
+    """Return the (width, height) of a local image file, recording its stats in found"""
+    try:
+        stat = source.stat()
+    except OSError:
+        return None
+
+    index = load_index()
+    key = str(source)
+    entry = index['images'].get(key)
+    if not entry or entry[:2] != [stat.st_size, stat.st_mtime_ns]:
+        size = read_dimensions(source)
+        entry = [stat.st_size, stat.st_mtime_ns, *size] if size else [stat.st_size, stat.st_mtime_ns]
+        with _lock:
+            index['images'][key] = entry
+            index['changed'] = True
+
+    found[key] = entry
+    return tuple(entry[2:]) or None
+
+
+def add_dimensions(blocks, meta, found):
+    """Add the pixel size of local images to image blocks and the hero meta
+
+    found collects {path: [size, mtime_ns, width, height]} of every image looked
+    at; record it in the manifest as 'images' and call save_index at the end.
+    """
+    hero = local_file(meta.get('heroImage')) if meta else None
+    if hero:
+        size = image_dimensions(hero, found)
+        if size:
+            meta['heroWidth'], meta['heroHeight'] = size
+
+    for block in blocks:
+        if block.get('type') not in ('image', 'gif'):
+            continue
+        source = local_file(block.get('content'))
+        size = image_dimensions(source, found) if source else None
+        if size:
+            block['imageWidth'], block['imageHeight'] = size
+
+
+def iter_dimensions(blocks, found):
+    """Yield blocks with image dimensions added, one block at a time (for streaming mode)"""
+    for block in blocks:
+        add_dimensions([block], None, found)
+        yield block
+
+
+def save_index(manifest=None):
+    """Write the index if it changed, first merging the images recorded in a manifest
+
+    Documents built in worker processes (--jobs) only return what they found,
+    so their images reach the index through the manifest.
+    """
+    index = load_index()
+    with _lock:
+        for entry in (manifest or {}).get('entries', {}).values():
+            for key, image in (entry.get('images') or {}).items():
+                if index['images'].get(key) != image:
+                    index['images'][key] = image
+                    index['changed'] = True
+        if not index['changed']:
+            return
+
+        # Forget images that no longer exist
+        index['images'] = {key: entry for key, entry in index['images'].items() if os.path.exists(key)}
+        data = {'version': index['version'], 'images': index['images']}
+        CACHE_DIR.mkdir(exist_ok=True)
+        tmp_file = DIMENSIONS_FILE.with_name(f'.{DIMENSIONS_FILE.name}.{os.getpid()}.{threading.get_ident()}.tmp')
+        tmp_file.write_text(json.dumps(data, indent=2, sort_keys=True), encoding='utf-8')
+        os.replace(tmp_file, DIMENSIONS_FILE)
+        index['changed'] = False
+
+
+def images_current(recorded):
+    """True if none of the images recorded by add_dimensions changed since"""
+    for path, entry in (recorded or {}).items():
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return False
+        if [stat.st_size, stat.st_mtime_ns] != entry[:2]:
+            return False
+    return True
@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+Image Variants - Responsive derivatives of blog and project images
+Used by: buildblog.py, build_projects.py, build_watch.py
+
+With --responsive-images every image served from this site that a post or
+project shows (image blocks and heroImage) is resized to the VARIANT_WIDTHS
+below its own width and re-encoded as WebP into public/variants/<hash>/, where
+<hash> is the hash of the source file. A variant that already exists is never
+written again, so unchanged images are only hashed, not reprocessed. Missing
+variants are written in a thread pool. The blocks get 'srcset' and 'sizes'
+and the meta gets 'heroSrcset' and 'heroSizes'; the original image stays the
+src fallback. Needs Pillow (optional, pip install pillow).
+
+public/variants/ is committed with the pages that reference it, so a fresh
+clone serves every srcset URL. The build manifests record the variant
+directories of each document, and asset_sync.py deletes the directories that
+no document uses any more.
+"""
+
+import os
+import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from urllib.parse import quote, unquote
+
+from build_manifest import file_digest
+from parse_cache import parser_version
+
+try:
+    from PIL import Image, ImageOps
+except ImportError:
+    Image = None
+
+
+PUBLIC_DIR = Path('../public')
+VARIANTS_DIR = PUBLIC_DIR / 'variants'
+VARIANTS_URL = '/variants'
+
+# Site URL prefixes whose files live in the asset trees rather than public/
+ASSET_ROOTS = {
+    '/blogs/': Path('assets/blogs'),
+    '/projects/': Path('assets/projects'),
+}
+
+# Only still raster images; SVGs scale anyway and GIFs may be animated
+VARIANT_EXTENSIONS = ['.png', '.jpg', '.jpeg', '.webp']
+VARIANT_WIDTHS = (480, 960, 1600)
+VARIANT_QUALITY = 80
+
+# Rendered widths: the article column is ~900px of max-w-7xl, the hero ~510px
+CONTENT_SIZES = '(min-width: 1280px) 900px, (min-width: 1024px) 70vw, 100vw'
+HERO_SIZES = '(min-width: 1280px) 510px, (min-width: 1024px) 40vw, 100vw'
+
+IMAGE_WORKERS = os.cpu_count() or 1
+
+# Variant settings are part of the output; bump the build manifests when they change
+IMAGES_VERSION = parser_version(__file__)
+
+# EXIF orientations that swap width and height
+_ROTATED = (5, 6, 7, 8)
+
+
+def local_file(url):
+    """Return the source file of a URL served from this site, or None"""
+    if not url or not url.startswith('/') or url.startswith('//'):
+        return None
+
+    path = unquote(url.split('?', 1)[0].split('#', 1)[0])
+    for prefix, root in ASSET_ROOTS.items():
+        if path.startswith(prefix):
+            source = root / path[len(prefix):]
+            break
+    else:
+        source = PUBLIC_DIR / path.lstrip('/')
+
+    return source if source.is_file() else None
+
+
+def local_image(url):
+    """Return the source file of an image URL that gets variants, or None"""
+    source = local_file(url)
+    if source is None or source.suffix.lower() not in VARIANT_EXTENSIONS:
+        return None
+    return source
+
+
+def plan_variants(source):
+    """Return the [(width, target path, url)] variants of an image, narrowest first"""
+    digest = file_digest(source)[:16]
+    with Image.open(source) as image:
+        width, height = image.size
+        if image.getexif().get(0x0112) in _ROTATED:
+            width = height
+
+    widths = {w for w in VARIANT_WIDTHS if w < width}
+    widths.add(min(width, VARIANT_WIDTHS[-1]))
+    return [
+        (w, VARIANTS_DIR / digest / f'{source.stem}-{w}.webp',
+         f'{VARIANTS_URL}/{digest}/{quote(source.stem)}-{w}.webp')
+        for w in sorted(widths)
+    ]
+
+
+def write_variant(source, target, width):
+    """Resize source to width and save it as WebP at target"""
+    with Image.open(source) as image:
+        image = ImageOps.exif_transpose(image)
+        if image.mode not in ('RGB', 'RGBA'):
+            has_alpha = 'A' in image.getbands() or 'transparency' in image.info
+            image = image.convert('RGBA' if has_alpha else 'RGB')
+        height = max(1, round(image.height * width / image.width))
+        resized = image.resize((width, height), Image.LANCZOS)
+
+    target.parent.mkdir(parents=True, exist_ok=True)
+    tmp_file = target.with_name(f'.{target.name}.{os.getpid()}.{threading.get_ident()}.tmp')
+    resized.save(tmp_file, 'WEBP', quality=VARIANT_QUALITY)
+    os.replace(tmp_file, target)
+
+
+def write_missing(plans):
+    """Write the variants in plans that do not exist yet, in a thread pool"""
+    missing = [
+        (source, target, width)
+        for source, variants in plans.items() if variants
+        for width, target, _ in variants if not target.exists()
+    ]
+    if not missing:
+        return
+
+    with ThreadPoolExecutor(max_workers=min(IMAGE_WORKERS, len(missing))) as pool:
+        list(pool.map(lambda job: write_variant(*job), missing))
+
+
+def _variants(url, plans):
+    """Variants of the image at url, planned once per source file"""
+    source = local_image(url)
+    if source is None:
+        return None
+    if source not in plans:
+        plans[source] = plan_variants(source)
+    return plans[source]
+
+
+def srcset(variants):
+    """srcset attribute value for a list of variants"""
+    return ', '.join(f'{url} {width}w' for width, _, url in variants)
+
+
+def variant_dirs(plans):
+    """Return the variant directories of the images in plans, sorted"""
+    return sorted({str(variants[0][1].parent) for variants in plans.values() if variants})
+
+
+def prune_variants(used):
+    """Delete the variant directories not in used, returning their paths"""
+    if not VARIANTS_DIR.exists():
+        return []
+    removed = sorted(path for path in VARIANTS_DIR.iterdir() if path.is_dir() and path not in used)
+    for path in removed:
+        shutil.rmtree(path)
+    return removed
+
+
+def add_responsive_images(blocks, meta, plans):
+    """Write the missing variants of the images in blocks and meta, and add srcset/sizes to them
+
+    plans collects the planned variants per source file; pass the same dict
+    for every call on one document so each image is planned once.
+    """
+    if Image is None:
+        return
+
+    hero = _variants(meta.get('heroImage'), plans) if meta else None
+    images = [
+        (block, _variants(block.get('content'), plans))
+        for block in blocks if block.get('type') == 'image'
+    ]
+    write_missing(plans)
+
+    if hero:
+        meta['heroSrcset'] = srcset(hero)
+        meta['heroSizes'] = HERO_SIZES
+    for block, variants in images:
+        if variants:
+            block['srcset'] = srcset(variants)
+            block['sizes'] = CONTENT_SIZES
+
+
+def write_variants(blocks, plans):
+    """Plan and write the variants of the images in blocks, leaving the blocks as they are
+
+    Streaming mode runs this as a first pass over a document, so the images are
+    encoded in one pool before the page is rendered (and timed).
+    """
+    if Image is None:
+        return
+
+    for block in blocks:
+        if block.get('type') == 'image':
+            _variants(block.get('content'), plans)
+    write_missing(plans)
+
+
+def iter_responsive(blocks, plans):
+    """Yield blocks with srcset/sizes added, one block at a time (for streaming mode)"""
+    for block in blocks:
+        add_responsive_images([block], None, plans)
+        yield block
+
@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+Inline Markup - Single-pass renderer for the styled text used in markdown content
+Used by: buildblog.py, build_projects.py, build.py
+
+Special tags:
+- **text** / *text* / _text_ - Bold and italic (blog/project dialect only)
+- [dev](url) - Routes through development page (blog/project dialect only)
+- [orange](text) - Orange colored text
+- [comment](text) - Code comment style
+- [link](url) - Regular external link
+- [orange-link](url) - Orange external link
+- [text](url) - Standard markdown link (orange)
+
+Each string is scanned once from left to right. Literal runs are copied in bulk
+and only the characters that can open a construct are inspected.
+
+Links and special tags are opaque to emphasis: a * or _ inside [text](url) or
+[name](value) never closes a run opened outside it. This differs from the old
+chain of re.sub passes, which applied bold and *italic* before links (so a *
+in a URL could end up as <em> inside the href) and could produce crossed tags
+such as '_a **b_ c**' -> '<em>a <strong>b</em> c</strong>'. Emphasis now only
+pairs delimiters at the same nesting level and outside links and tags.
+"""
+
+import re
+
+
+# Dialect used for blog posts and project pages
+BLOG_DIALECT = 'blog'
+
+# Dialect used for home.md and global.md (no emphasis, class= instead of className=)
+HOME_DIALECT = 'home'
+
+ORANGE_STYLE = "color: #ff6b3d;"
+LINK_ATTRS = "target='_blank' rel='noopener noreferrer'"
+
+# Characters that can open a construct, per dialect
+_OPENERS = {
+    BLOG_DIALECT: re.compile(r'[*_\[]'),
+    HOME_DIALECT: re.compile(r'\['),
+}
+
+# Link text only ever saw bold and *italic* before links were protected
+_LINK_TEXT_OPENERS = re.compile(r'\*')
+
+_TAG_ORDER = ('orange', 'comment', 'link', 'orange-link')
+
+
+def _render_tag(name, value, dialect):
+    """Render one of the [name](value) special tags"""
+    if name == 'orange':
+        return f"<span style='{ORANGE_STYLE}'>{value}</span>"
+    if name == 'comment':
+        class_attr = 'class' if dialect == HOME_DIALECT else 'className'
+        return f"<span {class_attr}='font-mono text-muted-foreground text-sm'>// {value}</span>"
+    if name == 'link':
+        return f"<a href='{value}' {LINK_ATTRS} style='text-decoration: underline;'>{value}</a>"
+    return f"<a href='{value}' {LINK_ATTRS} style='{ORANGE_STYLE} text-decoration: underline;'>{value}</a>"
+
+
+def _render_markdown_link(link_text, link_url):
+    return f"<a href='{link_url}' {LINK_ATTRS} style='{ORANGE_STYLE} text-decoration: underline;'>{link_text}</a>"
+
+
+def _render_dev_link(url):
+    return f"<a href='#/development?demo={url}' style='{ORANGE_STYLE} text-decoration: underline;'>View Resource</a>"
+
+
+def _match_dev(text, pos):
+    """Return (url, end) for a [dev](url) at pos, or None"""
+    if not text.startswith('[dev](', pos):
+        return None
+    close = text.find(')', pos + 6)
+    if close <= pos + 6:
+        return None
+    return text[pos + 6:close], close + 1
+
+
+def _match_markdown_link(text, pos, shadowed_by=None):
+    """Return (text, url, end) for a [text](url) at pos, or None
+
+    shadowed_by rejects the link when a higher priority construct starts inside
+    its text, so the scanner reaches that construct first.
+    """
+    close_bracket = text.find(']', pos + 1)
+    if close_bracket <= pos + 1 or not text.startswith('(', close_bracket + 1):
+        return None
+    if shadowed_by:
+        inner = text.find('[', pos + 1, close_bracket)
+        while inner != -1:
+            if shadowed_by(text, inner):
+                return None
+            inner = text.find('[', inner + 1, close_bracket)
+    close_paren = text.find(')', close_bracket + 2)
+    if close_paren <= close_bracket + 2:
+        return None
+    return text[pos + 1:close_bracket], text[close_bracket + 2:close_paren], close_paren + 1
+
+
+def _match_tag(text, pos):
+    """Return (name, value, end) for a [name](value) special tag at pos, or None"""
+    for name in _TAG_ORDER:
+        prefix = f'[{name}]('
+        if text.startswith(prefix, pos):
+            start = pos + len(prefix)
+            close = text.find(')', start)
+            if close != -1:
+                return name, text[start:close], close + 1
+    return None
+
+
+def _find_outside_links(text, delimiter, search):
+    """Find the next delimiter from search on that is not inside a link or special tag"""
+    while True:
+        found = text.find(delimiter, search)
+        if found == -1:
+            return -1
+        bracket = text.find('[', search, found)
+        if bracket == -1:
+            return found
+        construct = _match_dev(text, bracket) or _match_markdown_link(text, bracket) or _match_tag(text, bracket)
+        search = construct[-1] if construct else bracket + 1
+
+
+def _find_star_close(text, pos):
+    """Find the closing * of an *italic* run opened at pos, skipping **bold** pairs and links"""
+    search = pos + 1
+    while True:
+        star = _find_outside_links(text, '*', search)
+        if star == -1:
+            return -1
+        if not text.startswith('**', star):
+            return star if star > pos + 1 else -1
+        bold_close = _find_outside_links(text, '**', star + 2)
+        if bold_close == -1:
+            return -1
+        search = bold_close + 2
+
+
+def _find_underscore_close(text, pos):
+    """Find the closing _ of an _italic_ run opened at pos, skipping links"""
+    underscore = _find_outside_links(text, '_', pos + 1)
+    if underscore == -1 or underscore == pos + 1 or text.startswith('_', underscore + 1):
+        return -1
+    return underscore
+
+
+def _render(text, dialect, openers):
+    """Render one string (or nested run) in a single left-to-right scan"""
+    out = []
+    prev = ''
+    pos = 0
+    length = len(text)
+
+    while pos < length:
+        match = openers.search(text, pos)
+        if not match:
+            out.append(text[pos:])
+            break
+
+        start = match.start()
+        if start > pos:
+            out.append(text[pos:start])
+            prev = text[start - 1]
+        char = text[start]
+        html = None
+        end = start + 1
+
+        if char == '*':
+            if text.startswith('**', start):
+                close = _find_outside_links(text, '**', start + 2)
+                if close != -1:
+                    html = f"<strong>{_render(text[start + 2:close], dialect, openers)}</strong>"
+                    end = close + 2
+            elif prev != '*':
+                close = _find_star_close(text, start)
+                if close != -1:
+                    html = f"<em>{_render(text[start + 1:close], dialect, openers)}</em>"
+                    end = close + 1
+
+        elif char == '_':
+            if prev != '_':
+                close = _find_underscore_close(text, start)
+                if close != -1:
+                    html = f"<em>{_render(text[start + 1:close], dialect, openers)}</em>"
+                    end = close + 1
+
+        elif dialect == HOME_DIALECT:
+            tag = _match_tag(text, start)
+            if tag:
+                html = _render_tag(tag[0], tag[1], dialect)
+                end = tag[2]
+            else:
+                link = _match_markdown_link(text, start, _match_tag)
+                if link:
+                    html = _render_markdown_link(link[0], link[1])
+                    end = link[2]
+
+        else:
+            dev = _match_dev(text, start)
+            link = None if dev else _match_markdown_link(text, start, _match_dev)
+            tag = None if dev or link else _match_tag(text, start)
+            if dev:
+                html = _render_dev_link(dev[0])
+                end = dev[1]
+            elif link:
+                link_text = _render(link[0], dialect, _LINK_TEXT_OPENERS)
+                html = _render_markdown_link(link_text, link[1])
+                end = link[2]
+            elif tag:
+                html = _render_tag(tag[0], tag[1], dialect)
+                end = tag[2]
+
+        if html is None:
+            out.append(char)
+            prev = char
+        else:
+            out.append(html)
+            prev = '>'
+        pos = end
+
+    return ''.join(out)
+
+
+def render_inline(text, dialect=BLOG_DIALECT):
+    """Render inline markup in text to HTML in a single pass"""
+    if not text:
+        return text
+    return _render(text, dialect, _OPENERS[dialect])
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Listing Shards - Precomputed, paginated listings for BlogPage and ProjectsPage
+Used by: buildblog.py, build_projects.py (and build_watch.py through them)
+
+The blog and projects pages used to import the whole generated index and then
+filter, sort and paginate it in the browser on every render. Instead, the
+generators sort the active entries by displayOrder once and write them to
+public/listings/<collection>/ as fixed-size pages of slim card data:
+    index.json                      page size, total, featured card and the
+                                    category and tag facets with their counts
+    all-<page>.json                 every active entry
+    category-<slug>-<page>.json     one category
+    tag-<slug>-<page>.json          one tag
+Each page is {page, pages, total, items}. A list page loads index.json and the
+one page it shows (see components/shared/listings.ts). Pages whose content did
+not change are not rewritten, and pages that no longer exist are deleted.
+"""
+
+import json
+import re
+from pathlib import Path
+
+from output_writer import stage_output, stage_removal
+
+
+LISTINGS_DIR = Path('../public/listings')
+
+PAGE_SIZE = 6
+
+# Entries without a displayOrder go last, as in the pages
+DEFAULT_ORDER = 999
+
+
+def display_order(index):
+    """Return the index entries sorted by displayOrder (stable, so ties keep the file order)"""
+    return sorted(index, key=lambda entry: entry['meta'].get('displayOrder') or DEFAULT_ORDER)
+
+
+def is_active(entry):
+    """True unless the entry is marked active: false"""
+    return entry['meta'].get('active') is not False
+
+
+def facet_slug(name):
+    """File-name-safe slug of a category or tag"""
+    return re.sub(r'[^a-z0-9]+', '-', str(name).lower()).strip('-') or 'other'
+
+
+def facets(entries, values):
+    """Return [{name, slug, count}] of the facet values of the entries, with their entries
+
+    values(entry) returns the facet values of one entry. Facets are listed in
+    order of first appearance; names that slugify alike ('C' and 'C++') get
+    numbered slugs.
+    """
+    groups = {}
+    for entry in entries:
+        for name in values(entry):
+            group = groups.setdefault(name, []) if name else None
+            if group is not None and (not group or group[-1] is not entry):
+                group.append(entry)
+
+    result = []
+    slugs = set()
+    for name, group in groups.items():
+        slug = base = facet_slug(name)
+        number = 1
+        while slug in slugs:
+            number += 1
+            slug = f'{base}-{number}'
+        slugs.add(slug)
+        result.append(({'name': name, 'slug': slug, 'count': len(group)}, group))
+    return result
+
+
+def listing_pages(cards):
+    """Split cards into {page, pages, total, items} pages (always at least one)"""
+    pages = max(1, -(-len(cards) // PAGE_SIZE))
+    return [
+        {
+            'page': page,
+            'pages': pages,
+            'total': len(cards),
+            'items': cards[(page - 1) * PAGE_SIZE:page * PAGE_SIZE],
+        }
+        for page in range(1, pages + 1)
+    ]
+
+
+def stage_listings(collection, entries, card, featured, outputs):
+    """Stage the listing shards of a collection ('blog' or 'projects')
+
+    entries are the active index entries in display order, card(entry) returns
+    the card data of one entry and featured is the entry shown above the list
+    (or None).
+    """
+    listings_dir = LISTINGS_DIR / collection
+    cards = {id(entry): card(entry) for entry in entries}
+    categories = facets(entries, lambda entry: [entry['meta'].get('category')])
+    tags = facets(entries, lambda entry: entry['meta'].get('tags') or [])
+
+    shards = {'all': entries}
+    for prefix, groups in (('category', categories), ('tag', tags)):
+        for facet, group in groups:
+            shards[f"{prefix}-{facet['slug']}"] = group
+
+    index = {
+        'version': 1,
+        'pageSize': PAGE_SIZE,
+        'total': len(entries),
+        'featured': card(featured) if featured else None,
+        'categories': [facet for facet, _ in categories],
+        'tags': [facet for facet, _ in tags],
+    }
+    changed = stage_output(outputs, listings_dir / 'index.json', json.dumps(index, separators=(',', ':')))
+
+    live = {'index.json'}
+    for name, group in shards.items():
+        for page in listing_pages([cards[id(entry)] for entry in group]):
+            page_file = listings_dir / f"{name}-{page['page']}.json"
+            live.add(page_file.name)
+            changed |= stage_output(outputs, page_file, json.dumps(page, separators=(',', ':')))
+
+    if listings_dir.exists():
+        for page_file in listings_dir.glob('*.json'):
+            if page_file.name not in live:
+                stage_removal(outputs, page_file)
+                changed = True
+
+    if changed:
+        print(f"✓ Generated listings ({len(entries)} entries, {len(live) - 1} pages)")
+    else:
+        print("✓ Listings unchanged")
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Output Writer - Write-only-if-changed, atomically committed generated files
+Used by: buildblog.py, build_projects.py, build.py, build_watch.py
+
+Generated files are staged in memory while a script runs. Staging compares the
+new content against the bytes already on disk, so identical outputs are never
+rewritten and keep their mtime (Vite and tsc then skip them). commit_outputs
+writes every changed file to a temporary sibling first and only renames them
+into place once all of them were written, so a failed run leaves the previous
+tree intact instead of a mix of old and new files. Files are not fsynced: the
+renames guard against interrupted runs, and generated files can always be
+regenerated after a power loss.
+
+Pages rendered in streaming mode are written to their temporary file in pieces
+with write_temporary and staged with stage_file, which compares them against
+the existing output without loading either into memory.
+"""
+
+import filecmp
+import os
+from pathlib import Path
+
+from build_trace import trace_span
+
+
+def start_outputs():
+    """Return an empty batch of staged outputs"""
+    return {'staged': {}, 'files': {}, 'unchanged': set(), 'removed': set()}
+
+
+def stage_output(outputs, path, content):
+    """Stage content for path, returning True if it differs from the file on disk"""
+    path = Path(path)
+    data = content.encode('utf-8')
+    key = str(path)
+
+    _unstage(outputs, key)
+
+    with trace_span('stage_output', 'write', file=key, bytes=len(data)) as span:
+        try:
+            unchanged = path.stat().st_size == len(data) and path.read_bytes() == data
+        except OSError:
+            unchanged = False
+        span['changed'] = not unchanged
+
+    if unchanged:
+        outputs['unchanged'].add(key)
+    else:
+        outputs['staged'][key] = data
+    return not unchanged
+
+
+def write_temporary(path, chunks):
+    """Write an iterable of str chunks to a temporary sibling of path, returning its path"""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f'.{path.name}.{os.getpid()}.tmp')
+    try:
+        with open(tmp_path, 'w', encoding='utf-8', newline='') as f:
+            for chunk in chunks:
+                f.write(chunk)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    return tmp_path
+
+
+def stage_file(outputs, path, tmp_path):
+    """Stage a file written by write_temporary for path, returning True if it differs"""
+    path = Path(path)
+    tmp_path = Path(tmp_path)
+    key = str(path)
+
+    _unstage(outputs, key)
+
+    try:
+        unchanged = (path.stat().st_size == tmp_path.stat().st_size
+                     and filecmp.cmp(tmp_path, path, shallow=False))
+    except OSError:
+        unchanged = False
+
+    if unchanged:
+        tmp_path.unlink()
+        outputs['unchanged'].add(key)
+    else:
+        outputs['files'][key] = tmp_path
+    return not unchanged
+
+
+def stage_removal(outputs, path):
+    """Stage an output that is no longer generated for deletion"""
+    key = str(path)
+    _unstage(outputs, key)
+    if Path(path).exists():
+        outputs['removed'].add(key)
+
+
+def _unstage(outputs, key):
+    outputs['staged'].pop(key, None)
+    outputs['unchanged'].discard(key)
+    outputs['removed'].discard(key)
+    tmp_path = outputs['files'].pop(key, None)
+    if tmp_path:
+        tmp_path.unlink(missing_ok=True)
+
+
+def commit_outputs(outputs):
+    """Write all changed outputs via temporary files and atomic renames
+
+    Outputs staged for removal are deleted once the others are in place.
+    Returns the list of paths that were actually changed or removed.
+    """
+    pending = []
+    try:
+        for key, data in outputs['staged'].items():
+            path = Path(key)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_name(f'.{path.name}.tmp')
+            # Registered first, so a failed write still removes its temporary file
+            pending.append((tmp_path, path))
+            with trace_span('write', 'write', file=key, bytes=len(data)):
+                tmp_path.write_bytes(data)
+    except BaseException:
+        for tmp_path, _ in pending:
+            tmp_path.unlink(missing_ok=True)
+        for tmp_path in outputs['files'].values():
+            tmp_path.unlink(missing_ok=True)
+        raise
+
+    pending += [(tmp_path, Path(key)) for key, tmp_path in outputs['files'].items()]
+    for tmp_path, path in pending:
+        os.replace(tmp_path, path)
+    for key in outputs['removed']:
+        Path(key).unlink(missing_ok=True)
+
+    changed = [str(path) for _, path in pending] + sorted(outputs['removed'])
+    outputs['staged'].clear()
+    outputs['files'].clear()
+    outputs['removed'].clear()
+    return changed
+
+
+def report_outputs(changed, outputs):
+    """Print how many staged outputs actually changed"""
+    total = len(changed) + len(outputs['unchanged'])
+    print(f"✓ Wrote {len(changed)} of {total} outputs ({len(outputs['unchanged'])} unchanged)")
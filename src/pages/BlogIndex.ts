@@ -1,5 +1,6 @@
 // Auto-generated blog index - DO NOT EDIT MANUALLY
 // This file is generated by buildblog.py
+import { lazy } from "react";
 
 export interface BlogMeta {
   title: string;
@@ -9,6 +10,10 @@ export interface BlogMeta {
   author: string;
   authorAvatar: string;
   heroImage?: string;
+  heroSrcset?: string;
+  heroSizes?: string;
+  heroWidth?: number;
+  heroHeight?: number;
   tags: string[];
   slug: string;
   excerpt?: string;
@@ -77,7 +82,9 @@ export const BLOG_INDEX: BlogIndexEntry[] = [
       "featuredOnBlog": true,
       "displayOrder": 3,
       "external": false,
-      "externalUrl": null
+      "externalUrl": null,
+      "heroWidth": 738,
+      "heroHeight": 670
     }
   },
   {
@@ -135,13 +142,10 @@ export const BLOG_INDEX: BlogIndexEntry[] = [
   }
 ];
 
-// Import all generated blog page components
-import { BuildingScalableMicroservicesPage } from "./BuildingScalableMicroservicesPage";
-import { PytorchCertificationCoursePage } from "./PytorchCertificationCoursePage";
-import { ReactPerformanceOptimizationPage } from "./ReactPerformanceOptimizationPage";
-
+// Blog page components, each loaded in its own chunk on first visit
+// (render them inside a <Suspense> boundary)
 export const BLOG_COMPONENTS = {
-  "building-scalable-microservices": BuildingScalableMicroservicesPage,
-  "pytorch-certification-course": PytorchCertificationCoursePage,
-  "react-performance-optimization": ReactPerformanceOptimizationPage,
+  "building-scalable-microservices": lazy(() => import("./BuildingScalableMicroservicesPage").then((module) => ({ default: module.BuildingScalableMicroservicesPage }))),
+  "pytorch-certification-course": lazy(() => import("./PytorchCertificationCoursePage").then((module) => ({ default: module.PytorchCertificationCoursePage }))),
+  "react-performance-optimization": lazy(() => import("./ReactPerformanceOptimizationPage").then((module) => ({ default: module.ReactPerformanceOptimizationPage }))),
 };
@@ -4,10 +4,12 @@ import { Footer } from "../components/Footer";
 import { ImageWithFallback } from "../components/figma/ImageWithFallback";
 import { TableOfContents } from "../components/blog/TableOfContents";
 import { BlogContent, BlogContentBlock } from "../components/blog/BlogContent";
+import { RelatedLinks } from "../components/shared/RelatedLinks";
+import type { ProjectMeta } from "./ProjectIndex";
 
 export function IbmFoundationModelsContributionPage() {
   // Project data generated from markdown
-  const projectData = {
+  const projectData: ProjectMeta = {
     "title": "IBM Foundation Models Stack Enhancement",
     "category": "OPEN SOURCE",
     "date": "Summer 2024",
@@ -303,6 +305,10 @@ export function IbmFoundationModelsContributionPage() {
                   <div className="relative h-full min-h-[250px] lg:min-h-[400px]">
                     <ImageWithFallback
                       src={projectData.heroImage}
+                      srcSet={projectData.heroSrcset}
+                      sizes={projectData.heroSizes}
+                      width={projectData.heroWidth}
+                      height={projectData.heroHeight}
                       alt={projectData.title}
                       className="w-full h-full object-cover"
                     />
@@ -429,6 +435,9 @@ export function IbmFoundationModelsContributionPage() {
                   </div>
                 </div>
                 )}
+
+                {/* Related Projects */}
+                <RelatedLinks collection="projects" slug={projectData.slug} label="// RELATED PROJECTS" />
               </div>
             </article>
           </div>
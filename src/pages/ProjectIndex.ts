@@ -1,6 +1,7 @@
 // Auto-generated project index
 // This file is automatically generated by build_projects.py
 // Do not edit manually
+import { lazy } from "react";
 
 export interface ProjectMeta {
   title: string;
@@ -10,6 +11,10 @@ export interface ProjectMeta {
   location?: string;
   type?: string;
   heroImage?: string;
+  heroSrcset?: string;
+  heroSizes?: string;
+  heroWidth?: number;
+  heroHeight?: number;
   tags: string[];
   github?: string;
   demo?: string;
@@ -29,11 +34,6 @@ export interface ProjectIndexItem {
   meta: ProjectMeta;
 }
 
-// Import all project page components
-import { AdasValidationSimulationPage } from "./AdasValidationSimulationPage";
-import { IbmFoundationModelsContributionPage } from "./IbmFoundationModelsContributionPage";
-import { ProprietaryLlmDevelopmentPage } from "./ProprietaryLlmDevelopmentPage";
-
 // Project index with metadata
 export const PROJECT_INDEX: ProjectIndexItem[] = [
   {
@@ -74,7 +74,6 @@ export const PROJECT_INDEX: ProjectIndexItem[] = [
       "displayOrder": 2
     }
   },
-
   {
     "slug": "ibm-foundation-models-contribution",
     "meta": {
@@ -155,9 +154,10 @@ export const PROJECT_INDEX: ProjectIndexItem[] = [
   }
 ];
 
-// Project components mapping
+// Project components mapping, each page loaded in its own chunk on first visit
+// (render them inside a <Suspense> boundary)
 export const PROJECT_COMPONENTS = {
-  "adas-validation-simulation": AdasValidationSimulationPage,
-  "ibm-foundation-models-contribution": IbmFoundationModelsContributionPage,
-  "proprietary-llm-development": ProprietaryLlmDevelopmentPage,
+  "adas-validation-simulation": lazy(() => import("./AdasValidationSimulationPage").then((module) => ({ default: module.AdasValidationSimulationPage }))),
+  "ibm-foundation-models-contribution": lazy(() => import("./IbmFoundationModelsContributionPage").then((module) => ({ default: module.IbmFoundationModelsContributionPage }))),
+  "proprietary-llm-development": lazy(() => import("./ProprietaryLlmDevelopmentPage").then((module) => ({ default: module.ProprietaryLlmDevelopmentPage }))),
 };
@@ -5,10 +5,12 @@ import { ImageWithFallback } from "../components/figma/ImageWithFallback";
 import { TableOfContents } from "../components/blog/TableOfContents";
 import { BlogContent, BlogContentBlock } from "../components/blog/BlogContent";
 import { GiscusComments } from "../components/GiscusComments";
+import { RelatedLinks } from "../components/shared/RelatedLinks";
+import type { BlogMeta } from "./BlogIndex";
 
 export function PytorchCertificationCoursePage() {
   // Blog post data generated from markdown
-  const blogPost = {
+  const blogPost: BlogMeta = {
     "title": "Contributing to PyTorch Foundation's Certification Training Course",
     "category": "MACHINE LEARNING",
     "date": "Oct 21, 2025",
@@ -29,7 +31,9 @@ export function PytorchCertificationCoursePage() {
     "featuredOnBlog": true,
     "displayOrder": 3,
     "external": false,
-    "externalUrl": null
+    "externalUrl": null,
+    "heroWidth": 738,
+    "heroHeight": 670
 };
 
   const tocItems = [
@@ -156,7 +160,9 @@ export function PytorchCertificationCoursePage() {
     {
         "type": "image",
         "content": "/blogs/Pytorch_Course/10_21_2025_Reflection_Post/Lesson_design_storyboard_vs_actual_lesson_draft.png",
-        "alt": "Lesson Design Storyboard (Brainstorming from Granite Cookbook)"
+        "alt": "Lesson Design Storyboard (Brainstorming from Granite Cookbook)",
+        "imageWidth": 1084,
+        "imageHeight": 1048
     },
     {
         "type": "paragraph",
@@ -226,7 +232,9 @@ export function PytorchCertificationCoursePage() {
     {
         "type": "image",
         "content": "/blogs/Pytorch_Course/10_21_2025_Reflection_Post/course_launch_at_pytorch_conference.png",
-        "alt": "Course Launch at PyTorch Conference"
+        "alt": "Course Launch at PyTorch Conference",
+        "imageWidth": 1857,
+        "imageHeight": 1027
     },
     {
         "type": "paragraph",
@@ -329,7 +337,9 @@ export function PytorchCertificationCoursePage() {
         "type": "image",
         "content": "/blogs/Pytorch_Course/10_21_2025_Reflection_Post/Lesson_common_pattern.png",
         "alt": "Lesson Storyboard",
-        "width": "50%"
+        "width": "50%",
+        "imageWidth": 3208,
+        "imageHeight": 14300
     },
     {
         "type": "heading",
@@ -380,6 +390,10 @@ export function PytorchCertificationCoursePage() {
                   <div className="relative h-full min-h-[250px] lg:min-h-[400px]">
                     <ImageWithFallback
                       src={blogPost.heroImage}
+                      srcSet={blogPost.heroSrcset}
+                      sizes={blogPost.heroSizes}
+                      width={blogPost.heroWidth}
+                      height={blogPost.heroHeight}
                       alt={blogPost.title}
                       className="w-full h-full object-cover"
                     />
@@ -503,6 +517,9 @@ export function PytorchCertificationCoursePage() {
                     </button>
                   </div>
                 </div>
+
+                {/* Related Posts */}
+                <RelatedLinks collection="blog" slug={blogPost.slug} label="// RELATED POSTS" />
               </div>
             </article>
           </div>
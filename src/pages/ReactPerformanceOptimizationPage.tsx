@@ -5,10 +5,12 @@ import { ImageWithFallback } from "../components/figma/ImageWithFallback";
 import { TableOfContents } from "../components/blog/TableOfContents";
 import { BlogContent, BlogContentBlock } from "../components/blog/BlogContent";
 import { GiscusComments } from "../components/GiscusComments";
+import { RelatedLinks } from "../components/shared/RelatedLinks";
+import type { BlogMeta } from "./BlogIndex";
 
 export function ReactPerformanceOptimizationPage() {
   // Blog post data generated from markdown
-  const blogPost = {
+  const blogPost: BlogMeta = {
     "title": "React Performance Optimization Techniques",
     "category": "FRONTEND",
     "date": "Oct 5, 2025",
@@ -159,6 +161,10 @@ export function ReactPerformanceOptimizationPage() {
                   <div className="relative h-full min-h-[250px] lg:min-h-[400px]">
                     <ImageWithFallback
                       src={blogPost.heroImage}
+                      srcSet={blogPost.heroSrcset}
+                      sizes={blogPost.heroSizes}
+                      width={blogPost.heroWidth}
+                      height={blogPost.heroHeight}
                       alt={blogPost.title}
                       className="w-full h-full object-cover"
                     />
@@ -282,6 +288,9 @@ export function ReactPerformanceOptimizationPage() {
                     </button>
                   </div>
                 </div>
+
+                {/* Related Posts */}
+                <RelatedLinks collection="blog" slug={blogPost.slug} label="// RELATED POSTS" />
               </div>
             </article>
           </div>
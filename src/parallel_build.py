@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Parallel Build - Fan per-document work out across worker processes
+Used by: buildblog.py, build_projects.py
+
+Parsing and rendering a document is pure CPU work, so with --jobs N the
+documents are spread over a process pool. The largest files are handed out
+first so one big post does not end up alone at the tail of the run, and the
+results are always yielded back in the caller's order so generated indexes
+stay deterministic regardless of which worker finished first.
+
+With --trace every document is traced in the worker that built it, and the
+workers' events come back with the results (see build_trace.py).
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+from build_trace import trace_span, traced_worker, merge_trace
+
+
+def add_jobs_argument(parser):
+    """Add the shared -j/--jobs option to an argparse parser"""
+    parser.add_argument('-j', '--jobs', type=int, default=1, metavar='N',
+                        help='build documents in N worker processes (0 = one per CPU)')
+
+
+def resolve_jobs(jobs):
+    """Turn the --jobs value into a worker count"""
+    if jobs is None or jobs < 0:
+        return 1
+    if jobs == 0:
+        return os.cpu_count() or 1
+    return jobs
+
+
+def map_documents(worker, files, jobs=1, *args):
+    """Yield (file, worker(file, *args)) for every file, in the order given
+
+    With one job (or a single file) documents are built lazily in-process.
+    """
+    jobs = resolve_jobs(jobs)
+    worker = traced_worker(worker)
+
+    if jobs <= 1 or len(files) < 2:
+        for file in files:
+            yield file, worker(file, *args)
+        return
+
+    # Largest first, in chunks of similarly sized documents
+    by_size = sorted(files, key=lambda f: f.stat().st_size, reverse=True)
+    chunksize = max(1, len(by_size) // (jobs * 8))
+    call = partial(_call, worker, args)
+
+    with trace_span('map_documents', 'build', jobs=jobs, files=len(files)):
+        with ProcessPoolExecutor(max_workers=min(jobs, len(by_size))) as pool:
+            results = dict(zip(by_size, pool.map(call, by_size, chunksize=chunksize)))
+
+    for file in files:
+        yield file, merge_trace(results[file])
+
+
+def _call(worker, args, file):
+    return worker(file, *args)
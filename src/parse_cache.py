@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Parse Cache - Content-addressed cache of parsed document models
+Used by: buildblog.py, build_projects.py, build.py, build_watch.py, code_highlight.py, search_index.py
+
+The dicts returned by the parse_*_markdown functions (meta, toc and content
+blocks, with styled HTML already rendered) are stored as JSON in
+.buildcache/models/<namespace>/, named by the hash of the source content plus
+the parser version. The parser version only covers the parse functions, the
+line parsers they wrap, inline_markup.py and stream_build.py, so editing a page
+template re-renders every page without re-parsing anything. Because the key does not depend on paths or mtimes, the
+directory can also be restored in CI or on a fresh clone to skip parsing.
+"""
+
+import hashlib
+import inspect
+import json
+import os
+from pathlib import Path
+
+from build_manifest import CACHE_DIR, content_digest
+from build_trace import trace_span
+
+
+MODEL_DIR = CACHE_DIR / 'models'
+
+
+def parser_version(*parts):
+    """Hash parse functions (by their source) and whole source files into a version string"""
+    digest = hashlib.sha256()
+    for part in parts:
+        if callable(part):
+            digest.update(inspect.getsource(part).encode('utf-8'))
+        else:
+            digest.update(Path(part).read_bytes())
+    return digest.hexdigest()[:16]
+
+
+def load_model(namespace, content, version, parse):
+    """Return (model, key, cached) for content, calling parse(content) only on a miss
+
+    key identifies the cached model; record it in the build manifest entry as
+    'model' so evict_models keeps it.
+    """
+    key = content_digest(f'{version}\n{content}')
+    with trace_span(parse.__name__, 'parse', chars=len(content)) as span:
+        model = read_model(namespace, key)
+        span['cached'] = model is not None
+        if model is not None:
+            return model, key, True
+
+        model = parse(content)
+
+        # Written before the caller gets a chance to modify the model
+        write_model(namespace, key, model)
+
+    return model, key, False
+
+
+def read_model(namespace, key):
+    """Return the cached model stored under key, or None"""
+    try:
+        return json.loads((MODEL_DIR / namespace / f'{key}.json').read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return None
+
+
+def write_model(namespace, key, model):
+    """Store a model under key (for models derived from something other than the source text)"""
+    model_file = MODEL_DIR / namespace / f'{key}.json'
+    model_file.parent.mkdir(parents=True, exist_ok=True)
+    tmp_file = model_file.with_name(f'.{key}.{os.getpid()}.tmp')
+    tmp_file.write_text(json.dumps(model), encoding='utf-8')
+    os.replace(tmp_file, model_file)
+
+
+def evict_models(namespace, manifest, field='model'):
+    """Delete cached models no manifest entry refers to, returning how many were removed
+
+    field is the entry data holding the key (or list of keys) of each source's
+    models. Call after save_manifest, which drops the entries of deleted sources.
+    """
+    namespace_dir = MODEL_DIR / namespace
+    if not namespace_dir.exists():
+        return 0
+
+    live = set()
+    for entry in manifest['entries'].values():
+        keys = entry.get(field)
+        if isinstance(keys, list):
+            live.update(keys)
+        else:
+            live.add(keys)
+    removed = 0
+    for model_file in namespace_dir.glob('*.json'):
+        if model_file.stem not in live:
+            model_file.unlink(missing_ok=True)
+            removed += 1
+    return removed
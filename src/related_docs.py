@@ -0,0 +1,327 @@
+#!/usr/bin/env python3
+"""
+Related Documents - Top-k related posts/projects by TF-IDF similarity
+Used by: buildblog.py, build_projects.py, build_watch.py
+
+Each document is a sparse TF-IDF vector of the terms of its search term map
+(see search_index.py: meta and the text of the content blocks) plus its tags
+and technologies as whole features, weighted up by TAG_WEIGHT. Two documents
+are related by the cosine of their vectors. Scores are accumulated through an
+inverted index, keeping each document's MAX_TERMS strongest features and each
+feature's MAX_POSTINGS strongest documents, so the cost grows with the number
+of documents rather than with every pair of them. NumPy is used for the
+accumulation when it is installed, plain dicts otherwise.
+
+Results are cached in .buildcache/related-<collection>.json by the documents'
+term map keys (hashes of their markdown), together with each document's
+features and vector and the document frequency of every feature. Only changed
+documents are read, vectorized and scored again, plus the documents whose
+related list they enter or leave; unchanged documents keep their cached
+vector. Their idf is refreshed on the next full scoring, which happens when
+more than FULL_RESCORE of the documents changed or the cache is stale.
+
+The top RELATED_COUNT of each document are written to
+public/related/<collection>/<slug>.json as [{slug, title, href}] and shown at
+the end of its page by components/shared/RelatedLinks.tsx. The cache keeps the
+JSON of every file as well, so only files whose content changed are restaged.
+Equal scores are ordered by slug, so adding or removing a document does not
+reorder the ties of the others.
+"""
+
+import json
+import math
+import os
+import threading
+from pathlib import Path
+
+from build_manifest import CACHE_DIR
+from output_writer import stage_output, stage_removal
+from parse_cache import parser_version, read_model
+from search_index import text_terms
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+RELATED_DIR = Path('../public/related')
+
+# Scoring is part of the cached results; bump them when it changes
+RELATED_VERSION = parser_version(__file__)
+
+RELATED_COUNT = 3
+TAG_WEIGHT = 3.0
+MAX_TERMS = 64
+MAX_POSTINGS = 256
+MIN_SCORE = 0.01
+
+# Fraction of changed documents above which everything is scored again
+FULL_RESCORE = 0.25
+
+
+def document_features(terms, meta):
+    """Return the {feature: count} of a document from its term map and meta tags"""
+    features = {term: posting[0] for term, posting in (terms or {}).items()}
+    for tag in (meta.get('tags') or []) + (meta.get('technologies') or []):
+        feature = 'tag:' + ' '.join(text_terms(str(tag)))
+        if feature != 'tag:':
+            features[feature] = features.get(feature, 0) + TAG_WEIGHT
+    return features
+
+
+def document_frequency(documents):
+    """Return {feature: number of documents that have it} for {feature: count} documents"""
+    frequency = {}
+    for features in documents:
+        for feature in features:
+            frequency[feature] = frequency.get(feature, 0) + 1
+    return frequency
+
+
+def tfidf_vector(features, frequency, count):
+    """Return the unit-length {feature: weight} vector of a {feature: count} document
+
+    The norm covers every feature, but only the MAX_TERMS strongest features
+    shared with another document are kept, as the rest cannot add to a score.
+    Features every document has get no weight.
+    """
+    weights = {}
+    for feature, tf in features.items():
+        weight = (1 + math.log(tf)) * math.log(count / frequency[feature])
+        if weight > 0:
+            weights[feature] = weight
+    norm = math.sqrt(sum(weight * weight for weight in weights.values())) or 1.0
+    shared = [(feature, weight) for feature, weight in weights.items() if frequency[feature] > 1]
+    strongest = sorted(shared, key=lambda item: (-item[1], item[0]))[:MAX_TERMS]
+    return {feature: weight / norm for feature, weight in strongest}
+
+
+def tfidf_vectors(documents):
+    """Return the vector of each {feature: count} document (see tfidf_vector)"""
+    frequency = document_frequency(documents)
+    return [tfidf_vector(features, frequency, len(documents)) for features in documents]
+
+
+def inverted_index(vectors):
+    """Return {feature: [(doc id, weight)]}, keeping the MAX_POSTINGS strongest per feature"""
+    postings = {}
+    for doc_id, vector in enumerate(vectors):
+        for feature, weight in vector.items():
+            postings.setdefault(feature, []).append((doc_id, weight))
+    for feature, docs in postings.items():
+        if len(docs) > MAX_POSTINGS:
+            docs.sort(key=lambda item: -item[1])
+            del docs[MAX_POSTINGS:]
+    return postings
+
+
+def _python_scores(vectors, postings, targets):
+    rows = {}
+    for doc_id in targets:
+        scores = {}
+        for feature, weight in vectors[doc_id].items():
+            for other, other_weight in postings.get(feature, ()):
+                scores[other] = scores.get(other, 0.0) + weight * other_weight
+        scores.pop(doc_id, None)
+        rows[doc_id] = scores
+    return rows
+
+
+def _numpy_scores(vectors, postings, targets):
+    # Postings as flat arrays, sliced per feature
+    features = {}
+    doc_ids = []
+    weights = []
+    for feature, docs in postings.items():
+        features[feature] = (len(doc_ids), len(doc_ids) + len(docs))
+        doc_ids.extend(doc for doc, _ in docs)
+        weights.extend(weight for _, weight in docs)
+    doc_ids = numpy.array(doc_ids, dtype=numpy.int64)
+    weights = numpy.array(weights, dtype=numpy.float64)
+
+    rows = {}
+    for doc_id in targets:
+        spans = [(*features[feature], weight) for feature, weight in vectors[doc_id].items() if feature in features]
+        if not spans:
+            rows[doc_id] = {}
+            continue
+        starts, ends, factors = (numpy.array(column) for column in zip(*spans))
+        lengths = ends - starts
+        # Positions of every posting of the document's features, and the feature weight of each
+        index = numpy.repeat(starts - numpy.cumsum(lengths) + lengths, lengths) + numpy.arange(lengths.sum())
+        factors = numpy.repeat(factors, lengths)
+        totals = numpy.bincount(doc_ids[index], weights=weights[index] * factors, minlength=len(vectors))
+        totals[doc_id] = 0.0
+        others = numpy.nonzero(totals)[0]
+        rows[doc_id] = dict(zip(others.tolist(), totals[others].tolist()))
+    return rows
+
+
+def similarity_rows(vectors, targets, postings=None):
+    """Return {doc id: {other doc id: cosine}} for the target documents
+
+    postings is inverted_index(vectors), built here if not given.
+    """
+    if postings is None:
+        postings = inverted_index(vectors)
+    if numpy is not None:
+        return _numpy_scores(vectors, postings, targets)
+    return _python_scores(vectors, postings, targets)
+
+
+def top_related(scores, listed, slugs):
+    """The RELATED_COUNT best [doc id, score] of a score row, above MIN_SCORE and in listed, ties by slug"""
+    best = sorted(((doc, score) for doc, score in scores.items() if score >= MIN_SCORE and doc in listed),
+                  key=lambda item: (-item[1], slugs[item[0]]))
+    return [[doc, round(score, 6)] for doc, score in best[:RELATED_COUNT]]
+
+
+def load_cache(collection):
+    """Load the cached related lists of a collection, or an empty cache if it is stale"""
+    try:
+        cache = json.loads((CACHE_DIR / f'related-{collection}.json').read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        cache = None
+    if not cache or cache.get('version') != RELATED_VERSION:
+        cache = {'version': RELATED_VERSION, 'related': {}, 'features': {}, 'vectors': {}, 'frequency': {},
+                 'files': {}}
+    return cache
+
+
+def save_cache(collection, cache):
+    """Write the cache atomically"""
+    cache_file = CACHE_DIR / f'related-{collection}.json'
+    CACHE_DIR.mkdir(exist_ok=True)
+    tmp_file = cache_file.with_name(f'.{cache_file.name}.{os.getpid()}.{threading.get_ident()}.tmp')
+    tmp_file.write_text(json.dumps(cache, separators=(',', ':')), encoding='utf-8')
+    os.replace(tmp_file, cache_file)
+
+
+def document_vectors(keys, metas, namespace, cache, changed):
+    """Return the vector of each document, vectorizing only the changed ones unless all are
+
+    Updates the features, vectors and document frequencies in cache.
+    """
+    if len(changed) == len(keys):
+        documents = [document_features(read_model(namespace, key) if key else None, meta)
+                     for key, meta in zip(keys, metas)]
+        frequency = document_frequency(documents)
+        vectors = [tfidf_vector(features, frequency, len(keys)) for features in documents]
+        cache['features'] = {key: sorted(features) for key, features in zip(keys, documents)}
+        cache['vectors'] = dict(zip(keys, vectors))
+        cache['frequency'] = frequency
+        return vectors
+
+    # Move the document frequencies from the documents that are gone to the new ones
+    frequency = cache['frequency']
+    live = set(keys)
+    for key in [key for key in cache['features'] if key not in live]:
+        for feature in cache['features'].pop(key):
+            frequency[feature] -= 1
+            if not frequency[feature]:
+                del frequency[feature]
+        cache['vectors'].pop(key, None)
+    documents = {}
+    for doc_id in changed:
+        key = keys[doc_id]
+        if key not in documents:
+            documents[key] = document_features(read_model(namespace, key) if key else None, metas[doc_id])
+            for feature in documents[key]:
+                frequency[feature] = frequency.get(feature, 0) + 1
+    for key, features in documents.items():
+        cache['features'][key] = sorted(features)
+        cache['vectors'][key] = tfidf_vector(features, frequency, len(keys))
+    return [cache['vectors'][key] for key in keys]
+
+
+def related_keys(keys, metas, slugs, namespace, cache):
+    """Return the related term map keys of each document, [[key, score], ...], scoring only what changed
+
+    keys are the term map keys of the documents (in namespace), metas their
+    meta and slugs their slugs. Documents marked active: false get a list but
+    are left out of the others'. Updates cache.
+    """
+    cached = cache['related']
+    positions = {key: doc_id for doc_id, key in enumerate(keys)}
+    listed = {doc_id for doc_id, meta in enumerate(metas) if meta.get('active') is not False}
+
+    changed = [doc_id for doc_id, key in enumerate(keys) if key not in cached or key not in cache['vectors']]
+    if len(changed) > FULL_RESCORE * len(keys):
+        changed = list(range(len(keys)))
+    vectors = document_vectors(keys, metas, namespace, cache, changed)
+    postings = inverted_index(vectors)
+
+    if len(changed) == len(keys):
+        targets = set(changed)
+    else:
+        # Lists that point at removed or changed documents, and lists a changed document now enters
+        targets = set(changed)
+        for doc_id, scores in similarity_rows(vectors, changed, postings).items():
+            if doc_id not in listed:
+                continue
+            for other, score in scores.items():
+                current = cached.get(keys[other])
+                if current is not None and (len(current) < RELATED_COUNT or score > current[-1][1]):
+                    targets.add(other)
+        for doc_id, key in enumerate(keys):
+            if key in cached and any(related not in positions for related, _ in cached[key]):
+                targets.add(doc_id)
+    print(f"✓ Scored related documents for {len(targets)} of {len(keys)} "
+          f"({'NumPy' if numpy is not None else 'pure Python'})")
+
+    rows = similarity_rows(vectors, sorted(targets), postings) if targets else {}
+    related = {}
+    for doc_id, key in enumerate(keys):
+        if doc_id in rows:
+            related[key] = [[keys[other], score] for other, score in top_related(rows[doc_id], listed, slugs)]
+        else:
+            related[key] = cached[key]
+
+    cache['related'] = related
+    return [related[key] for key in keys]
+
+
+def stage_related(collection, docs, keys, metas, namespace, outputs):
+    """Stage public/related/<collection>/<slug>.json for every document whose links changed
+
+    docs are the {slug, title, href} of the documents, keys the cache keys of
+    their term maps and metas their meta, all in the same order.
+    """
+    related_dir = RELATED_DIR / collection
+    by_key = {key: doc for doc, key in zip(docs, keys)}
+    slugs = [doc['slug'] for doc in docs]
+    cache = load_cache(collection)
+    written = cache['files']
+    files = {}
+    changed = False
+    for doc, related in zip(docs, related_keys(keys, metas, slugs, namespace, cache)):
+        links = [by_key[key] for key, _ in related if key in by_key]
+        related_file = related_dir / f"{doc['slug']}.json"
+        data = json.dumps(links, separators=(',', ':'))
+        files[related_file.name] = data
+        # Written by an earlier run and still on disk: nothing to compare
+        if written.get(related_file.name) == data and _has_size(related_file, len(data)):
+            continue
+        changed |= stage_output(outputs, related_file, data)
+
+    if related_dir.exists():
+        for related_file in related_dir.glob('*.json'):
+            if related_file.name not in files:
+                stage_removal(outputs, related_file)
+                changed = True
+
+    cache['files'] = files
+    save_cache(collection, cache)
+
+    if changed:
+        print(f"✓ Generated related links ({len(docs)} documents)")
+    else:
+        print("✓ Related links unchanged")
+
+
+def _has_size(path, size):
+    try:
+        return path.stat().st_size == size
+    except OSError:
+        return False
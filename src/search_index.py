@@ -0,0 +1,354 @@
+#!/usr/bin/env python3
+"""
+Search Index - Sharded full-text index of posts and projects
+Used by: buildblog.py, build_projects.py, build_watch.py
+
+Each post/project is reduced to a term map built from its meta (title,
+category, tags, technologies, excerpt/description) and the text of its
+headings, paragraphs and quotes: {term: [count, position, ...]}, where the
+positions count terms from the start of the document (the first
+MAX_POSITIONS are kept). Term maps are cached in .buildcache/models/
+<namespace>/, keyed by a hash of the markdown, so only changed documents are
+tokenized again.
+
+The generators merge the term maps into an inverted index under
+public/search/<collection>/: index.json lists the shards, each terms/<prefix>.json
+shard maps the terms starting with that prefix to their postings,
+[doc id, count, position, ...], and docs/<n>.json holds the {slug, title, href}
+of DOCS_PER_FILE documents from doc id n * DOCS_PER_FILE on. Shards start at one
+character and a shard larger than MAX_SHARD_BYTES is split by the next
+character (terms no longer than its prefix stay behind), so shards stay small
+as the corpus grows. A query loads index.json once, per query term the shard
+with the longest prefix of that term, and the docs files of the best matches
+(see components/shared/search.ts), so it reads a few kilobytes however many
+documents there are.
+
+The term map keys and shards of the last index are kept in
+.buildcache/search-<collection>.json. When the same documents are indexed
+again in the same order, only the shards holding a term of a changed document
+are read, updated and restaged; a change that would split, merge, add or drop
+a shard rebuilds the index from the term maps, so both ways give the same files.
+"""
+
+import html
+import json
+import os
+import re
+import threading
+import unicodedata
+from pathlib import Path
+
+from build_manifest import CACHE_DIR, content_digest
+from output_writer import stage_output, stage_removal
+from parse_cache import parser_version, read_model, write_model
+
+
+SEARCH_DIR = Path('../public/search')
+
+# Tokenization is part of the cached term maps; bump them when it changes
+SEARCH_VERSION = parser_version(__file__)
+
+MAX_SHARD_BYTES = 8 * 1024
+DOCS_PER_FILE = 64
+MIN_TERM_LENGTH = 2
+MAX_POSITIONS = 16
+
+# Meta fields indexed ahead of the content, in this order
+META_FIELDS = ['title', 'category', 'tags', 'technologies', 'excerpt', 'description']
+TEXT_BLOCKS = ['heading', 'subheading', 'heading3', 'paragraph', 'quote']
+
+STOP_WORDS = {
+    'an', 'and', 'are', 'as', 'at', 'be', 'but', 'by', 'for', 'from', 'has', 'have', 'if', 'in',
+    'into', 'is', 'it', 'its', 'of', 'on', 'or', 'so', 'that', 'the', 'their', 'then', 'there',
+    'these', 'this', 'to', 'was', 'we', 'were', 'which', 'will', 'with',
+}
+
+_TAG = re.compile(r'<[^>]+>')
+_TERM = re.compile(r'[a-z0-9]+')
+
+
+def text_terms(text):
+    """Split text (which may contain inline HTML) into index terms, in order"""
+    text = html.unescape(_TAG.sub(' ', text))
+    text = unicodedata.normalize('NFKD', text).encode('ascii', 'ignore').decode('ascii').lower()
+    return [term for term in _TERM.findall(text) if len(term) >= MIN_TERM_LENGTH and term not in STOP_WORDS]
+
+
+def start_terms():
+    """Return an empty term map accumulator"""
+    return {'terms': {}, 'position': 0}
+
+
+def add_text(acc, text):
+    """Add the terms of text to the accumulator at the next positions"""
+    terms = acc['terms']
+    for term in text_terms(text):
+        posting = terms.get(term)
+        if posting is None:
+            terms[term] = [1, acc['position']]
+        else:
+            posting[0] += 1
+            if len(posting) <= MAX_POSITIONS:
+                posting.append(acc['position'])
+        acc['position'] += 1
+
+
+def add_meta(acc, meta):
+    """Add the searchable meta fields of a post/project"""
+    for field in META_FIELDS:
+        value = meta.get(field)
+        if isinstance(value, list):
+            value = ' '.join(str(item) for item in value)
+        if value:
+            add_text(acc, str(value))
+
+
+def add_blocks(acc, blocks):
+    """Add the text of heading, paragraph and quote blocks"""
+    for block in blocks:
+        if block.get('type') in TEXT_BLOCKS:
+            add_text(acc, block.get('content') or '')
+
+
+def iter_search_terms(blocks, acc):
+    """Yield blocks, adding their text to the accumulator (for streaming mode)"""
+    for block in blocks:
+        add_blocks(acc, [block])
+        yield block
+
+
+def search_key(digest):
+    """Cache key of the term map of a document with this content digest"""
+    return content_digest(f'{SEARCH_VERSION}\n{digest}')
+
+
+def cached_terms(namespace, digest):
+    """Return the cache key of a document's term map if it is already cached, else None"""
+    key = search_key(digest)
+    return key if read_model(namespace, key) is not None else None
+
+
+def store_terms(namespace, digest, acc):
+    """Cache the term map of a document, returning its key"""
+    key = search_key(digest)
+    write_model(namespace, key, acc['terms'])
+    return key
+
+
+def document_terms(namespace, digest, blocks, meta):
+    """Return the cache key of a parsed document's term map, tokenizing it on a miss"""
+    key = cached_terms(namespace, digest)
+    if key:
+        return key
+    acc = start_terms()
+    add_meta(acc, meta)
+    add_blocks(acc, blocks)
+    return store_terms(namespace, digest, acc)
+
+
+def invert(term_maps):
+    """Invert a list of term maps (doc id = list position) into {term: postings}"""
+    postings = {}
+    for doc_id, terms in enumerate(term_maps):
+        for term, posting in terms.items():
+            postings.setdefault(term, []).append([doc_id, *posting])
+    return postings
+
+
+def shard_json(terms):
+    """Minified JSON of a shard, terms sorted"""
+    return json.dumps({term: terms[term] for term in sorted(terms)}, separators=(',', ':'))
+
+
+def split_shards(terms, prefix, shards):
+    """Add {prefix: shard JSON} for terms (all starting with prefix) to shards, splitting large ones"""
+    data = shard_json(terms)
+    if len(data) <= MAX_SHARD_BYTES or all(len(term) == len(prefix) for term in terms):
+        shards[prefix] = data
+        return
+
+    groups = {}
+    for term, posting in terms.items():
+        groups.setdefault(term[:len(prefix) + 1], {})[term] = posting
+    if prefix in groups:
+        shards[prefix] = shard_json(groups.pop(prefix))
+    for longer, group in groups.items():
+        split_shards(group, longer, shards)
+
+
+def build_shards(term_maps):
+    """Return {prefix: shard JSON} for a list of term maps"""
+    groups = {}
+    for term, posting in invert(term_maps).items():
+        groups.setdefault(term[0], {})[term] = posting
+    shards = {}
+    for prefix, terms in groups.items():
+        split_shards(terms, prefix, shards)
+    return shards
+
+
+def doc_files(docs):
+    """Return {file number: JSON} of the document table, DOCS_PER_FILE documents per file"""
+    return {
+        number: json.dumps(docs[start:start + DOCS_PER_FILE], separators=(',', ':'))
+        for number, start in enumerate(range(0, len(docs), DOCS_PER_FILE))
+    }
+
+
+def shard_prefix(term, prefixes):
+    """Return the prefix of the shard that holds term (its longest prefix in prefixes), or None"""
+    for length in range(len(term), 0, -1):
+        if term[:length] in prefixes:
+            return term[:length]
+    return None
+
+
+def merged_size(sizes):
+    """Size of the shard JSON of the terms of shards with these sizes together"""
+    return 1 + sum(size - 1 for size in sizes)
+
+
+def update_shards(search_dir, prefixes, changes):
+    """Apply changed documents to the shards on disk, returning {prefix: JSON} of the touched shards
+
+    changes are (doc id, old term map, new term map). Returns None if the
+    change alters the layout build_shards would choose (a shard would split,
+    merge, appear or vanish), which needs a full build.
+    """
+    prefixes = set(prefixes)
+    split = {prefix[:length] for prefix in prefixes for length in range(1, len(prefix))}
+    touched = {}
+    for doc_id, old, new in changes:
+        for term in set(old) | set(new):
+            prefix = shard_prefix(term, prefixes)
+            if prefix is None or (prefix in split and len(term) != len(prefix)):
+                return None
+            if prefix not in touched:
+                touched[prefix] = json.loads((search_dir / 'terms' / f'{prefix}.json').read_text(encoding='utf-8'))
+            terms = touched[prefix]
+            postings = [posting for posting in terms.get(term, []) if posting[0] != doc_id]
+            if term in new:
+                postings.append([doc_id, *new[term]])
+                postings.sort(key=lambda posting: posting[0])
+            if postings:
+                terms[term] = postings
+            else:
+                terms.pop(term, None)
+
+    shards = {}
+    for prefix, terms in touched.items():
+        if not terms:
+            return None
+        shards[prefix] = shard_json(terms)
+        if (prefix not in split and len(shards[prefix]) > MAX_SHARD_BYTES
+                and any(len(term) != len(prefix) for term in terms)):
+            return None
+
+    # Every split shard above a touched one must still be too large to merge
+    sizes = {}
+    for prefix in prefixes:
+        sizes[prefix] = len(shards[prefix]) if prefix in shards else (search_dir / 'terms' / f'{prefix}.json').stat().st_size
+    for parent in {parent for prefix in touched for parent in split if prefix.startswith(parent)}:
+        if merged_size(size for prefix, size in sizes.items() if prefix.startswith(parent)) <= MAX_SHARD_BYTES:
+            return None
+    return shards
+
+
+def build_id(keys):
+    """Short hash of the term map keys an index was built from"""
+    return content_digest('\n'.join(key or '' for key in keys))[:16]
+
+
+def load_state(collection):
+    """Load the keys, slugs and shards of the last index of a collection, or None"""
+    try:
+        return json.loads((CACHE_DIR / f'search-{collection}.json').read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return None
+
+
+def save_state(collection, state):
+    """Write the state atomically"""
+    state_file = CACHE_DIR / f'search-{collection}.json'
+    CACHE_DIR.mkdir(exist_ok=True)
+    tmp_file = state_file.with_name(f'.{state_file.name}.{os.getpid()}.{threading.get_ident()}.tmp')
+    tmp_file.write_text(json.dumps(state, separators=(',', ':')), encoding='utf-8')
+    os.replace(tmp_file, state_file)
+
+
+def incremental_shards(search_dir, state, slugs, keys, namespace):
+    """Return (shards to restage, all prefixes) updated from the last index, or None if it cannot be"""
+    if not state or state.get('version') != SEARCH_VERSION or state['slugs'] != slugs:
+        return None
+    try:
+        index = json.loads((search_dir / 'index.json').read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return None
+    if index.get('build') != state['build']:
+        return None
+
+    changes = []
+    for doc_id, (old_key, key) in enumerate(zip(state['keys'], keys)):
+        if old_key != key:
+            old = read_model(namespace, old_key) if old_key else {}
+            if old is None:
+                return None
+            changes.append((doc_id, old, read_model(namespace, key) or {} if key else {}))
+    try:
+        shards = update_shards(search_dir, state['shards'], changes)
+    except (OSError, ValueError):
+        return None
+    if shards is None:
+        return None
+    return shards, state['shards']
+
+
+def stage_search_index(collection, docs, keys, namespace, outputs):
+    """Stage the search index of a collection ('blog' or 'projects')
+
+    docs are the {slug, title, href} of the documents, keys the cache keys of
+    their term maps in the same order. Shards and docs files whose name no
+    longer occurs are staged for removal.
+    """
+    search_dir = SEARCH_DIR / collection
+    slugs = [doc['slug'] for doc in docs]
+    state = load_state(collection)
+    incremental = incremental_shards(search_dir, state, slugs, keys, namespace)
+    if incremental is None:
+        term_maps = [read_model(namespace, key) or {} if key else {} for key in keys]
+        shards = build_shards(term_maps)
+        prefixes = sorted(shards)
+    else:
+        shards, prefixes = incremental
+
+    index = {
+        'version': 2,
+        'build': build_id(keys),
+        'documents': len(docs),
+        'docsPerFile': DOCS_PER_FILE,
+        'shards': prefixes,
+    }
+    changed = stage_output(outputs, search_dir / 'index.json', json.dumps(index, separators=(',', ':')))
+    for prefix, data in shards.items():
+        changed |= stage_output(outputs, search_dir / 'terms' / f'{prefix}.json', data)
+    tables = doc_files(docs)
+    for number, data in tables.items():
+        changed |= stage_output(outputs, search_dir / 'docs' / f'{number}.json', data)
+
+    live = {'terms': {f'{prefix}.json' for prefix in prefixes}, 'docs': {f'{number}.json' for number in tables}}
+    for folder, names in live.items():
+        if (search_dir / folder).exists():
+            for stale_file in (search_dir / folder).glob('*.json'):
+                if stale_file.name not in names:
+                    stage_removal(outputs, stale_file)
+                    changed = True
+
+    save_state(collection, {'version': SEARCH_VERSION, 'build': index['build'], 'slugs': slugs,
+                            'keys': keys, 'shards': prefixes})
+
+    if not changed:
+        print("✓ Search index unchanged")
+    elif incremental is None:
+        print(f"✓ Generated search index ({len(docs)} documents, {len(prefixes)} shards)")
+    else:
+        print(f"✓ Updated search index ({len(docs)} documents, {len(shards)} of {len(prefixes)} shards)")
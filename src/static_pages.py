@@ -0,0 +1,300 @@
+#!/usr/bin/env python3
+"""
+Static Pages - Pre-rendered HTML of every post and project
+Used by: buildblog.py, build_projects.py (and build_watch.py through them)
+
+Posts and projects are client-rendered behind hash routes (#/blog/<slug>), so
+nothing is visible until the JS bundle has loaded and run. The generators also
+render each document's model (meta, toc and content blocks, whose text is
+already HTML) to a static page:
+    public/blog/<slug>/index.html       a post (external posts have none)
+    public/project/<slug>/index.html    a project
+Each page is complete on its own: title, description and Open Graph meta, the
+critical CSS inlined, and the header, table of contents and content inside
+#root, so it reads fine with JavaScript disabled and to crawlers.
+
+A small inline script then boots the app on top of it: it points the URL at
+the page's hash route, fetches the app's index.html and adds its stylesheets
+and module scripts. React replaces the pre-rendered shell when it mounts into
+#root; it is not hydrated, since the generated pages render client components
+(header, comments, related links) the shell does not contain.
+"""
+
+import html
+import re
+from pathlib import Path
+
+from output_writer import stage_file, stage_output, stage_removal, write_temporary
+
+
+STATIC_DIRS = {
+    'blog': Path('../public/blog'),
+    'projects': Path('../public/project'),
+}
+
+# Hash route of a document in the app, and the listing its back link goes to
+ROUTES = {
+    'blog': ('#/blog/{slug}', '#/blog', 'Back to Blog'),
+    'projects': ('#/project/{slug}', '#/projects', 'Back to Projects'),
+}
+
+APP_FILE = Path('../index.html')
+
+# Meta fields shown under the title, in order
+FACTS = {
+    'blog': ('category', 'date', 'readTime', 'author'),
+    'projects': ('category', 'date', 'company', 'location', 'duration'),
+}
+
+# Enough to read the page before the app's stylesheet arrives (classes are
+# prefixed so they cannot clash with the app's)
+CRITICAL_CSS = '''
+body{margin:0;background:#fff;color:#111;font:16px/1.7 ui-sans-serif,system-ui,-apple-system,"Segoe UI",sans-serif}
+.ssg-page{max-width:56rem;margin:0 auto;padding:2rem 1.5rem 4rem}
+.ssg-page a{color:inherit}
+.ssg-back,.ssg-facts,.ssg-tags,.ssg-toc,figcaption,.ssg-code-label{font:0.8rem/1.5 ui-monospace,SFMono-Regular,Menlo,monospace;color:#666}
+.ssg-page h1{font-size:2.5rem;line-height:1.2;margin:1.5rem 0 1rem}
+.ssg-page h2{font-size:1.9rem;line-height:1.3;border-left:4px solid #111;padding-left:1rem;margin-top:2.5rem}
+.ssg-page h3{font-size:1.5rem;line-height:1.3;border-left:2px solid #666;padding-left:1rem}
+.ssg-page h4{font-size:1.25rem}
+.ssg-facts span+span::before{content:" · "}
+.ssg-tags span{display:inline-block;border:1px solid #ccc;padding:0 .5rem;margin:0 .25rem .25rem 0}
+.ssg-lead{font-size:1.15rem;color:#444}
+.ssg-toc{border:2px solid #ddd;padding:1rem 1.5rem;margin:2rem 0}
+.ssg-toc ol{margin:0;padding-left:1.25rem}
+.ssg-page img,.ssg-page video{max-width:100%;height:auto}
+.ssg-page figure{margin:2rem 0;border:2px solid #ddd}
+.ssg-page figcaption{padding:.75rem 1rem;border-top:2px solid #ddd}
+.ssg-page blockquote{margin:2rem 0;border-left:4px solid #f97316;padding:1rem 1.5rem;background:#f5f5f5;font-style:italic}
+.ssg-code{margin:2rem 0;border:2px solid #ddd}
+.ssg-code-label{padding:.5rem 1rem;border-bottom:2px solid #ddd}
+.ssg-code pre{margin:0;padding:1.5rem;overflow-x:auto;background:#011627;color:#d6deeb;font-size:.85rem;line-height:1.6}
+.tok-comment{color:#637777;font-style:italic}.tok-string{color:#addb67}.tok-number{color:#f78c6c}
+.tok-keyword,.tok-operator{color:#7fdbca}.tok-function{color:#82aaff}.tok-punctuation{color:#c792ea}
+.tok-class-name{color:#ffcb8b}.tok-boolean{color:#ff5874}
+'''
+
+# Boots the app over the pre-rendered page: React renders into #root and the
+# route comes from the hash, so the app's assets are all that is missing
+BOOT_SCRIPT = '''(function () {
+  var route = document.documentElement.getAttribute('data-route');
+  if (!location.hash || location.hash.indexOf('#/') !== 0) {
+    history.replaceState(null, '', location.pathname + location.search + route);
+  }
+  // Section links scroll without replacing the route the app reads on mount
+  document.addEventListener('click', function (event) {
+    var link = event.target.closest && event.target.closest('.ssg-page a[href^="#"]');
+    var target = link && document.getElementById(link.getAttribute('href').slice(1));
+    if (target) {
+      event.preventDefault();
+      target.scrollIntoView({ behavior: 'smooth' });
+    }
+  });
+  fetch('/').then(function (response) { return response.text(); }).then(function (text) {
+    var app = new DOMParser().parseFromString(text, 'text/html');
+    app.querySelectorAll('link[rel="stylesheet"], link[rel="modulepreload"], script[type="module"]').forEach(function (node) {
+      var copy = document.createElement(node.tagName);
+      Array.prototype.forEach.call(node.attributes, function (attribute) {
+        copy.setAttribute(attribute.name, attribute.value);
+      });
+      copy.textContent = node.textContent;
+      document.head.appendChild(copy);
+    });
+  });
+})();'''
+
+
+def site_title(app_file=APP_FILE):
+    """The <title> of the app's index.html, used as the suffix of every page title"""
+    try:
+        match = re.search(r'<title>(.*?)</title>', app_file.read_text(encoding='utf-8'), re.S)
+    except OSError:
+        match = None
+    return html.unescape(match.group(1).strip()) if match else 'Portfolio'
+
+
+SITE_TITLE = site_title()
+
+
+def static_page_file(collection, slug):
+    """Path of the static page of a document"""
+    return STATIC_DIRS[collection] / slug / 'index.html'
+
+
+def _text(value):
+    return html.escape(str(value), quote=False)
+
+
+def _attribute(value):
+    return html.escape(str(value), quote=True)
+
+
+def _image(src, alt, width=None, height=None, srcset=None, sizes=None, loading='lazy'):
+    attributes = [f'src="{_attribute(src)}"', f'alt="{_attribute(alt)}"']
+    for name, value in (('srcset', srcset), ('sizes', sizes), ('width', width), ('height', height)):
+        if value:
+            attributes.append(f'{name}="{_attribute(value)}"')
+    attributes.append(f'loading="{loading}" decoding="async"')
+    return f"<img {' '.join(attributes)}>"
+
+
+def _code_html(block):
+    if block.get('tokens'):
+        lines = []
+        for line in block['tokens']:
+            lines.append(''.join(f'<span class="tok-{_attribute(token_type)}">{_text(text)}</span>'
+                                 if token_type else _text(text) for token_type, text in line))
+        code = '\n'.join(lines)
+    else:
+        code = _text(block['content'].strip())
+    return (f'<div class="ssg-code"><div class="ssg-code-label">{_text(block.get("language") or "code")}</div>'
+            f'<pre><code>{code}</code></pre></div>')
+
+
+def block_html(block):
+    """Render one content block as HTML, as BlogContent does (the block text is already HTML)"""
+    block_type = block['type']
+    content = block.get('content', '')
+    anchor = f' id="{_attribute(block["id"])}"' if block.get('id') else ''
+
+    if block_type == 'heading':
+        return f'<h2{anchor}>{content}</h2>'
+    if block_type == 'subheading':
+        return f'<h3{anchor}>{content}</h3>'
+    if block_type == 'heading3':
+        return f'<h4{anchor}>{content}</h4>'
+    if block_type == 'paragraph':
+        return f'<p>{content}</p>'
+    if block_type == 'quote':
+        author = f'<footer>— {_text(block["author"])}</footer>' if block.get('author') else ''
+        return f'<blockquote><p>{content}</p>{author}</blockquote>'
+    if block_type in ('image', 'gif'):
+        style = f' style="width:{_attribute(block["width"])};margin:2rem auto"' if block.get('width') else ''
+        caption = f'<figcaption>{_text(block["alt"])}</figcaption>' if block.get('alt') else ''
+        image = _image(content, block.get('alt') or 'Blog image', block.get('imageWidth'), block.get('imageHeight'),
+                       block.get('srcset'), block.get('sizes'))
+        return f'<figure{style}>{image}{caption}</figure>'
+    if block_type == 'video':
+        poster = f' poster="{_attribute(block["alt"])}"' if block.get('alt') else ''
+        return f'<figure><video src="{_attribute(content)}" controls{poster}></video></figure>'
+    if block_type == 'code':
+        return _code_html(block)
+    return ''
+
+
+def _toc_html(toc):
+    if not toc:
+        return ''
+    items = ''.join(f'<li><a href="#{_attribute(item["id"])}">{_text(item["title"])}</a></li>'
+                    for item in toc if item.get('id'))
+    return f'<nav class="ssg-toc" aria-label="Table of contents"><strong>Contents</strong><ol>{items}</ol></nav>'
+
+
+def _header_html(collection, meta):
+    facts = ''.join(f'<span>{_text(meta[field])}</span>' for field in FACTS[collection] if meta.get(field))
+    tags = ''.join(f'<span>{_text(tag)}</span>' for tag in (meta.get('technologies') or meta.get('tags') or []))
+    lead = meta.get('excerpt') or meta.get('description')
+    links = ''.join(f'<a href="{_attribute(meta[field])}" rel="noopener">{label}</a> '
+                    for field, label in (('github', 'GitHub'), ('demo', 'Live demo')) if meta.get(field))
+
+    parts = [f'<h1>{_text(meta.get("title", ""))}</h1>']
+    if facts:
+        parts.append(f'<p class="ssg-facts">{facts}</p>')
+    if lead:
+        parts.append(f'<p class="ssg-lead">{_text(lead)}</p>')
+    if tags:
+        parts.append(f'<p class="ssg-tags">{tags}</p>')
+    if links:
+        parts.append(f'<p>{links.strip()}</p>')
+    if meta.get('heroImage'):
+        hero = _image(meta['heroImage'], meta.get('title', ''), meta.get('heroWidth'), meta.get('heroHeight'),
+                      meta.get('heroSrcset'), meta.get('heroSizes'), loading='eager')
+        parts.append(f'<figure>{hero}</figure>')
+    return f"<header>{''.join(parts)}</header>"
+
+
+def iter_static_page(collection, slug, meta, toc, blocks):
+    """Yield the static page of a document in pieces; blocks may be a generator (--stream)"""
+    route, back_href, back_label = ROUTES[collection]
+    route = route.format(slug=slug)
+    title = meta.get('title') or slug
+    description = meta.get('excerpt') or meta.get('description') or f"{title} - {', '.join((meta.get('tags') or [])[:3])}"
+
+    head = [
+        '<!DOCTYPE html>',
+        f'<html lang="en" data-route="{_attribute(route)}">',
+        '<head>',
+        '<meta charset="UTF-8">',
+        '<meta name="viewport" content="width=device-width, initial-scale=1.0">',
+        f'<title>{_text(title)} - {_text(SITE_TITLE)}</title>',
+        f'<meta name="description" content="{_attribute(description)}">',
+        f'<meta property="og:title" content="{_attribute(title)}">',
+        f'<meta property="og:description" content="{_attribute(description)}">',
+        f'<meta property="og:type" content="{"article" if collection == "blog" else "website"}">',
+    ]
+    if meta.get('heroImage'):
+        head.append(f'<meta property="og:image" content="{_attribute(meta["heroImage"])}">')
+    head += [
+        '<link rel="icon" type="image/png" href="/favicon.png">',
+        f'<style>{CRITICAL_CSS.strip()}</style>',
+        '</head>',
+        '<body>',
+        '<div id="root">',
+        f'<main class="ssg-page" data-ssg-route="{_attribute(route)}">',
+        f'<a class="ssg-back" href="/{back_href}">← {back_label}</a>',
+        _header_html(collection, meta),
+        _toc_html(toc),
+        '<article>',
+    ]
+    yield '\n'.join(head) + '\n'
+
+    for block in blocks:
+        rendered = block_html(block)
+        if rendered:
+            yield rendered + '\n'
+
+    yield '\n'.join([
+        '</article>',
+        '</main>',
+        '</div>',
+        f'<script>{BOOT_SCRIPT}</script>',
+        '</body>',
+        '</html>',
+    ]) + '\n'
+
+
+def render_static_page(collection, slug, meta, toc, blocks):
+    """Return the static page of a document"""
+    return ''.join(iter_static_page(collection, slug, meta, toc, blocks))
+
+
+def write_static_page(collection, slug, meta, toc, blocks):
+    """Write the static page of a streamed document to a temporary file for stage_file"""
+    return write_temporary(static_page_file(collection, slug), iter_static_page(collection, slug, meta, toc, blocks))
+
+
+def stage_static_page(outputs, result):
+    """Stage the static page of a worker result ('static_file' with 'static_html' or 'static_temp')"""
+    if not result.get('static_file'):
+        return False
+    if result.get('static_temp'):
+        return stage_file(outputs, result['static_file'], result['static_temp'])
+    return stage_output(outputs, result['static_file'], result['static_html'])
+
+
+def prune_static_pages(collection, slugs, outputs):
+    """Stage the static pages of documents that are gone (or now external) for removal
+
+    The directories of pages removed by an earlier run are deleted once empty.
+    """
+    static_dir = STATIC_DIRS[collection]
+    if not static_dir.exists():
+        return
+    live = set(slugs)
+    for page_dir in static_dir.iterdir():
+        if not page_dir.is_dir() or page_dir.name in live:
+            continue
+        if (page_dir / 'index.html').exists():
+            stage_removal(outputs, page_dir / 'index.html')
+        elif not any(page_dir.iterdir()):
+            page_dir.rmdir()
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Stream Build - Bounded-memory parsing and rendering for very large documents
+Used by: buildblog.py, build_projects.py
+
+The parsers in buildblog.py and build_projects.py read lines from an iterator
+and yield ('meta', key, value), ('toc', item) and ('block', block) events as
+soon as each piece is complete. For normal documents the events are collected
+into the usual {'meta', 'toc', 'content_blocks'} dict. Documents over
+STREAM_THRESHOLD (or every document with --stream) never exist in memory as a
+whole: lines are read straight from the file, blocks are spilled to a
+temporary file as they are parsed, and the page is written out in pieces, so
+peak memory is bounded by the largest single block instead of the document.
+"""
+
+import json
+import tempfile
+
+
+# Documents larger than this are parsed and rendered in streaming mode
+STREAM_THRESHOLD = 8 * 1024 * 1024
+
+# Where the content blocks go in a page rendered with an empty block list
+CONTENT_BLOCKS_MARKER = 'const contentBlocks: BlogContentBlock[] = []'
+
+
+def should_stream(path, stream=False):
+    """True if path should be built in streaming mode"""
+    return stream or path.stat().st_size > STREAM_THRESHOLD
+
+
+def split_lines(lines):
+    """Yield lines without their newline, exactly like str.split('\\n') would
+
+    lines may come from an open file (newline kept) or from a list of strings.
+    """
+    trailing_empty = True
+    for line in lines:
+        if line.endswith('\n'):
+            yield line[:-1]
+            trailing_empty = True
+        else:
+            yield line
+            trailing_empty = False
+    if trailing_empty:
+        yield ''
+
+
+def read_lines(path, digest):
+    """Yield the lines of a UTF-8 text file, feeding them to a hashlib digest
+
+    The digest ends up equal to content_digest(path.read_text()).
+    """
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            digest.update(line.encode('utf-8'))
+            yield line
+
+
+def collect_document(events):
+    """Collect parser events into a {'meta', 'toc', 'content_blocks'} dict"""
+    document = {
+        'meta': {},
+        'toc': [],
+        'content_blocks': []
+    }
+    for event in events:
+        if event[0] == 'meta':
+            document['meta'][event[1]] = event[2]
+        elif event[0] == 'toc':
+            document['toc'].append(event[1])
+        else:
+            document['content_blocks'].append(event[1])
+    return document
+
+
+def spill_document(events):
+    """Collect meta and toc in memory and spill content blocks to a temporary file
+
+    Returns (meta, toc, spill); read the blocks back with iter_spilled(spill)
+    and close spill when done.
+    """
+    meta = {}
+    toc = []
+    spill = tempfile.TemporaryFile('w+', encoding='utf-8')
+    try:
+        for event in events:
+            if event[0] == 'meta':
+                meta[event[1]] = event[2]
+            elif event[0] == 'toc':
+                toc.append(event[1])
+            else:
+                spill.write(json.dumps(event[1]))
+                spill.write('\n')
+    except BaseException:
+        spill.close()
+        raise
+    return meta, toc, spill
+
+
+def iter_spilled(spill):
+    """Yield the content blocks written by spill_document, in order"""
+    spill.seek(0)
+    for line in spill:
+        yield json.loads(line)
+
+
+def iter_json_array(items, indent):
+    """Yield json.dumps(list(items), indent=indent) in pieces, one item at a time
+
+    indent None gives the minified form used by --compact.
+    """
+    if indent is None:
+        first = True
+        for item in items:
+            yield ('[' if first else ',') + json.dumps(item, separators=(',', ':'))
+            first = False
+        yield '[]' if first else ']'
+        return
+
+    pad = ' ' * indent
+    first = True
+    for item in items:
+        yield ('[\n' if first else ',\n') + pad + json.dumps(item, indent=indent).replace('\n', '\n' + pad)
+        first = False
+    yield '[]' if first else '\n]'
+
+
+def stream_page(page, blocks, indent):
+    """Yield a page rendered with no content blocks, with blocks streamed into it
+
+    indent None streams minified blocks into a page rendered with --compact.
+    """
+    head, tail = page.split(CONTENT_BLOCKS_MARKER, 1)
+    yield head + CONTENT_BLOCKS_MARKER[:-2]
+    yield from iter_json_array(blocks, indent)
+    yield tail
@@ -0,0 +1,19 @@
+"""Shared fixtures for the generator tests (run with: cd src && python -m pytest tests)"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+SRC_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(SRC_DIR))
+
+
+@pytest.fixture
+def workdir(tmp_path, monkeypatch):
+    """Run the test from an empty src/ directory with a sibling public/, like the generators"""
+    src = tmp_path / 'src'
+    src.mkdir()
+    (tmp_path / 'public').mkdir()
+    monkeypatch.chdir(src)
+    return src
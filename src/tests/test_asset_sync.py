@@ -0,0 +1,83 @@
+"""Asset sync publishes referenced assets and deletes only the files it owns"""
+
+import json
+import os
+from pathlib import Path
+
+from build_manifest import CACHE_DIR
+from asset_sync import SYNC_MANIFEST, sync_assets, sync_tree
+
+SOURCE = Path('assets/blogs')
+TARGET = Path('../public/blogs')
+
+
+def write(path, data=b'image'):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+    return path
+
+
+def record_references(*paths):
+    """Write build manifests whose documents reference these asset files"""
+    CACHE_DIR.mkdir(exist_ok=True)
+    for name, references in (('blog', [str(path) for path in paths]), ('projects', [])):
+        entry = {'references': references, 'variants': []}
+        manifest = {'entries': {f'{name}.md': entry}}
+        (CACHE_DIR / f'{name}-manifest.json').write_text(json.dumps(manifest), encoding='utf-8')
+
+
+def test_unowned_files_are_kept(workdir):
+    write(SOURCE / 'post' / 'a.png')
+    committed = write(TARGET / 'committed.png')
+    committed_other = write(TARGET / 'post' / 'notes.txt')
+
+    sync_tree(SOURCE, TARGET)
+
+    assert (TARGET / 'post' / 'a.png').read_bytes() == b'image'
+    assert committed.exists() and committed_other.exists()
+
+
+def test_unreferenced_mirror_is_removed(workdir):
+    used = write(SOURCE / 'post' / 'used.png')
+    unused = write(SOURCE / 'old' / 'unused.png')
+    sync_tree(SOURCE, TARGET)
+    assert (TARGET / 'old' / 'unused.png').exists()
+
+    stats = sync_tree(SOURCE, TARGET, files=[used])
+
+    assert stats['removed'] == 1
+    assert unused.exists()
+    assert not (TARGET / 'old').exists()
+    assert (TARGET / 'post' / 'used.png').exists()
+
+
+def test_deleted_source_is_removed_only_if_published_before(workdir):
+    kept = write(SOURCE / 'a.png')
+    gone = write(SOURCE / 'b.png')
+    record_references(kept, gone)
+    sync_assets()
+    assert SYNC_MANIFEST.exists()
+
+    gone.unlink()
+    unrelated = write(TARGET / 'c.png')
+    record_references(kept)
+    sync_assets()
+
+    assert not (TARGET / 'b.png').exists()
+    assert unrelated.exists()
+    assert (TARGET / 'a.png').exists()
+
+
+def test_unchanged_files_are_skipped_and_copies_are_not_links(workdir):
+    source = write(SOURCE / 'a.png')
+    sync_tree(SOURCE, TARGET)
+    target = TARGET / 'a.png'
+    assert not os.path.samefile(source, target)
+
+    stats = sync_tree(SOURCE, TARGET)
+    assert (stats['copied'], stats['skipped']) == (0, 1)
+
+    write(source, b'edited')
+    stats = sync_tree(SOURCE, TARGET)
+    assert stats['copied'] == 1
+    assert target.read_bytes() == b'edited'
@@ -0,0 +1,78 @@
+"""Invalidation rules of the build manifest"""
+
+import os
+from pathlib import Path
+
+from build_manifest import (content_digest, load_manifest, lookup, record, removed_outputs,
+                            save_manifest)
+
+
+def build(manifest, source, output):
+    """Record source as built into output, like a generator does"""
+    content = source.read_text(encoding='utf-8')
+    output.write_text(content.upper(), encoding='utf-8')
+    record(manifest, source, content_digest(content), source.stat(), [output], index_entry={'slug': source.stem})
+
+
+def built(workdir):
+    source = Path('post.md')
+    output = Path('PostPage.tsx')
+    source.write_text('# Post\n', encoding='utf-8')
+    manifest = load_manifest('test', 'v1')
+    build(manifest, source, output)
+    save_manifest(manifest, [source])
+    return source, output
+
+
+def test_unchanged_source_is_skipped(workdir):
+    source, _ = built(workdir)
+    entry = lookup(load_manifest('test', 'v1'), source)
+    assert entry['index_entry'] == {'slug': 'post'}
+
+
+def test_edited_source_is_rebuilt(workdir):
+    source, _ = built(workdir)
+    source.write_text('# Edited post\n', encoding='utf-8')
+    assert lookup(load_manifest('test', 'v1'), source) is None
+
+
+def test_touched_source_with_same_content_is_skipped(workdir):
+    source, _ = built(workdir)
+    stat = source.stat()
+    os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+    manifest = load_manifest('test', 'v1')
+    entry = lookup(manifest, source)
+    assert entry is not None
+    assert entry['mtime_ns'] == source.stat().st_mtime_ns
+
+
+def test_changed_output_is_rebuilt(workdir):
+    source, output = built(workdir)
+    output.write_text('edited by hand', encoding='utf-8')
+    assert lookup(load_manifest('test', 'v1'), source) is None
+
+
+def test_deleted_output_is_rebuilt(workdir):
+    source, output = built(workdir)
+    output.unlink()
+    assert lookup(load_manifest('test', 'v1'), source) is None
+
+
+def test_new_version_or_force_starts_fresh(workdir):
+    source, _ = built(workdir)
+    assert load_manifest('test', 'v2')['entries'] == {}
+    assert load_manifest('test', 'v1', force=True)['entries'] == {}
+    assert lookup(load_manifest('test', 'v1'), source) is not None
+
+
+def test_deleted_source_is_dropped_with_its_outputs(workdir):
+    source, output = built(workdir)
+    other = Path('other.md')
+    other.write_text('# Other\n', encoding='utf-8')
+    manifest = load_manifest('test', 'v1')
+    build(manifest, other, Path('OtherPage.tsx'))
+
+    assert removed_outputs(manifest, [source, other]) == []
+    assert removed_outputs(manifest, [other]) == [output]
+    assert save_manifest(manifest, [other]) == [str(source)]
+    assert str(source) not in load_manifest('test', 'v1')['entries']
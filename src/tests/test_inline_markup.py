@@ -0,0 +1,98 @@
+"""render_inline against the chain of re.sub passes it replaced"""
+
+import re
+
+import pytest
+
+from conftest import SRC_DIR
+from inline_markup import render_inline
+
+
+def legacy_styled_text(text):
+    """parse_styled_text of buildblog.py before the single-pass renderer"""
+    if not text:
+        return text
+
+    text = re.sub(r'\*\*(.*?)\*\*', r"<strong>\1</strong>", text)
+    text = re.sub(r'(?<!\*)\*([^\*]+?)\*(?!\*)', r"<em>\1</em>", text)
+    text = re.sub(
+        r'\[dev\]\(([^)]+)\)',
+        lambda m: f"<a href='#/development?demo={m.group(1)}' style='color: #ff6b3d; text-decoration: underline;'>View Resource</a>",
+        text
+    )
+
+    link_placeholder_map = {}
+    link_counter = [0]
+
+    def protect_link(match):
+        link_counter[0] += 1
+        placeholder = f"LINKPLACEHOLDER{link_counter[0]}"
+        link_placeholder_map[placeholder] = match.group(0)
+        return placeholder
+
+    text = re.sub(r'\[([^\]]+)\]\(([^)]+)\)', protect_link, text)
+    text = re.sub(r'(?<!_)_([^_]+?)_(?!_)', r"<em>\1</em>", text)
+
+    for placeholder, original_link in link_placeholder_map.items():
+        link_match = re.match(r'\[([^\]]+)\]\(([^)]+)\)', original_link)
+        if link_match:
+            link_text = link_match.group(1)
+            link_url = link_match.group(2)
+            html_link = f"<a href='{link_url}' target='_blank' rel='noopener noreferrer' style='color: #ff6b3d; text-decoration: underline;'>{link_text}</a>"
+            text = text.replace(placeholder, html_link)
+
+    text = re.sub(r'\[orange\]\((.*?)\)', r"<span style='color: #ff6b3d;'>\1</span>", text)
+    text = re.sub(r'\[comment\]\((.*?)\)', r"<span className='font-mono text-muted-foreground text-sm'>// \1</span>", text)
+    text = re.sub(r'\[link\]\((.*?)\)', r"<a href='\1' target='_blank' rel='noopener noreferrer' style='text-decoration: underline;'>\1</a>", text)
+    text = re.sub(r'\[orange-link\]\((.*?)\)', r"<a href='\1' target='_blank' rel='noopener noreferrer' style='color: #ff6b3d; text-decoration: underline;'>\1</a>", text)
+
+    return text
+
+
+CASES = [
+    '',
+    'Plain text without any markup.',
+    'Some **bold** and *italic* and _underscored_ words.',
+    '**bold with *nested* italic** after',
+    'A snake_case_name and __init__ stay as they are.',
+    'Unclosed **bold and *italic and _underscore',
+    'See [the docs](https://example.com/some_path_with_underscores) for more.',
+    'Two links: [one](https://a.example/x_y) and [two](https://b.example/z_w).',
+    '[dev](https://github.com/example/repo) routes through the dev page.',
+    '[orange](highlighted) [comment](a note) [link](https://example.com) [orange-link](https://example.com)',
+    'A [comment](note with _underscores_) inside a tag.',
+    '**[bold link](https://example.com)** and _[italic link](https://example.com)_',
+    'Brackets [without] a url and (parens) alone.',
+    'Stars * on their own * and a lone _ underscore.',
+    '<strong>Inline HTML</strong> passes through *untouched*.',
+]
+
+
+def content_lines():
+    """Every line of the markdown shipped in assets/"""
+    lines = []
+    for md_file in sorted((SRC_DIR / 'assets').rglob('*.md')):
+        lines.extend(md_file.read_text(encoding='utf-8').split('\n'))
+    return lines
+
+
+@pytest.mark.parametrize('text', CASES)
+def test_matches_legacy_output(text):
+    assert render_inline(text) == legacy_styled_text(text)
+
+
+def test_matches_legacy_output_on_content():
+    mismatched = [line for line in content_lines() if render_inline(line) != legacy_styled_text(line)]
+    assert mismatched == []
+
+
+def test_emphasis_does_not_cross_tags():
+    # The old chain produced '<em>a <strong>b</em> c</strong>'
+    assert render_inline('_a **b_ c**') != legacy_styled_text('_a **b_ c**')
+    assert '<em>a <strong>b</em>' not in render_inline('_a **b_ c**')
+
+
+def test_star_in_url_stays_in_href():
+    html = render_inline('[x](https://example.com/*a*)')
+    assert "href='https://example.com/*a*'" in html
+    assert '<em>' not in html
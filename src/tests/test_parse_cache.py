@@ -0,0 +1,55 @@
+"""Hits, misses and eviction of the parse cache"""
+
+from parse_cache import MODEL_DIR, evict_models, load_model, parser_version
+
+
+def parse(content):
+    parse.calls += 1
+    return {'lines': content.split('\n')}
+
+
+parse.calls = 0
+
+
+def test_same_content_and_version_is_a_hit(workdir):
+    calls = parse.calls
+    model, key, cached = load_model('test', 'a\nb', 'v1', parse)
+    assert not cached
+    again, again_key, cached = load_model('test', 'a\nb', 'v1', parse)
+    assert cached
+    assert (again, again_key) == (model, key)
+    assert parse.calls == calls + 1
+
+
+def test_changed_content_or_version_is_a_miss(workdir):
+    _, key, _ = load_model('test', 'a', 'v1', parse)
+    _, edited_key, cached = load_model('test', 'b', 'v1', parse)
+    assert not cached and edited_key != key
+    _, versioned_key, cached = load_model('test', 'a', 'v2', parse)
+    assert not cached and versioned_key != key
+
+
+def test_cached_model_is_not_changed_by_the_caller(workdir):
+    model, _, _ = load_model('test', 'a', 'v1', parse)
+    model['lines'].append('added after parsing')
+    cached, _, _ = load_model('test', 'a', 'v1', parse)
+    assert cached == {'lines': ['a']}
+
+
+def test_parser_version_follows_the_parser_source(tmp_path):
+    helper = tmp_path / 'helper.py'
+    helper.write_text('VALUE = 1\n', encoding='utf-8')
+    before = parser_version(parse, helper)
+    assert parser_version(parse, helper) == before
+    helper.write_text('VALUE = 2\n', encoding='utf-8')
+    assert parser_version(parse, helper) != before
+
+
+def test_evict_keeps_only_recorded_models(workdir):
+    _, kept, _ = load_model('test', 'kept', 'v1', parse)
+    _, dropped, _ = load_model('test', 'dropped', 'v1', parse)
+    _, other_field, _ = load_model('test', 'other field', 'v1', parse)
+    manifest = {'entries': {'a.md': {'model': kept}, 'b.md': {'search': [other_field]}}}
+
+    assert evict_models('test', manifest) == 2
+    assert {path.stem for path in (MODEL_DIR / 'test').glob('*.json')} == {kept}
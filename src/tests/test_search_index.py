@@ -0,0 +1,102 @@
+"""Incremental search index updates against a full rebuild"""
+
+import random
+
+import pytest
+
+from build_manifest import CACHE_DIR, content_digest
+from output_writer import start_outputs, commit_outputs
+import search_index
+from search_index import SEARCH_DIR, document_terms, stage_search_index
+
+WORDS = [f'{a}{b}' for a in 'abcdefghijklmnopqrstuvwxyz' for b in ('ab', 'ode', 'uild', 'ompile', 'ast')]
+
+
+def make_corpus(rng, count):
+    return {f'post-{i}': ' '.join(rng.choice(WORDS) for _ in range(rng.randint(5, 60))) for i in range(count)}
+
+
+def index_corpus(corpus):
+    """Term map the corpus and stage its search index, as the generators do"""
+    docs = [{'slug': slug, 'title': slug, 'href': f'#/blog/{slug}'} for slug in corpus]
+    keys = [
+        document_terms('test-search', content_digest(text), [{'type': 'paragraph', 'content': text}],
+                       {'title': slug})
+        for slug, text in corpus.items()
+    ]
+    outputs = start_outputs()
+    stage_search_index('blog', docs, keys, 'test-search', outputs)
+    commit_outputs(outputs)
+
+
+def index_files():
+    """{relative path: content} of every file of the blog search index"""
+    search_dir = SEARCH_DIR / 'blog'
+    return {path.relative_to(search_dir).as_posix(): path.read_bytes() for path in search_dir.rglob('*.json')}
+
+
+def full_build(corpus):
+    """Index the corpus from scratch, without the state of the last index"""
+    (CACHE_DIR / 'search-blog.json').unlink(missing_ok=True)
+    for path in (SEARCH_DIR / 'blog').rglob('*.json'):
+        path.unlink()
+    index_corpus(corpus)
+    return index_files()
+
+
+@pytest.fixture
+def small_shards(monkeypatch):
+    # Small shards so a few hundred documents split them several levels deep
+    monkeypatch.setattr(search_index, 'MAX_SHARD_BYTES', 1024)
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_incremental_update_matches_full_build(workdir, small_shards, capsys, seed):
+    rng = random.Random(seed)
+    corpus = make_corpus(rng, 300)
+    index_corpus(corpus)
+
+    for _ in range(4):
+        for slug in rng.sample(sorted(corpus), rng.randint(1, 5)):
+            words = corpus[slug].split()
+            words[rng.randrange(len(words))] = rng.choice(WORDS)
+            corpus[slug] = ' '.join(words)
+        capsys.readouterr()
+        index_corpus(corpus)
+        incremental = index_files()
+        updated = 'Updated search index' in capsys.readouterr().out
+
+        assert incremental == full_build(corpus)
+        # The same layout was reused at least once across the rounds
+        if updated:
+            return
+    pytest.fail('every round fell back to a full rebuild')
+
+
+def test_added_document_rebuilds_the_index(workdir, small_shards, capsys):
+    corpus = make_corpus(random.Random(7), 100)
+    index_corpus(corpus)
+    corpus['post-new'] = 'freshly added words'
+    capsys.readouterr()
+    index_corpus(corpus)
+    assert 'Generated search index' in capsys.readouterr().out
+    assert index_files() == full_build(corpus)
+
+
+def test_removed_document_leaves_no_stale_files(workdir, small_shards):
+    corpus = make_corpus(random.Random(3), 200)
+    index_corpus(corpus)
+    for slug in list(corpus)[64:]:
+        del corpus[slug]
+    index_corpus(corpus)
+    files = index_files()
+    assert sorted(name for name in files if name.startswith('docs')) == ['docs/0.json']
+    assert files == full_build(corpus)
+
+
+def test_unchanged_corpus_writes_nothing(workdir, capsys):
+    corpus = make_corpus(random.Random(1), 50)
+    index_corpus(corpus)
+    capsys.readouterr()
+    index_corpus(corpus)
+    assert 'Search index unchanged' in capsys.readouterr().out